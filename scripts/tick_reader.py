@@ -42,30 +42,93 @@ Notes on Algebra bitmap indexing (Integral):
 """
 
 import argparse
+from array import array
+from collections.abc import Sequence
+import asyncio
+import functools
+import heapq
 import json
+import operator
 import sys
-import math
 import os
+import sqlite3
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import requests
+from eth_abi import decode as abi_decode
+from eth_abi import encode as abi_encode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+
 
 DEFAULT_RPC = "https://polygon-rpc.com"
 DEFAULT_POOL = "0x471d34c1973e8312154d80a3955a5b597b6a1e1b"  # WMATIC/USDC Algebra pool (Polygon)
 
-# Contract ABI (Algebra pool)
-ABI = json.loads(
-    """
+# Full Algebra pool ABI, parsed only when --full-abi is requested
+_FULL_ABI_JSON = """
     [{"inputs":[],"stateMutability":"nonpayable","type":"constructor"},{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"owner","type":"address"},{"indexed":true,"internalType":"int24","name":"bottomTick","type":"int24"},{"indexed":true,"internalType":"int24","name":"topTick","type":"int24"},{"indexed":false,"internalType":"uint128","name":"liquidityAmount","type":"uint128"},{"indexed":false,"internalType":"uint256","name":"amount0","type":"uint256"},{"indexed":false,"internalType":"uint256","name":"amount1","type":"uint256"}],"name":"Burn","type":"event"},{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"owner","type":"address"},{"indexed":false,"internalType":"address","name":"recipient","type":"address"},{"indexed":true,"internalType":"int24","name":"bottomTick","type":"int24"},{"indexed":true,"internalType":"int24","name":"topTick","type":"int24"},{"indexed":false,"internalType":"uint128","name":"amount0","type":"uint128"},{"indexed":false,"internalType":"uint128","name":"amount1","type":"uint128"}],"name":"Collect","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"uint8","name":"communityFee0New","type":"uint8"},{"indexed":false,"internalType":"uint8","name":"communityFee1New","type":"uint8"}],"name":"CommunityFee","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"uint16","name":"fee","type":"uint16"}],"name":"Fee","type":"event"},{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"sender","type":"address"},{"indexed":true,"internalType":"address","name":"recipient","type":"address"},{"indexed":false,"internalType":"uint256","name":"amount0","type":"uint256"},{"indexed":false,"internalType":"uint256","name":"amount1","type":"uint256"},{"indexed":false,"internalType":"uint256","name":"paid0","type":"uint256"},{"indexed":false,"internalType":"uint256","name":"paid1","type":"uint256"}],"name":"Flash","type":"event"},{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"virtualPoolAddress","type":"address"}],"name":"Incentive","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"uint160","name":"price","type":"uint160"},{"indexed":false,"internalType":"int24","name":"tick","type":"int24"}],"name":"Initialize","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"uint32","name":"liquidityCooldown","type":"uint32"}],"name":"LiquidityCooldown","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"address","name":"sender","type":"address"},{"indexed":true,"internalType":"address","name":"owner","type":"address"},{"indexed":true,"internalType":"int24","name":"bottomTick","type":"int24"},{"indexed":true,"internalType":"int24","name":"topTick","type":"int24"},{"indexed":false,"internalType":"uint128","name":"liquidityAmount","type":"uint128"},{"indexed":false,"internalType":"uint256","name":"amount0","type":"uint256"},{"indexed":false,"internalType":"uint256","name":"amount1","type":"uint256"}],"name":"Mint","type":"event"},{"anonymous":false,"inputs":[{"indexed":true,"internalType":"address","name":"sender","type":"address"},{"indexed":true,"internalType":"address","name":"recipient","type":"address"},{"indexed":false,"internalType":"int256","name":"amount0","type":"int256"},{"indexed":false,"internalType":"int256","name":"amount1","type":"int256"},{"indexed":false,"internalType":"uint160","name":"price","type":"uint160"},{"indexed":false,"internalType":"uint128","name":"liquidity","type":"uint128"},{"indexed":false,"internalType":"int24","name":"tick","type":"int24"}],"name":"Swap","type":"event"},{"anonymous":false,"inputs":[{"indexed":false,"internalType":"int24","name":"newTickSpacing","type":"int24"}],"name":"TickSpacing","type":"event"},{"inputs":[],"name":"activeIncentive","outputs":[{"internalType":"address","name":"","type":"address"}],"stateMutability":"view","type":"function"},{"inputs":[{"internalType":"int24","name":"bottomTick","type":"int24"},{"internalType":"int24","name":"topTick","type":"int24"},{"internalType":"uint128","name":"amount","type":"uint128"}],"name":"burn","outputs":[{"internalType":"uint256","name":"amount0","type":"uint256"},{"internalType":"uint256","name":"amount1","type":"uint256"}],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"recipient","type":"address"},{"internalType":"int24","name":"bottomTick","type":"int24"},{"internalType":"int24","name":"topTick","type":"int24"},{"internalType":"uint128","name":"amount0Requested","type":"uint128"},{"internalType":"uint128","name":"amount1Requested","type":"uint128"}],"name":"collect","outputs":[{"internalType":"uint128","name":"amount0","type":"uint128"},{"internalType":"uint128","name":"amount1","type":"uint128"}],"stateMutability":"nonpayable","type":"function"},{"inputs":[],"name":"dataStorageOperator","outputs":[{"internalType":"address","name":"","type":"address"}],"stateMutability":"view","type":"function"},{"inputs":[],"name":"factory","outputs":[{"internalType":"address","name":"","type":"address"}],"stateMutability":"view","type":"function"},{"inputs":[{"internalType":"address","name":"recipient","type":"address"},{"internalType":"uint256","name":"amount0","type":"uint256"},{"internalType":"uint256","name":"amount1","type":"uint256"},{"internalType":"bytes","name":"data","type":"bytes"}],"name":"flash","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"int24","name":"bottomTick","type":"int24"},{"internalType":"int24","name":"topTick","type":"int24"}],"name":"getInnerCumulatives","outputs":[{"internalType":"int56","name":"innerTickCumulative","type":"int56"},{"internalType":"uint160","name":"innerSecondsSpentPerLiquidity","type":"uint160"},{"internalType":"uint32","name":"innerSecondsSpent","type":"uint32"}],"stateMutability":"view","type":"function"},{"inputs":[{"internalType":"uint32[]","name":"secondsAgos","type":"uint32[]"}],"name":"getTimepoints","outputs":[{"internalType":"int56[]","name":"tickCumulatives","type":"int56[]"},{"internalType":"uint160[]","name":"secondsPerLiquidityCumulatives","type":"uint160[]"},{"internalType":"uint112[]","name":"volatilityCumulatives","type":"uint112[]"},{"internalType":"uint256[]","name":"volumePerAvgLiquiditys","type":"uint256[]"}],"stateMutability":"view","type":"function"},{"inputs":[],"name":"globalState","outputs":[{"internalType":"uint160","name":"price","type":"uint160"},{"internalType":"int24","name":"tick","type":"int24"},{"internalType":"uint16","name":"fee","type":"uint16"},{"internalType":"uint16","name":"timepointIndex","type":"uint16"},{"internalType":"uint8","name":"communityFeeToken0","type":"uint8"},{"internalType":"uint8","name":"communityFeeToken1","type":"uint8"},{"internalType":"bool","name":"unlocked","type":"bool"}],"stateMutability":"view","type":"function"},{"inputs":[{"internalType":"uint160","name":"initialPrice","type":"uint160"}],"name":"initialize","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[],"name":"liquidity","outputs":[{"internalType":"uint128","name":"","type":"uint128"}],"stateMutability":"view","type":"function"},{"inputs":[],"name":"liquidityCooldown","outputs":[{"internalType":"uint32","name":"","type":"uint32"}],"stateMutability":"view","type":"function"},{"inputs":[],"name":"maxLiquidityPerTick","outputs":[{"internalType":"uint128","name":"","type":"uint128"}],"stateMutability":"pure","type":"function"},{"inputs":[{"internalType":"address","name":"sender","type":"address"},{"internalType":"address","name":"recipient","type":"address"},{"internalType":"int24","name":"bottomTick","type":"int24"},{"internalType":"int24","name":"topTick","type":"int24"},{"internalType":"uint128","name":"liquidityDesired","type":"uint128"},{"internalType":"bytes","name":"data","type":"bytes"}],"name":"mint","outputs":[{"internalType":"uint256","name":"amount0","type":"uint256"},{"internalType":"uint256","name":"amount1","type":"uint256"},{"internalType":"uint128","name":"liquidityActual","type":"uint128"}],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"bytes32","name":"","type":"bytes32"}],"name":"positions","outputs":[{"internalType":"uint128","name":"liquidity","type":"uint128"},{"internalType":"uint32","name":"lastLiquidityAddTimestamp","type":"uint32"},{"internalType":"uint256","name":"innerFeeGrowth0Token","type":"uint256"},{"internalType":"uint256","name":"innerFeeGrowth1Token","type":"uint256"},{"internalType":"uint128","name":"fees0","type":"uint128"},{"internalType":"uint128","name":"fees1","type":"uint128"}],"stateMutability":"view","type":"function"},{"inputs":[{"internalType":"uint8","name":"communityFee0","type":"uint8"},{"internalType":"uint8","name":"communityFee1","type":"uint8"}],"name":"setCommunityFee","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"virtualPoolAddress","type":"address"}],"name":"setIncentive","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"uint32","name":"newLiquidityCooldown","type":"uint32"}],"name":"setLiquidityCooldown","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"int24","name":"newTickSpacing","type":"int24"}],"name":"setTickSpacing","outputs":[],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"recipient","type":"address"},{"internalType":"bool","name":"zeroToOne","type":"bool"},{"internalType":"int256","name":"amountRequired","type":"int256"},{"internalType":"uint160","name":"limitSqrtPrice","type":"uint160"},{"internalType":"bytes","name":"data","type":"bytes"}],"name":"swap","outputs":[{"internalType":"int256","name":"amount0","type":"int256"},{"internalType":"int256","name":"amount1","type":"int256"}],"stateMutability":"nonpayable","type":"function"},{"inputs":[{"internalType":"address","name":"sender","type":"address"},{"internalType":"address","name":"recipient","type":"address"},{"internalType":"bool","name":"zeroToOne","type":"bool"},{"internalType":"int256","name":"amountRequired","type":"int256"},{"internalType":"uint160","name":"limitSqrtPrice","type":"uint160"},{"internalType":"bytes","name":"data","type":"bytes"}],"name":"swapSupportingFeeOnInputTokens","outputs":[{"internalType":"int256","name":"amount0","type":"int256"},{"internalType":"int256","name":"amount1","type":"int256"}],"stateMutability":"nonpayable","type":"function"},{"inputs":[],"name":"tickSpacing","outputs":[{"internalType":"int24","name":"","type":"int24"}],"stateMutability":"view","type":"function"},{"inputs":[{"internalType":"int16","name":"","type":"int16"}],"name":"tickTable","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function"},{"inputs":[{"internalType":"int24","name":"","type":"int24"}],"name":"ticks","outputs":[{"internalType":"uint128","name":"liquidityTotal","type":"uint128"},{"internalType":"int128","name":"liquidityDelta","type":"int128"},{"internalType":"uint256","name":"outerFeeGrowth0Token","type":"uint256"},{"internalType":"uint256","name":"outerFeeGrowth1Token","type":"uint256"},{"internalType":"int56","name":"outerTickCumulative","type":"int56"},{"internalType":"uint160","name":"outerSecondsPerLiquidity","type":"uint160"},{"internalType":"uint32","name":"outerSecondsSpent","type":"uint32"},{"internalType":"bool","name":"initialized","type":"bool"}],"stateMutability":"view","type":"function"},{"inputs":[{"internalType":"uint256","name":"index","type":"uint256"}],"name":"timepoints","outputs":[{"internalType":"bool","name":"initialized","type":"bool"},{"internalType":"uint32","name":"blockTimestamp","type":"uint32"},{"internalType":"int56","name":"tickCumulative","type":"int56"},{"internalType":"uint160","name":"secondsPerLiquidityCumulative","type":"uint160"},{"internalType":"uint88","name":"volatilityCumulative","type":"uint88"},{"internalType":"int24","name":"averageTick","type":"int24"},{"internalType":"uint144","name":"volumePerLiquidityCumulative","type":"uint144"}],"stateMutability":"view","type":"function"},{"inputs":[],"name":"token0","outputs":[{"internalType":"address","name":"","type":"address"}],"stateMutability":"view","type":"function"},{"inputs":[],"name":"token1","outputs":[{"internalType":"address","name":"","type":"address"}],"stateMutability":"view","type":"function"},{"inputs":[],"name":"totalFeeGrowth0Token","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function"},{"inputs":[],"name":"totalFeeGrowth1Token","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function"}]
     """
-)
+
+
+@functools.lru_cache(maxsize=None)
+def full_abi() -> list:
+    return json.loads(_FULL_ABI_JSON)
+
+
+# eth_calls per JSON-RPC batch POST
+RPC_BATCH_SIZE = 100
+
+# Raw selectors/output layouts for the scan hot path (bypasses ContractFunction)
+SEL_TICKS = bytes(Web3.keccak(text="ticks(int24)")[:4])
+SEL_TICK_TABLE = bytes(Web3.keccak(text="tickTable(int16)")[:4])
+TICKS_OUTPUT_TYPES = ["uint128", "int128", "uint256", "uint256", "int56", "uint160", "uint32", "bool"]
+
+# Multicall3 (same address on every chain it is deployed to): ticks(int24) reads
+# go out as aggregate3 calls with allowFailure, one eth_call per RPC_BATCH_SIZE ticks
+MULTICALL3_ADDRESS = Web3.to_checksum_address("0xcA11bde05977b3631167028862bE2a173976CA11")
+SEL_AGGREGATE3 = bytes(Web3.keccak(text="aggregate3((address,bool,bytes)[])")[:4])
+
+# Minimal ABI: only the functions/events this script calls (see --full-abi)
+ABI_MIN = [
+    {"inputs": [], "name": "tickSpacing", "outputs": [{"internalType": "int24", "name": "", "type": "int24"}], "stateMutability": "view", "type": "function"},
+    {"inputs": [], "name": "globalState", "outputs": [{"internalType": "uint160", "name": "price", "type": "uint160"}, {"internalType": "int24", "name": "tick", "type": "int24"}, {"internalType": "uint16", "name": "fee", "type": "uint16"}, {"internalType": "uint16", "name": "timepointIndex", "type": "uint16"}, {"internalType": "uint8", "name": "communityFeeToken0", "type": "uint8"}, {"internalType": "uint8", "name": "communityFeeToken1", "type": "uint8"}, {"internalType": "bool", "name": "unlocked", "type": "bool"}], "stateMutability": "view", "type": "function"},
+    {"inputs": [{"internalType": "int24", "name": "", "type": "int24"}], "name": "ticks", "outputs": [{"internalType": "uint128", "name": "liquidityTotal", "type": "uint128"}, {"internalType": "int128", "name": "liquidityDelta", "type": "int128"}, {"internalType": "uint256", "name": "outerFeeGrowth0Token", "type": "uint256"}, {"internalType": "uint256", "name": "outerFeeGrowth1Token", "type": "uint256"}, {"internalType": "int56", "name": "outerTickCumulative", "type": "int56"}, {"internalType": "uint160", "name": "outerSecondsPerLiquidity", "type": "uint160"}, {"internalType": "uint32", "name": "outerSecondsSpent", "type": "uint32"}, {"internalType": "bool", "name": "initialized", "type": "bool"}], "stateMutability": "view", "type": "function"},
+    {"inputs": [{"internalType": "int16", "name": "", "type": "int16"}], "name": "tickTable", "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}], "stateMutability": "view", "type": "function"},
+    {"inputs": [{"internalType": "int24", "name": "bottomTick", "type": "int24"}, {"internalType": "int24", "name": "topTick", "type": "int24"}], "name": "getInnerCumulatives", "outputs": [{"internalType": "int56", "name": "innerTickCumulative", "type": "int56"}, {"internalType": "uint160", "name": "innerSecondsSpentPerLiquidity", "type": "uint160"}, {"internalType": "uint32", "name": "innerSecondsSpent", "type": "uint32"}], "stateMutability": "view", "type": "function"},
+    {"inputs": [], "name": "dataStorageOperator", "outputs": [{"internalType": "address", "name": "", "type": "address"}], "stateMutability": "view", "type": "function"},
+    {"anonymous": False, "inputs": [{"indexed": False, "internalType": "address", "name": "sender", "type": "address"}, {"indexed": True, "internalType": "address", "name": "owner", "type": "address"}, {"indexed": True, "internalType": "int24", "name": "bottomTick", "type": "int24"}, {"indexed": True, "internalType": "int24", "name": "topTick", "type": "int24"}, {"indexed": False, "internalType": "uint128", "name": "liquidityAmount", "type": "uint128"}, {"indexed": False, "internalType": "uint256", "name": "amount0", "type": "uint256"}, {"indexed": False, "internalType": "uint256", "name": "amount1", "type": "uint256"}], "name": "Mint", "type": "event"},
+    {"anonymous": False, "inputs": [{"indexed": True, "internalType": "address", "name": "owner", "type": "address"}, {"indexed": True, "internalType": "int24", "name": "bottomTick", "type": "int24"}, {"indexed": True, "internalType": "int24", "name": "topTick", "type": "int24"}, {"indexed": False, "internalType": "uint128", "name": "liquidityAmount", "type": "uint128"}, {"indexed": False, "internalType": "uint256", "name": "amount0", "type": "uint256"}, {"indexed": False, "internalType": "uint256", "name": "amount1", "type": "uint256"}], "name": "Burn", "type": "event"},
+    {"anonymous": False, "inputs": [{"indexed": False, "internalType": "uint160", "name": "price", "type": "uint160"}, {"indexed": False, "internalType": "int24", "name": "tick", "type": "int24"}], "name": "Initialize", "type": "event"},
+]
 
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Read Algebra pool tick-related data")
     p.add_argument("--rpc-url", default=DEFAULT_RPC, help="RPC endpoint URL (default: Polygon public RPC)")
     p.add_argument("--address", default=DEFAULT_POOL, help="Algebra pool address")
+    p.add_argument("--full-abi", action="store_true", help="Load the full Algebra pool ABI instead of the minimal one")
     p.add_argument("--tick", type=int, default=None, help="Specific tick to inspect via ticks(tick)")
     p.add_argument(
         "--range-multiple",
@@ -79,7 +142,7 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--direction", choices=["both", "up", "down"], default="both", help="Scan direction relative to current tick")
     p.add_argument("--min-liq-total", type=int, default=0, help="Filter to ticks where liquidityTotal >= this value (default: 0)")
     p.add_argument("--max-results", type=int, default=0, help="Stop scanning after this many matches (0 = unlimited)")
-    p.add_argument("--json", action="store_true", help="Print scan results as JSON")
+    p.add_argument("--json", action="store_true", help="Print scan results as JSON (ints wider than 64 bits as strings)")
     p.add_argument("--find-boundaries", action="store_true", help="Find nearest initialized ticks above and below current tick")
     p.add_argument("--nearest", type=int, default=3, help="How many nearest boundaries to show per direction (default: 3)")
     # Bitmap scanning options
@@ -89,6 +152,8 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--bitmap-only", action="store_true", help="Only consider ticks discovered via bitmap (don’t probe sequentially)")
     p.add_argument("--bitmap-verbose", action="store_true", help="Log bitmap word scans and bit counts")
     p.add_argument("--bitmap-source", choices=["auto", "pool", "dso"], default="auto", help="Where to read tickTable from: pool, DataStorageOperator, or auto-detect")
+    p.add_argument("--cache-block-window", type=int, default=0, help="Persist tickTable words on disk and reuse them for this many blocks (0 = off)")
+    p.add_argument("--tick-cache-db", default=".tickcache.db", help="SQLite file for --cache-block-window (default .tickcache.db)")
     # Parallelism
     default_threads = min(8, (os.cpu_count() or 4))
     p.add_argument("--threads", type=int, default=default_threads, help=f"Parallel threads for scanning (default: {default_threads})")
@@ -111,12 +176,379 @@ def checksum(w3: Web3, addr: str) -> str:
         sys.exit(2)
 
 
+# Minimum seconds between progress-line redraws (~10 Hz); the final update always draws
+PROGRESS_REDRAW_INTERVAL = 0.1
+
+# Allowed tick range for int24
+MIN_TICK = -(2 ** 23)
+MAX_TICK = (2 ** 23) - 1
+
+
+def _spaced_ticks(start_tick: int, step: int, multiples: int, tick_spacing: int) -> list[int]:
+    """Ticks `start_tick + i*step*tick_spacing` for i in 1..multiples."""
+    if np is not None:
+        offsets = np.arange(1, multiples + 1, dtype=np.int64) * (step * tick_spacing)
+        return (offsets + start_tick).tolist()
+    return [start_tick + i * step * tick_spacing for i in range(1, multiples + 1)]
+
+
+MASK64 = (1 << 64) - 1
+FULL_MASK_256 = (1 << 256) - 1
+
+# Sort key for ticks(int24) result dicts
+_TICK_KEY = operator.itemgetter("tick")
+
+# Word popcount: int.bit_count() on Python 3.10+, string count fallback on 3.9
+_popcount = getattr(int, "bit_count", lambda x: bin(x).count("1"))
+
+
+def _word_limbs(word: int) -> list[int]:
+    """Split a 256-bit word into four uint64 limbs, least significant first."""
+    return [(word >> (64 * i)) & MASK64 for i in range(4)]
+
+
+if numba is not None and np is not None:
+    _U64_ONE = np.uint64(1)
+
+    @numba.njit(cache=True)
+    def _ctz64(v):
+        # Binary-search count of trailing zeros; v must be non-zero
+        n = 0
+        if (v & np.uint64(0xFFFFFFFF)) == 0:
+            n += 32
+            v >>= np.uint64(32)
+        if (v & np.uint64(0xFFFF)) == 0:
+            n += 16
+            v >>= np.uint64(16)
+        if (v & np.uint64(0xFF)) == 0:
+            n += 8
+            v >>= np.uint64(8)
+        if (v & np.uint64(0xF)) == 0:
+            n += 4
+            v >>= np.uint64(4)
+        if (v & np.uint64(0x3)) == 0:
+            n += 2
+            v >>= np.uint64(2)
+        if (v & np.uint64(0x1)) == 0:
+            n += 1
+        return n
+
+    @numba.njit(cache=True)
+    def _expand_bits(limbs, word_pos, low, high, min_tick, max_tick, out):
+        """Write ascending raw ticks for set bits low..high of pre-aligned `limbs` into `out`; return count."""
+        k = 0
+        base = word_pos * 256
+        for i in range(limbs.size):
+            v = limbs[i]
+            while v != 0:
+                b = i * 64 + _ctz64(v)
+                tau = base + b
+                if b >= low and b <= high and tau >= min_tick and tau <= max_tick:
+                    out[k] = tau
+                    k += 1
+                v &= v - _U64_ONE
+        return k
+
+    @numba.njit(cache=True)
+    def _expand_rows(rows, word_pos, min_tick, max_tick, out, counts):
+        """_expand_bits over every row of an (N, 4) masked limb array; per-row counts go to `counts`."""
+        k = 0
+        for r in range(rows.shape[0]):
+            n = _expand_bits(rows[r], word_pos[r], 0, 255, min_tick, max_tick, out[k:])
+            counts[r] = n
+            k += n
+        return k
+else:
+    _expand_bits = None
+    _expand_rows = None
+
+
+def _mask_range(word: int, low: int, high: int) -> int:
+    if high < low:
+        return 0
+    # mask bits [low, high]
+    upper = (1 << (high + 1)) - 1
+    lower = (1 << low) - 1
+    return word & (upper ^ lower)
+
+
+@functools.lru_cache(maxsize=None)
+def _align_mask(tick_spacing: int, phase: int) -> int:
+    """256-bit mask with bits set where (phase + bit) % tick_spacing == 0."""
+    first = -phase % tick_spacing
+    mask = 0
+    for b in range(first, 256, tick_spacing):
+        mask |= 1 << b
+    return mask
+
+
+@functools.lru_cache(maxsize=None)
+def _align_limbs(tick_spacing: int, phase: int) -> tuple:
+    return tuple(_word_limbs(_align_mask(tick_spacing, phase)))
+
+
+def _word_bits(word: int, low: int = 0, high: int = 255) -> list[int]:
+    """Ascending set-bit positions within [low, high] of a 256-bit tickTable word."""
+    if not word or high < low:
+        return []
+    if np is not None:
+        # 32 x uint8 -> 256 bit flags in one C pass; the range is a slice, not a bignum mask
+        raw = np.frombuffer(word.to_bytes(32, "little"), dtype=np.uint8)
+        flags = np.unpackbits(raw, bitorder="little")[low:high + 1]
+        return (np.flatnonzero(flags) + low).tolist()
+    word = _mask_range(word, low, high)
+    out = []
+    for i, v in enumerate(_word_limbs(word)):
+        # Clear the lowest set bit per 64-bit limb (v &= v - 1) so each step
+        # works on a register-sized int instead of the full 256-bit word.
+        base = i << 6
+        while v:
+            out.append(base + (v & -v).bit_length() - 1)
+            v &= v - 1
+    return out
+
+
+def _row_ticks(word_pos: int, row) -> list[int]:
+    """Ascending int24 ticks for one uint64[4] limb row already masked and spacing-aligned."""
+    if _expand_bits is not None:
+        out = np.empty(256, dtype=np.int64)
+        k = _expand_bits(row, word_pos, 0, 255, MIN_TICK, MAX_TICK, out)
+        return out[:k].tolist()
+    flags = np.unpackbits(row.view(np.uint8), bitorder="little")
+    taus = np.flatnonzero(flags).astype(np.int64) + (word_pos << 8)
+    return taus[(taus >= MIN_TICK) & (taus <= MAX_TICK)].tolist()
+
+
+def _masked_rows(positions: list[int], words: list[int], tick_spacing: int,
+                 first_low: int = 0, first_high: int = 255):
+    """Words as an (N, 4) little-endian uint64 limb array, ANDed in one pass with each
+    word's tick-spacing alignment mask; the first word is also limited to [first_low, first_high]."""
+    rows = np.array([_word_limbs(w) for w in words], dtype="<u8").reshape(-1, 4)
+    # word_pos * 256 shifts the alignment phase, so masks are shared per phase
+    mask = np.array(
+        [_align_limbs(tick_spacing, (wp << 8) % tick_spacing) for wp in positions], dtype="<u8"
+    ).reshape(-1, 4)
+    if len(words):
+        mask[0] &= np.array(_word_limbs(_mask_range(FULL_MASK_256, first_low, first_high)), dtype="<u8")
+    return np.bitwise_and(rows, mask)
+
+
+def _words_ticks(positions: list[int], words: list[int], tick_spacing: int,
+                 first_low: int = 0, first_high: int = 255, descending: bool = False) -> list[list[int]]:
+    """Per-word tick lists for consecutive `words`, the first limited to [first_low, first_high].
+
+    Each list is ascending, or descending (MSB first) with `descending`.
+    """
+    if descending:
+        return [ticks[::-1] for ticks in _words_ticks(positions, words, tick_spacing, first_low, first_high)]
+    if np is None:
+        return [
+            _word_ticks(wp, word, tick_spacing, first_low, first_high) if i == 0
+            else _word_ticks(wp, word, tick_spacing)
+            for i, (wp, word) in enumerate(zip(positions, words))
+        ]
+    rows = _masked_rows(positions, words, tick_spacing, first_low, first_high)
+    if _expand_rows is not None:
+        # One native pass over the whole masked batch, then split per word
+        out = np.empty(rows.size * 64, dtype=np.int32)
+        counts = np.zeros(len(rows), dtype=np.int64)
+        k = _expand_rows(rows, np.asarray(positions, dtype=np.int64), MIN_TICK, MAX_TICK, out, counts)
+        flat = out[:k].tolist()
+        split, i = [], 0
+        for n in counts.tolist():
+            split.append(flat[i:i + n])
+            i += n
+        return split
+    return [_row_ticks(wp, row) if words[i] else [] for i, (wp, row) in enumerate(zip(positions, rows))]
+
+
+def _word_ticks(word_pos: int, word: int, tick_spacing: int, low: int = 0, high: int = 255) -> list[int]:
+    """Ascending spacing-aligned int24 ticks for set bits low..high of `word` at `word_pos`."""
+    if not word or high < low:
+        return []
+    if np is not None:
+        return _row_ticks(word_pos, _masked_rows([word_pos], [word], tick_spacing, low, high)[0])
+    base = word_pos << 8
+    word &= _align_mask(tick_spacing, base % tick_spacing)
+    return [base + b for b in _word_bits(word, low, high) if MIN_TICK <= base + b <= MAX_TICK]
+
+
+def _rpc_session(threads: int) -> requests.Session:
+    """Shared keep-alive session sized so every scan worker reuses a pooled connection."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=max(1, threads),
+        pool_maxsize=max(1, threads) * 4,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _unique_sorted_ticks(chunks: list[array]) -> list[int]:
+    """Merge per-task int64 tick arrays into one ascending, de-duplicated list."""
+    if np is not None:
+        if not chunks:
+            return []
+        merged = np.concatenate([np.frombuffer(a, dtype=np.int64) for a in chunks])
+        return np.unique(merged).tolist()
+    return sorted({t for a in chunks for t in a})
+
+
+def _make_web3(rpc_url: str, session: requests.Session) -> Web3:
+    """Web3 over the pooled session with eth_chainId & co. served from a local cache."""
+    provider = Web3.HTTPProvider(rpc_url, session=session)
+    try:
+        from web3.middleware import simple_cache_middleware  # web3 v6
+    except ImportError:
+        # web3 v7+: request caching moved onto the provider
+        provider.cache_allowed_requests = True
+        return Web3(provider)
+    w3 = Web3(provider)
+    w3.middleware_onion.add(simple_cache_middleware)
+    return w3
+
+
+# (pool address, function name) -> result for reads that never change after deployment
+_IMMUTABLE_READS: dict = {}
+
+
+def read_immutable(contract, fn_name: str):
+    key = (contract.address, fn_name)
+    if key not in _IMMUTABLE_READS:
+        _IMMUTABLE_READS[key] = getattr(contract.functions, fn_name)().call()
+    return _IMMUTABLE_READS[key]
+
+
+def raw_call(w3: Web3, to: str, data: bytes, block="latest") -> bytes:
+    """Plain eth_call returning the undecoded return data."""
+    return bytes(w3.eth.call({"to": to, "data": data}, block_identifier=block))
+
+
+def open_tick_cache(path: str) -> sqlite3.Connection:
+    """On-disk tickTable word cache: one 32-byte word per (pool, word_pos, block bucket)."""
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS ticktable ("
+        "pool TEXT NOT NULL, wp INTEGER NOT NULL, block INTEGER NOT NULL, val BLOB NOT NULL, "
+        "PRIMARY KEY (pool, wp, block))"
+    )
+    return conn
+
+
+def load_cached_words(conn: sqlite3.Connection, pool: str, bucket: int, positions: list[int]) -> dict:
+    out = {}
+    # Stay under SQLite's default bound-parameter limit
+    for i in range(0, len(positions), 500):
+        chunk = positions[i:i + 500]
+        rows = conn.execute(
+            f"SELECT wp, val FROM ticktable WHERE pool = ? AND block = ? AND wp IN ({','.join('?' * len(chunk))})",
+            [pool, bucket, *chunk],
+        )
+        out.update((wp, int.from_bytes(val, "big")) for wp, val in rows)
+    return out
+
+
+def store_cached_words(conn: sqlite3.Connection, pool: str, bucket: int, words: dict) -> None:
+    if not words:
+        return
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO ticktable (pool, wp, block, val) VALUES (?, ?, ?, ?)",
+            [(pool, wp, bucket, word.to_bytes(32, "big")) for wp, word in words.items()],
+        )
+
+
+def multicall_aggregate3(w3: Web3, to: str, datas: list[bytes]) -> list:
+    """Run `datas` against `to` in one Multicall3 aggregate3 eth_call; returns raw return data per call (None where it reverted)."""
+    calldata = SEL_AGGREGATE3 + abi_encode(["(address,bool,bytes)[]"], [[(to, True, d) for d in datas]])
+    (results,) = abi_decode(["(bool,bytes)[]"], raw_call(w3, MULTICALL3_ADDRESS, calldata))
+    return [bytes(ret) if ok else None for ok, ret in results]
+
+
+def _json_ints(obj):
+    """*obj* with ints outside the 64-bit range (uint128/uint256 tick fields) as decimal strings."""
+    if isinstance(obj, dict):
+        return {k: _json_ints(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_ints(v) for v in obj]
+    if type(obj) is int and not -(1 << 63) <= obj < (1 << 64):
+        return str(obj)
+    return obj
+
+
+def dumps_json(obj) -> str:
+    """Indented JSON for --json output; orjson when available.
+
+    orjson rejects ints wider than 64 bits, so those are written as strings,
+    with or without orjson, to keep the output the same either way.
+    """
+    obj = _json_ints(obj)
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _batch_payload(to: str, datas: list[bytes], block) -> list[dict]:
+    return [
+        {"jsonrpc": "2.0", "id": i, "method": "eth_call", "params": [{"to": to, "data": "0x" + d.hex()}, block]}
+        for i, d in enumerate(datas)
+    ]
+
+
+def _batch_results(body, n: int) -> list:
+    if not isinstance(body, list):
+        # Nodes without batch support answer with a single error object
+        raise ValueError(f"batch eth_call rejected: {body}")
+    out = [None] * n
+    for item in body:
+        idx = item.get("id")
+        result = item.get("result")
+        if isinstance(idx, int) and 0 <= idx < n and isinstance(result, str):
+            out[idx] = bytes.fromhex(result[2:])
+    return out
+
+
+def rpc_batch_call(session: requests.Session, rpc_url: str, to: str, datas: list[bytes], block="latest") -> list:
+    """Send one JSON-RPC batch of eth_calls; returns raw return data per entry (None where it errored)."""
+    resp = session.post(rpc_url, json=_batch_payload(to, datas, block), timeout=30)
+    resp.raise_for_status()
+    return _batch_results(resp.json(), len(datas))
+
+
+async def async_rpc_batch_call(http, rpc_url: str, to: str, datas: list[bytes], block="latest") -> list:
+    """rpc_batch_call over a shared aiohttp.ClientSession."""
+    async with http.post(rpc_url, json=_batch_payload(to, datas, block)) as resp:
+        resp.raise_for_status()
+        body = await resp.json(content_type=None)
+    return _batch_results(body, len(datas))
+
+
+def _topic_key(value) -> str:
+    """Normalize a topic (HexBytes/bytes/hex str) to a lowercase 0x-prefixed hex string."""
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + bytes(value).hex()
+    s = str(value).lower()
+    return s if s.startswith("0x") else "0x" + s
+
+
+def _event_topic(evt) -> str:
+    """topic0 for a contract event (web3 v7 exposes `.topic`; `.signature` is the text form)."""
+    topic = getattr(evt, "topic", None)
+    if topic is None:
+        sig = str(evt.signature)
+        topic = sig if sig.startswith("0x") else Web3.keccak(text=sig)
+    return _topic_key(topic)
+
+
 def main():
     args = parse_args()
 
     print(f"Connecting to blockchain via {args.rpc_url}...")
     try:
-        w3 = Web3(Web3.HTTPProvider(args.rpc_url))
+        session = _rpc_session(args.threads)
+        w3 = _make_web3(args.rpc_url, session)
         if not w3.is_connected():
             print("Failed to connect to the node.")
             sys.exit(1)
@@ -126,13 +558,20 @@ def main():
         sys.exit(1)
 
     contract_address = checksum(w3, args.address)
-    contract = w3.eth.contract(address=contract_address, abi=ABI)
+    contract = w3.eth.contract(address=contract_address, abi=full_abi() if args.full_abi else ABI_MIN)
     print(f"Contract loaded at address: {contract.address}")
+    # Steps 1-2 and DSO discovery have no data dependency: issue the RPCs concurrently
+    startup_pool = ThreadPoolExecutor(max_workers=3)
+    dso_fut = startup_pool.submit(read_immutable, contract, "dataStorageOperator")
+    spacing_fut = startup_pool.submit(read_immutable, contract, "tickSpacing")
+    state_fut = startup_pool.submit(lambda: contract.functions.globalState().call())
+    startup_pool.shutdown(wait=False)
+
     # DSO discovery kept for completeness but bitmap reads use pool.tickTable per Algebra specs
     dso_address = None
     dso_contract = None
     try:
-        dso_address = contract.functions.dataStorageOperator().call()
+        dso_address = dso_fut.result()
         if Web3.is_address(dso_address) and int(dso_address, 16) != 0 and args.bitmap_verbose:
             print(f"[bitmap] DSO discovered: {dso_address}")
     except Exception:
@@ -141,7 +580,7 @@ def main():
     print("\n" + "=" * 50)
     try:
         print("1. Calling tickSpacing()...")
-        tick_spacing = contract.functions.tickSpacing().call()
+        tick_spacing = spacing_fut.result()
         print(f"   -> Tick Spacing: {tick_spacing}")
     except Exception as e:
         print(f"   -> Error calling tickSpacing(): {e}")
@@ -150,7 +589,7 @@ def main():
     print("\n" + "=" * 50)
     try:
         print("2. Calling globalState()...")
-        state = contract.functions.globalState().call()
+        state = state_fut.result()
         state_labels = [
             "price",
             "tick",
@@ -170,25 +609,36 @@ def main():
         print(f"   -> Error calling globalState(): {e}")
         sys.exit(1)
 
-    # Define allowed tick range for int24 and derived compressed range
-    MIN_TICK = -(2 ** 23)
-    MAX_TICK = (2 ** 23) - 1
-    comp_min = math.ceil(MIN_TICK / tick_spacing)
-    comp_max = math.floor(MAX_TICK / tick_spacing)
+    # Derived compressed range for the int24 tick bounds
+    # Integer ceil/floor division: no float rounding at the int24 extremes
+    comp_min = -(-MIN_TICK // tick_spacing)
+    comp_max = MAX_TICK // tick_spacing
     min_wp = comp_min >> 8
     max_wp = comp_max >> 8
 
+    if args.tick is not None:
+        tick_to_query = int(args.tick)
+    else:
+        # closest spaced tick to the active tick
+        tick_to_query = (current_tick // tick_spacing) * tick_spacing
+    half_range = max(1, int(args.range_multiple)) * tick_spacing
+    bottom_tick = ((current_tick - half_range) // tick_spacing) * tick_spacing
+    top_tick = ((current_tick + half_range) // tick_spacing) * tick_spacing
+
+    # Steps 3-4 only depend on globalState: issue both reads together
+    detail_pool = ThreadPoolExecutor(max_workers=2)
+    tick_fut = detail_pool.submit(lambda: contract.functions.ticks(tick_to_query).call())
+    cumulatives_fut = detail_pool.submit(
+        lambda: contract.functions.getInnerCumulatives(bottom_tick, top_tick).call()
+    )
+    detail_pool.shutdown(wait=False)
+
     print("\n" + "=" * 50)
     try:
-        if args.tick is not None:
-            tick_to_query = int(args.tick)
-        else:
-            # closest spaced tick to the active tick
-            tick_to_query = (current_tick // tick_spacing) * tick_spacing
         print(
             f"3. Calling ticks(tick) with the {'specified' if args.tick is not None else 'closest spaced'} tick: {tick_to_query}..."
         )
-        tick_data = contract.functions.ticks(tick_to_query).call()
+        tick_data = tick_fut.result()
         tick_labels = [
             "liquidityTotal",
             "liquidityDelta",
@@ -209,15 +659,11 @@ def main():
 
     print("\n" + "=" * 50)
     try:
-        half_range = max(1, int(args.range_multiple)) * tick_spacing
-        bottom_tick = ((current_tick - half_range) // tick_spacing) * tick_spacing
-        top_tick = ((current_tick + half_range) // tick_spacing) * tick_spacing
-
         print("4. Calling getInnerCumulatives(bottomTick, topTick)...")
         print(f"   - bottomTick: {bottom_tick}")
         print(f"   - topTick:    {top_tick}")
 
-        cumulatives_data = contract.functions.getInnerCumulatives(bottom_tick, top_tick).call()
+        cumulatives_data = cumulatives_fut.result()
         cumulatives_labels = [
             "innerTickCumulative",
             "innerSecondsSpentPerLiquidity",
@@ -269,21 +715,32 @@ def main():
             ranges.append((cur, end))
             cur = end + 1
 
-        # Build tasks: one per (event, range)
-        tasks = []
-        for (name, evt) in events.items():
-            if evt is None or name not in include:
-                continue
-            for (start, end) in ranges:
-                tasks.append((name, evt, start, end))
+        # One OR-filter on topic0 covers every selected event; decoding is
+        # dispatched on the log's topic0 instead of issuing one query per event.
+        by_topic = {
+            _event_topic(evt): (name, evt)
+            for (name, evt) in events.items()
+            if evt is not None and name in include
+        }
+        topic0 = list(by_topic.keys())
+
+        # Build tasks: one per block range
+        tasks = ranges if topic0 else []
 
         total_tasks = len(tasks)
         done_tasks = 0
-        boundary_ticks = set()
+        chunks: list[array] = []
+
+        last_draw = 0.0
 
         def _progress(label: str, done: int, total: int):
+            nonlocal last_draw
             if not args.progress:
                 return
+            now = time.monotonic()
+            if done != total and now - last_draw < PROGRESS_REDRAW_INTERVAL:
+                return
+            last_draw = now
             pct = 100.0 * done / total if total else 100.0
             sys.stderr.write(f"\r[{label}] {done}/{total} ({pct:.1f}%)")
             sys.stderr.flush()
@@ -293,18 +750,25 @@ def main():
                 sys.stderr.write("\n")
                 sys.stderr.flush()
 
-        def _scan_task(name, evt, start, end):
-            out = []
+        def _scan_task(start, end) -> array:
+            out = array('q')
             try:
                 logs = w3.eth.get_logs({
                     'address': contract.address,
                     'fromBlock': int(start),
                     'toBlock': int(end),
-                    'topics': [evt.signature]
+                    'topics': [topic0]
                 })
             except Exception:
                 logs = []
             for log in logs:
+                topics = log.get('topics') or []
+                if not topics:
+                    continue
+                match = by_topic.get(_topic_key(topics[0]))
+                if match is None:
+                    continue
+                name, evt = match
                 try:
                     decoded = evt.process_log(log)
                 except Exception:
@@ -324,20 +788,19 @@ def main():
             print("No eligible events to scan with current options.")
         else:
             with ThreadPoolExecutor(max_workers=max(1, args.threads)) as ex:
-                futs = [ex.submit(_scan_task, name, evt, start, end) for (name, evt, start, end) in tasks]
+                futs = [ex.submit(_scan_task, start, end) for (start, end) in tasks]
                 for fut in as_completed(futs):
                     try:
-                        for t in fut.result() or []:
-                            boundary_ticks.add(int(t))
+                        chunks.append(fut.result())
                     except Exception:
                         pass
                     done_tasks += 1
                     _progress('events', done_tasks, total_tasks)
             _finish_progress()
 
-        results = sorted(boundary_ticks)
+        results = _unique_sorted_ticks(chunks)
         if args.json:
-            print(json.dumps({
+            print(dumps_json({
                 'current_tick': current_tick,
                 'base_tick': (current_tick // tick_spacing) * tick_spacing,
                 'tick_spacing': tick_spacing,
@@ -347,7 +810,7 @@ def main():
                 'to_block': to_block,
                 'chunk_blocks': chunk,
                 'threads': args.threads,
-            }, indent=2))
+            }))
         else:
             print(f"Found {len(results)} boundary ticks from events (showing up to 1000):")
             for t in results[:1000]:
@@ -358,8 +821,14 @@ def main():
     # ------------------------------------------------------------------
     if args.scan or args.find_boundaries:
         print("\n" + "=" * 50)
+        def _tick_calldata(t: int) -> bytes:
+            return SEL_TICKS + abi_encode(["int24"], [int(t)])
+
         def read_tick(t: int):
-            data = contract.functions.ticks(int(t)).call()
+            return _decode_tick(t, raw_call(w3, contract.address, _tick_calldata(t)))
+
+        def _decode_tick(t: int, raw: bytes) -> dict:
+            data = abi_decode(TICKS_OUTPUT_TYPES, raw)
             # Support both ABIs: older (8 items + initialized bool) and newer (with prevTick/nextTick)
             out = {"tick": int(t)}
             if isinstance(data, (list, tuple)):
@@ -389,9 +858,16 @@ def main():
             return out
 
         # Parallel helpers
+        last_update = 0.0
+
         def _progress_update(label: str, done: int, total: int) -> None:
+            nonlocal last_update
             if not args.progress:
                 return
+            now = time.monotonic()
+            if done != total and now - last_update < PROGRESS_REDRAW_INTERVAL:
+                return
+            last_update = now
             pct = 100.0 * done / total if total else 100.0
             sys.stderr.write(f"\r[{label}] {done}/{total} ({pct:.1f}%)")
             sys.stderr.flush()
@@ -401,181 +877,300 @@ def main():
                 sys.stderr.write("\n")
                 sys.stderr.flush()
 
-        def _read_ticks_parallel(ticks: list[int], threads: int, label: str | None = None) -> list[dict]:
-            results: list[dict] = []
-            total = len(ticks)
-            label = label or "ticks"
-            done = 0
-            if threads <= 1:
-                for t in ticks:
+        # tick -> decoded ticks(int24), shared by every scan in the run so that
+        # --find-boundaries and --scan over the same range read each tick once.
+        # Failed reads are not cached.
+        tick_info_cache: dict[int, dict] = {}
+
+        def _read_tick_batch(batch: list[int]) -> list:
+            # One Multicall3 eth_call for the uncached ticks of the batch; per-tick
+            # eth_call only for reverted entries, or for all of them if the aggregate call fails.
+            todo = [t for t in batch if t not in tick_info_cache]
+            if todo:
+                try:
+                    raws = multicall_aggregate3(w3, contract.address, [_tick_calldata(t) for t in todo])
+                except Exception:
+                    raws = [None] * len(todo)
+                for t, raw in zip(todo, raws):
                     try:
-                        results.append(read_tick(t))
+                        tick_info_cache[t] = _decode_tick(t, raw) if raw else read_tick(t)
                     except Exception:
                         pass
-                    done += 1
+            return [tick_info_cache.get(t) for t in batch]
+
+        def read_ticks(ticks: list[int]) -> list:
+            """ticks(int24) for each tick in order (None where the read failed)."""
+            infos: list = []
+            for i in range(0, len(ticks), RPC_BATCH_SIZE):
+                infos.extend(_read_tick_batch(ticks[i:i + RPC_BATCH_SIZE]))
+            return infos
+
+        def _read_ticks_parallel(ticks: list[int], threads: int, label: str | None = None,
+                                 done: int = 0, total: int | None = None) -> list[dict]:
+            # Ticks are read RPC_BATCH_SIZE at a time through Multicall3; threads
+            # only parallelize whole batches. Failed reads are dropped.
+            # Progress is drawn as done/total of the whole scan when it reads in
+            # chunks; the scan ends the progress line (_progress_finish).
+            results: list[dict] = []
+            label = label or "ticks"
+            if total is None:
+                total = len(ticks)
+            batches = [ticks[i:i + RPC_BATCH_SIZE] for i in range(0, len(ticks), RPC_BATCH_SIZE)]
+            if threads <= 1 or len(batches) <= 1:
+                for batch in batches:
+                    results.extend(info for info in _read_tick_batch(batch) if info is not None)
+                    done += len(batch)
                     _progress_update(label, done, total)
-                _progress_finish()
                 return results
             with ThreadPoolExecutor(max_workers=max(1, threads)) as ex:
-                future_to_tick = {ex.submit(read_tick, t): t for t in ticks}
-                for fut in as_completed(future_to_tick):
+                futs = {ex.submit(_read_tick_batch, batch): batch for batch in batches}
+                for fut in as_completed(futs):
                     try:
-                        info = fut.result()
-                        results.append(info)
+                        results.extend(info for info in fut.result() if info is not None)
                     except Exception:
                         pass
-                    done += 1
+                    done += len(futs[fut])
                     _progress_update(label, done, total)
-            _progress_finish()
             return results
 
         def _build_tick_list(start_tick: int, step: int, multiples: int) -> list[int]:
-            return [start_tick + i * step * tick_spacing for i in range(1, multiples + 1)]
+            return _spaced_ticks(start_tick, step, multiples, tick_spacing)
 
         # Sequential/parallel scan stepping by tickSpacing
         def scan_direction_seq(start_tick: int, step: int, multiples: int, min_liq: int, limit: int, threads: int):
+            # Ticks come out of _build_tick_list nearest-first in the scan direction.
+            # With a limit, read them in growing chunks and stop once enough are found.
             ticks = _build_tick_list(start_tick, step, multiples)
-            infos = _read_ticks_parallel(ticks, threads)
-            # Filter and order according to direction
-            if step > 0:
-                infos.sort(key=lambda x: x["tick"])  # ascending
+            if limit:
+                size = max(1, threads) * 2
+                cap = max(1, threads) * RPC_BATCH_SIZE
             else:
-                infos.sort(key=lambda x: x["tick"], reverse=True)  # descending (nearest first)
+                size = cap = max(1, len(ticks))
             found: list[dict] = []
-            for info in infos:
-                if info.get("initialized") and info.get("liquidityTotal", 0) >= min_liq:
-                    found.append(info)
-                    if limit and len(found) >= limit:
+            i = 0
+            while i < len(ticks):
+                infos = _read_ticks_parallel(ticks[i:i + size], threads, done=i, total=len(ticks))
+                i += size
+                size = min(size * 2, cap)
+                candidates = [x for x in infos if x.get("initialized") and x.get("liquidityTotal", 0) >= min_liq]
+                # Order according to direction: ascending up, descending (nearest first) down;
+                # with a limit only the nearest remaining ones are selected
+                if limit:
+                    pick = heapq.nsmallest if step > 0 else heapq.nlargest
+                    found.extend(pick(limit - len(found), candidates, key=_TICK_KEY))
+                    if len(found) >= limit:
                         break
+                else:
+                    found.extend(sorted(candidates, key=_TICK_KEY, reverse=step < 0))
+            _progress_finish()
             return found
 
         # Bitmap-based scan helpers (Algebra Integral indexing)
-        FULL_MASK_256 = (1 << 256) - 1
+        # With --cache-block-window, words are read at one pinned block and kept on
+        # disk under block // window, so later runs in the same window skip the RPC.
+        if args.cache_block_window > 0:
+            word_block = w3.eth.block_number
+            disk_cache = open_tick_cache(args.tick_cache_db)
+            cache_bucket = word_block // args.cache_block_window
+        else:
+            word_block = "latest"
+            disk_cache = None
+        block_param = hex(word_block) if isinstance(word_block, int) else word_block
 
         def ticktable_word(word_pos: int) -> int:
             # Algebra pool tickTable(int16) packs raw ticks: word = tick // 256
-            return int(contract.functions.tickTable(int(word_pos)).call())
+            raw = raw_call(w3, contract.address, SEL_TICK_TABLE + abi_encode(["int16"], [int(word_pos)]), word_block)
+            return int.from_bytes(raw[:32], "big")
 
-        def _fetch_words_parallel(positions: list[int], threads: int, label: str) -> dict:
-            out = {}
-            total = len(positions)
-            done = 0
-            if threads <= 1:
-                for p in positions:
+        # word_pos -> tickTable word, shared by the up/down scans and by
+        # --find-boundaries/--scan in the same run. Failed reads are not cached.
+        word_cache: dict[int, int] = {}
+
+        def _fetch_word_batch(batch: list[int]) -> list:
+            datas = [SEL_TICK_TABLE + abi_encode(["int16"], [int(p)]) for p in batch]
+            try:
+                raws = rpc_batch_call(session, args.rpc_url, contract.address, datas, block_param)
+            except Exception:
+                # Node rejected the batch request: fall back to one eth_call per word
+                words = []
+                for p in batch:
                     try:
-                        out[p] = ticktable_word(p)
+                        words.append(ticktable_word(p))
                     except Exception:
-                        out[p] = 0
-                    done += 1
+                        words.append(None)
+                return words
+            return [int.from_bytes(raw[:32], "big") if raw else None for raw in raws]
+
+        def _fetch_words_parallel(positions: Sequence[int], threads: int, label: str,
+                                  done: int = 0, total: int | None = None) -> list[int]:
+            # tickTable words go out as JSON-RPC batches of RPC_BATCH_SIZE eth_calls;
+            # threads only parallelize whole batches. Cached words are not refetched.
+            # `positions` is usually a range slice and is walked once; the result is
+            # aligned to it, with 0 for words that could not be read. Progress is
+            # drawn as in _read_ticks_parallel.
+            out = [0] * len(positions)
+            misses: list[int] = []
+            miss_idx: list[int] = []
+            for i, p in enumerate(positions):
+                word = word_cache.get(p)
+                if word is None:
+                    misses.append(p)
+                    miss_idx.append(i)
+                else:
+                    out[i] = word
+            if disk_cache is not None and misses:
+                loaded = load_cached_words(disk_cache, contract.address, cache_bucket, misses)
+                word_cache.update(loaded)
+                still: list[tuple[int, int]] = []
+                for p, i in zip(misses, miss_idx):
+                    if p in loaded:
+                        out[i] = loaded[p]
+                    else:
+                        still.append((p, i))
+                misses = [p for p, _ in still]
+                miss_idx = [i for _, i in still]
+            if total is None:
+                total = len(positions)
+            done += len(positions) - len(misses)
+            fetched: dict[int, int] = {}
+            # batch start offset into misses/miss_idx -> positions in that batch
+            batches = {j: misses[j:j + RPC_BATCH_SIZE] for j in range(0, len(misses), RPC_BATCH_SIZE)}
+
+            def _store(start: int, words: list) -> None:
+                for k, word in enumerate(words):
+                    if word is not None:
+                        p = misses[start + k]
+                        out[miss_idx[start + k]] = word_cache[p] = fetched[p] = word
+
+            if threads <= 1 or len(batches) <= 1:
+                for start, batch in batches.items():
+                    _store(start, _fetch_word_batch(batch))
+                    done += len(batch)
                     _progress_update(label, done, total)
-                _progress_finish()
-                return out
-            with ThreadPoolExecutor(max_workers=max(1, threads)) as ex:
-                futs = {ex.submit(ticktable_word, p): p for p in positions}
-                for fut in as_completed(futs):
-                    p = futs[fut]
+            elif aiohttp is not None:
+                # All batches in flight at once from one event loop (up to --threads
+                # connections); results are stored as each batch completes.
+                async def _fetch_one(http, start: int, batch: list[int]) -> None:
+                    nonlocal done
+                    datas = [SEL_TICK_TABLE + abi_encode(["int16"], [int(p)]) for p in batch]
                     try:
-                        out[p] = fut.result()
+                        raws = await async_rpc_batch_call(http, args.rpc_url, contract.address, datas, block_param)
+                        words = [int.from_bytes(raw[:32], "big") if raw else None for raw in raws]
                     except Exception:
-                        out[p] = 0
-                    done += 1
+                        # Rejected batch: the sync path retries it word by word
+                        words = await asyncio.to_thread(_fetch_word_batch, batch)
+                    _store(start, words)
+                    done += len(batch)
                     _progress_update(label, done, total)
-            _progress_finish()
+
+                async def _fetch_all() -> None:
+                    connector = aiohttp.TCPConnector(limit=max(1, threads))
+                    timeout = aiohttp.ClientTimeout(total=30)
+                    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as http:
+                        await asyncio.gather(*(_fetch_one(http, start, batch) for start, batch in batches.items()))
+
+                asyncio.run(_fetch_all())
+            else:
+                with ThreadPoolExecutor(max_workers=max(1, threads)) as ex:
+                    futs = {ex.submit(_fetch_word_batch, batch): start for start, batch in batches.items()}
+                    for fut in as_completed(futs):
+                        start = futs[fut]
+                        try:
+                            _store(start, fut.result())
+                        except Exception:
+                            pass  # the batch's words stay 0
+                        done += len(batches[start])
+                        _progress_update(label, done, total)
+            if disk_cache is not None:
+                store_cached_words(disk_cache, contract.address, cache_bucket, fetched)
             return out
 
-        def _log_bitmap_word(word_pos: int, bits: int) -> None:
+        def _log_bitmap_word(word_pos: int, word: int, low: int, high: int) -> None:
             if not args.bitmap_verbose:
                 return
-            count = bits.bit_count() if hasattr(int, 'bit_count') else bin(bits).count('1')
+            bits = _mask_range(word, low, high)
+            count = _popcount(bits)
             print(f"[bitmap] word {word_pos}: nonzero={bits!=0} bits={count}")
 
-        def _mask_range(word: int, low: int, high: int) -> int:
-            if high < low:
-                return 0
-            # mask bits [low, high]
-            upper = (1 << (high + 1)) - 1
-            lower = (1 << low) - 1
-            return word & (upper ^ lower)
-
-        def scan_bitmap_up(base_word: int, start_bit: int, max_words: int, min_liq: int, limit: int) -> (list[dict], dict):
-            """Find initialized ticks >= current (upwards) using raw tick words. Returns (results, stats)."""
+        def _word_batches(positions: Sequence[int], limit: int):
+            # With a result limit (e.g. --nearest K), fetch words outward from the
+            # current one in growing batches (1, 2, 4, ... up to --threads) and let
+            # the caller stop once K boundaries are found; otherwise fetch all at once.
+            if not limit:
+                yield positions
+                return
+            cap = max(1, args.threads)
+            size = 1
+            i = 0
+            while i < len(positions):
+                yield positions[i:i + size]
+                i += size
+                size = min(size * 2, cap)
+
+        def _scan_bitmap(base_word: int, start_bit: int, max_words: int, min_liq: int, limit: int,
+                         descending: bool) -> (list[dict], dict):
             stats = {"words_scanned": 0, "nonzero_words": 0, "bits_seen": 0}
             results: list[dict] = []
-            min_word = MIN_TICK // 256
-            max_word = MAX_TICK // 256
-            end_wp = min(base_word + max_words, max_word)
-            positions = [wp for wp in range(base_word, end_wp + 1)]
-            words_map = _fetch_words_parallel(positions, args.threads, label="bitmap-up")
-            for i, wp in enumerate(positions):
-                word = int(words_map.get(wp, 0))
-                stats["words_scanned"] += 1
-                if word:
-                    stats["nonzero_words"] += 1
-                # Allowed bits within int24 range
-                allowed_low = 0
-                allowed_high = 255
-                # honor start_bit for first word
-                if i == 0:
-                    allowed_low = max(allowed_low, start_bit)
-                bits = _mask_range(word, allowed_low, allowed_high)
-                _log_bitmap_word(wp, bits)
-
-                while bits and (not limit or len(results) < limit):
-                    lsb = bits & -bits
-                    pos = lsb.bit_length() - 1
-                    stats["bits_seen"] += 1
-                    tau = wp * 256 + pos
-                    # Algebra: typically only ticks aligned to tickSpacing are valid boundaries
-                    if tau % tick_spacing != 0 or tau < MIN_TICK or tau > MAX_TICK:
-                        bits ^= lsb
-                        continue
-                    t = tau
-                    info = read_tick(t)
-                    # Treat as valid if liquidityTotal>0 or neighbors (prev/next) suggest presence
-                    if int(info.get("liquidityTotal", 0)) >= min_liq:
-                        results.append(info)
-                    bits ^= lsb
+            for t, info in iter_initialized_ticks(base_word, start_bit, max_words, limit, descending, stats):
+                stats["bits_seen"] += 1
+                if info is None:
+                    raise RuntimeError(f"ticks({t}) call failed")
+                # Treat as valid if liquidityTotal>0 or neighbors (prev/next) suggest presence
+                if int(info.get("liquidityTotal", 0)) >= min_liq:
+                    results.append(info)
+                    # Stop before the generator fetches another batch
                     if limit and len(results) >= limit:
                         break
+            _progress_finish()
             return results, stats
 
+        def scan_bitmap_up(base_word: int, start_bit: int, max_words: int, min_liq: int, limit: int) -> (list[dict], dict):
+            """Find initialized ticks >= current (upwards) using raw tick words. Returns (results, stats)."""
+            return _scan_bitmap(base_word, start_bit, max_words, min_liq, limit, descending=False)
+
         def scan_bitmap_down(base_word: int, start_bit: int, max_words: int, min_liq: int, limit: int) -> (list[dict], dict):
             """Find initialized ticks <= current (downwards) using raw tick words. Returns (results, stats)."""
-            stats = {"words_scanned": 0, "nonzero_words": 0, "bits_seen": 0}
-            results: list[dict] = []
-            min_word = MIN_TICK // 256
-            start_wp = max(base_word - max_words, min_word)
-            positions = [wp for wp in range(base_word, start_wp - 1, -1)]
-            words_map = _fetch_words_parallel(positions, args.threads, label="bitmap-down")
-            for i, wp in enumerate(positions):
-                word = int(words_map.get(wp, 0))
+            return _scan_bitmap(base_word, start_bit, max_words, min_liq, limit, descending=True)
+
+        def iter_initialized_ticks(base_word: int, start_bit: int, max_words: int, limit: int,
+                                   descending: bool, stats: dict):
+            """Yield (tick, info) for bitmap candidate ticks in scan order, nearest first.
+
+            Words are fetched batch by batch as the caller consumes (see _word_batches),
+            and `stats` counts the words scanned. Ticks are read through the shared
+            cache, so a repeated traversal of the same range costs no RPC.
+            """
+            if descending:
+                positions = range(base_word, max(base_word - max_words, MIN_TICK // 256) - 1, -1)
+            else:
+                positions = range(base_word, min(base_word + max_words, MAX_TICK // 256) + 1)
+            label = "bitmap-down" if descending else "bitmap-up"
+            done = 0
+            for batch in _word_batches(positions, limit):
+                words = _fetch_words_parallel(batch, args.threads, label=label, done=done, total=len(positions))
+                done += len(batch)
+                candidates = _batch_candidates(batch, words, positions[0], start_bit, descending, stats)
+                yield from zip(candidates, read_ticks(candidates))
+
+        def _batch_candidates(batch, words, first_wp, start_bit, descending, stats) -> list[int]:
+            # honor start_bit for the first word (lower bound up, upper bound down);
+            # all words are masked together
+            low, high = (0, start_bit) if descending else (start_bit, 255)
+            if batch[0] != first_wp:
+                low, high = 0, 255
+            # Ticks come back in scan order: the down scan walks each word from the MSB
+            # (nearest first below the current tick)
+            batch_ticks = _words_ticks(batch, words, tick_spacing, low, high, descending)
+            candidates: list[int] = []
+            for i, wp in enumerate(batch):
+                word = words[i]
                 stats["words_scanned"] += 1
                 if word:
                     stats["nonzero_words"] += 1
-                # Allowed bits within int24 range
-                allowed_low = 0
-                allowed_high = 255
-                # honor start_bit for first word upper bound
-                if i == 0:
-                    allowed_high = min(allowed_high, start_bit)
-                bits = _mask_range(word, allowed_low, allowed_high)
-                _log_bitmap_word(wp, bits)
-
-                while bits and (not limit or len(results) < limit):
-                    pos = bits.bit_length() - 1  # MSB index
-                    stats["bits_seen"] += 1
-                    tau = wp * 256 + pos
-                    if tau % tick_spacing != 0 or tau < MIN_TICK or tau > MAX_TICK:
-                        bits ^= (1 << pos)
-                        continue
-                    t = tau
-                    info = read_tick(t)
-                    if int(info.get("liquidityTotal", 0)) >= min_liq:
-                        results.append(info)
-                    bits ^= (1 << pos)
-                    if limit and len(results) >= limit:
-                        break
-            return results, stats
+                _log_bitmap_word(wp, word, *((low, high) if i == 0 else (0, 255)))
+                # Algebra: typically only ticks aligned to tickSpacing are valid boundaries
+                candidates.extend(batch_ticks[i])
+            return candidates
 
         # Compute base tick on spacing grid
         base_tick = (current_tick // tick_spacing) * tick_spacing
@@ -608,7 +1203,7 @@ def main():
                         "above": up_stats,
                         "below": down_stats,
                     }
-                print(json.dumps(results, indent=2))
+                print(dumps_json(results))
             else:
                 print(f"Current tick: {current_tick} (base {base_tick}), spacing {tick_spacing}")
                 if args.use_bitmap:
@@ -631,7 +1226,16 @@ def main():
         if args.scan:
             print("Scanning around current tick for initialized ticks…")
             ticks_out: list[dict] = []
-            seen = set()
+            # Seen ticks as a bit per grid slot, indexed by (tick - MIN_TICK) // tick_spacing
+            seen = bytearray(((MAX_TICK - MIN_TICK) // tick_spacing >> 3) + 1)
+
+            def _seen(t: int) -> bool:
+                i = (t - MIN_TICK) // tick_spacing
+                return bool(seen[i >> 3] & (1 << (i & 7)))
+
+            def _mark_seen(t: int) -> None:
+                i = (t - MIN_TICK) // tick_spacing
+                seen[i >> 3] |= 1 << (i & 7)
 
             if args.use_bitmap:
                 base_word = current_tick // 256
@@ -642,7 +1246,7 @@ def main():
                     center_info = read_tick(base_tick)
                     if center_info["initialized"] and center_info["liquidityTotal"] >= args.min_liq_total:
                         ticks_out.append(center_info)
-                        seen.add(base_tick)
+                        _mark_seen(base_tick)
 
                 if args.direction in ("both", "up"):
                     up_infos, up_stats = scan_bitmap_up(
@@ -650,9 +1254,9 @@ def main():
                         0 if args.max_results == 0 else max(0, args.max_results - len(ticks_out))
                     )
                     for info in up_infos:
-                        if info["tick"] not in seen:
+                        if not _seen(info["tick"]):
                             ticks_out.append(info)
-                            seen.add(info["tick"])
+                            _mark_seen(info["tick"])
                         if args.max_results and len(ticks_out) >= args.max_results:
                             break
                 if not (args.max_results and len(ticks_out) >= args.max_results) and args.direction in ("both", "down"):
@@ -661,9 +1265,9 @@ def main():
                         0 if args.max_results == 0 else max(0, args.max_results - len(ticks_out))
                     )
                     for info in down_infos:
-                        if info["tick"] not in seen:
+                        if not _seen(info["tick"]):
                             ticks_out.append(info)
-                            seen.add(info["tick"])
+                            _mark_seen(info["tick"])
                         if args.max_results and len(ticks_out) >= args.max_results:
                             break
             else:
@@ -671,7 +1275,7 @@ def main():
                 center_info = read_tick(base_tick)
                 if center_info["initialized"] and center_info["liquidityTotal"] >= args.min_liq_total:
                     ticks_out.append(center_info)
-                    seen.add(base_tick)
+                    _mark_seen(base_tick)
 
                 # scan directions per selection
                 directions = []
@@ -690,9 +1294,9 @@ def main():
                         args.threads,
                     )
                     for info in infos:
-                        if info["tick"] not in seen:
+                        if not _seen(info["tick"]):
                             ticks_out.append(info)
-                            seen.add(info["tick"])
+                            _mark_seen(info["tick"])
                         if args.max_results and len(ticks_out) >= args.max_results:
                             break
                     if args.max_results and len(ticks_out) >= args.max_results:
@@ -703,7 +1307,7 @@ def main():
 
             if args.json:
                 print(
-                    json.dumps(
+                    dumps_json(
                         {
                             "current_tick": current_tick,
                             "base_tick": base_tick,
@@ -715,8 +1319,7 @@ def main():
                                     "below": down_stats if 'down_stats' in locals() else None,
                                 }
                               } if args.use_bitmap else {})
-                        },
-                        indent=2,
+                        }
                     )
                 )
             else:
@@ -7,6 +7,8 @@ import json
 import time
 import requests
 from eth_abi import encode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 def encode_constructor_args(deployer_address):
     """Encode constructor arguments for verification."""
@@ -14,6 +16,15 @@ def encode_constructor_args(deployer_address):
     encoded = encode(['address'], [deployer_address])
     return encoded.hex()
 
+def make_session():
+    """Keep-alive session reused for the submit and every status check."""
+    session = requests.Session()
+    # POST is not in Retry's default allowed_methods, so a submit is never resent;
+    # a 429 that outlasts the retries is returned so the poll loop can honor Retry-After
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=retry))
+    return session
+
 def main():
     # Load deployment info
     try:
@@ -29,9 +40,7 @@ def main():
     print(f"🔍 Verifying contract: {contract_address}")
     print(f"👤 Deployer: {deployer_address}")
     
-    # Read contract source
-    with open('contracts/FutarchyArbitrageExecutorV2.sol') as f:
-        source_code = f.read()
+    source_path = 'contracts/FutarchyArbitrageExecutorV2.sol'
     
     # Check API key
     api_key = os.environ.get('GNOSISSCAN_API_KEY', '')
@@ -50,7 +59,6 @@ def main():
         'module': 'contract',
         'action': 'verifysourcecode',
         'contractaddress': contract_address,
-        'sourceCode': source_code,
         'codeformat': 'solidity-single-file',
         'contractname': 'FutarchyArbitrageExecutorV2',
         'compilerversion': 'v0.8.19+commit.7dd6d404',
@@ -63,9 +71,18 @@ def main():
     # Submit verification
     print("\n📤 Submitting verification...")
     api_url = "https://api.gnosisscan.io/api"
+    session = make_session()
     
     try:
-        response = requests.post(api_url, data=verification_data)
+        # Source goes as a multipart field rather than urlencoded with the rest
+        # (no %XX expansion of the flattened source); no filename, so the API
+        # reads it as a form value, not a file upload
+        with open(source_path, 'rb') as source_file:
+            response = session.post(
+                api_url,
+                data=verification_data,
+                files={'sourceCode': (None, source_file)},
+            )
         result = response.json()
         
         if result['status'] != '1':
@@ -76,29 +93,41 @@ def main():
         guid = result['result']
         print(f"✅ Submitted! GUID: {guid}")
         
-        # Check status
+        # Check status: poll soon, then back off (x1.5, capped at 8s) until a terminal result
         print("⏳ Checking status...")
-        for i in range(12):
-            time.sleep(5)
-            
-            check_data = {
-                'apikey': api_key,
-                'module': 'contract',
-                'action': 'checkverifystatus',
-                'guid': guid
-            }
-            
-            check_response = requests.get(api_url, params=check_data)
-            check_result = check_response.json()
+        check_data = {
+            'apikey': api_key,
+            'module': 'contract',
+            'action': 'checkverifystatus',
+            'guid': guid
+        }
+        delay = 1.5
+        deadline = time.monotonic() + 90
+        while True:
+            time.sleep(delay)
+            delay = min(delay * 1.5, 8.0)
             
-            print(f"Status: {check_result.get('result', 'Unknown')}")
+            check_response = session.get(api_url, params=check_data)
+            if check_response.status_code == 429:
+                # Rate limited: wait as long as the API asks before the next poll
+                retry_after = check_response.headers.get('Retry-After', '')
+                if retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+            else:
+                check_result = check_response.json()
+                status_text = check_result.get('result', 'Unknown')
+                print(f"Status: {status_text}")
+                
+                if check_result['status'] == '1' or status_text.startswith('Pass'):
+                    print(f"\n✅ Contract verified successfully!")
+                    print(f"🔗 View: https://gnosisscan.io/address/{contract_address}#code")
+                    break
+                elif 'fail' in status_text.lower():
+                    print(f"❌ Verification failed: {status_text}")
+                    break
             
-            if check_result['status'] == '1':
-                print(f"\n✅ Contract verified successfully!")
-                print(f"🔗 View: https://gnosisscan.io/address/{contract_address}#code")
-                break
-            elif 'fail' in check_result.get('result', '').lower():
-                print(f"❌ Verification failed: {check_result.get('result')}")
+            if time.monotonic() + delay > deadline:
+                print("⌛ Still pending after 90s; check Gnosisscan later")
                 break
                 
     except Exception as e:
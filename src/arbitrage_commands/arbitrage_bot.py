@@ -10,19 +10,33 @@ Usage:
         --env .env.0x9590dAF4d5cd4009c3F9767C5E7668175cFd37CF \
         --amount 0.01 \
         --interval 120 \
+        --block-stride 1 \
         --tolerance 0.04 \
         --min-profit -0.01 \
         --dry-run
+
+Trades run in-process through src.executor.arbitrage_executor.execute();
+``--isolate`` runs the executor in a separate long-lived worker process instead
+(useful for debugging).
+
+With WSS_URL set (and the ``websockets`` package installed) each check is
+triggered by a new block header instead of a fixed sleep; ``--interval`` then
+only caps how long the bot waits for a block.
 """
 
 from __future__ import annotations
 
 import argparse
+import glob
+import json
 import os
 import sys
 import time
 import subprocess
-import re
+import threading
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from decimal import Decimal
 from pathlib import Path
 from typing import Any
@@ -32,20 +46,108 @@ from web3 import Web3
 from eth_account import Account
 
 from helpers.swapr_price import get_pool_price as swapr_price
+from helpers.swapr_price import build_calls as swapr_calls
+from helpers.swapr_price import state_call as swapr_state_call
+from helpers.swapr_price import token_calls as swapr_token_calls
+from helpers.swapr_price import price_from_state as swapr_price_from_state
 from helpers.balancer_price import get_pool_price as bal_price
+from helpers.balancer_price import build_calls as bal_calls
+from helpers.balancer_price import price_from_state as bal_price_from_state
+from helpers.multicall import aggregate3, fn_call
+from helpers import new_heads
+from config.abis import ERC20_ABI
 from config.network import DEFAULT_RPC_URLS
 
+# Minimal ERC20 ABI for balance checking
+ERC20_MIN_ABI = [
+    {
+        "constant": True,
+        "inputs": [{"name": "owner", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "decimals",
+        "outputs": [{"name": "", "type": "uint8"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+# balanceOf(address) selector; calldata is this + the 32-byte left-padded holder
+BALANCE_OF_SELECTOR = bytes(Web3.keccak(text="balanceOf(address)")[:4])
+
+
+def _balance_of_data(holder: str) -> bytes:
+    return BALANCE_OF_SELECTOR + bytes.fromhex(holder[2:].rjust(64, "0"))
+
+
+def _decode_uint256(raw: bytes) -> int:
+    return int.from_bytes(bytes(raw[:32]), "big")
+
+# Executor address resolved from deployments/, cached across restarts and keyed
+# on the newest deployment file (path, mtime and size), so edits invalidate it too
+DEPLOYMENTS_GLOB = "deployments/deployment_executor_v5_*.json"
+EXECUTOR_ADDR_CACHE = Path.home() / ".cache" / "futarchy_arb" / "executor_v5_addr.json"
+
+# Seconds a trade may take, in-process or in the --isolate worker
+EXECUTOR_TIMEOUT = 120
+
+# Price snapshots kept per block number (see ArbitrageBot.fetch_prices)
+PRICE_CACHE_SIZE = 128
+
+# Opportunity detection runs on Q64 fixed-point ints (value * 2**64) so float
+# rounding cannot flip a comparison near the tolerance boundary
+Q64 = 1 << 64
+
+
+def _to_q64(value: Decimal) -> int:
+    return int(Decimal(value) * Q64)
+
+
+@lru_cache(maxsize=None)
+def _tolerance_q64(tolerance: float) -> int:
+    # str() first so 0.04 means 0.04, not its binary float approximation
+    return _to_q64(Decimal(str(tolerance)))
+
+
 
 class ArbitrageBot:
     """Monitors and executes futarchy arbitrage opportunities."""
     
-    def __init__(self, env_file: str | None = None):
+    def __init__(self, env_file: str | None = None, isolate: bool = False, verbose: bool = False,
+                 dry_run: bool = False):
         """Initialize the bot with environment configuration."""
+        self.isolate = isolate
+        self.verbose = verbose
+        self.dry_run = dry_run
+        # Immutable per-pool metadata, filled on the first price read:
+        # Swapr pool -> (token0, token1, dec0, dec1, base_token_index),
+        # Balancer pool -> {token: decimals}
+        self._pool_meta: dict[str, Any] = {}
+        # block number -> fetch_prices result, LRU order
+        self._price_cache: OrderedDict[int, dict] = OrderedDict()
+        # Steady-state aggregate3 calls, built once the pool metadata is known
+        self._state_calls: list | None = None
+        # Worker threads for the per-call fallbacks when Multicall3 is unavailable
+        self._fallback_pool = ThreadPoolExecutor(max_workers=12)
+        # --isolate: long-lived executor process, see _executor_worker
+        self._worker: subprocess.Popen | None = None
+        # In-process trades run on their own thread so they can be given up on
+        # after EXECUTOR_TIMEOUT; _exec_future is the latest one
+        self._exec_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="executor")
+        self._exec_future = None
+        # newHeads subscription driving run_loop (None when polling)
+        self._heads: new_heads.NewHeadsListener | None = None
         self.load_environment(env_file)
-        self.w3 = self.create_web3()
+        # Configuration errors surface before any RPC traffic; self.w3, the
+        # token contracts and their decimals are set up on first use
         self.validate_environment()
         self.setup_account()
-        self.setup_token_contracts()
         
     def load_environment(self, env_file: str | None) -> None:
         """Load environment variables from file."""
@@ -58,8 +160,13 @@ class ArbitrageBot:
         else:
             self.env_file = None
             
+    @cached_property
+    def w3(self) -> Web3:
+        """Web3 connection, created on first access."""
+        return self.create_web3()
+    
     def create_web3(self) -> Web3:
-        """Create Web3 connection."""
+        """Create Web3 connection (dry runs skip the is_connected() round-trip)."""
         rpc_url = os.getenv("RPC_URL", DEFAULT_RPC_URLS[0])
         w3 = Web3(Web3.HTTPProvider(rpc_url))
         
@@ -74,7 +181,7 @@ class ArbitrageBot:
             except Exception:
                 pass
                 
-        if not w3.is_connected():
+        if not self.dry_run and not w3.is_connected():
             raise SystemExit("Failed to connect to RPC")
             
         return w3
@@ -93,43 +200,47 @@ class ArbitrageBot:
     
     def get_executor_address(self) -> str:
         """Get the executor contract address from env or deployment files."""
-        import glob
-        import json
-        
         # Try environment variables first
         executor = os.getenv("FUTARCHY_ARB_EXECUTOR_V5") or os.getenv("EXECUTOR_V5_ADDRESS")
         if executor:
-            return self.w3.to_checksum_address(executor)
+            return Web3.to_checksum_address(executor)
             
-        # Try deployment files
-        deployment_files = sorted(glob.glob("deployments/deployment_executor_v5_*.json"))
+        # Try deployment files (via the on-disk cache while the newest one is unchanged)
+        deployment_files = sorted(glob.glob(DEPLOYMENTS_GLOB))
         if deployment_files:
+            latest = Path(deployment_files[-1]).resolve()
+            try:
+                st = latest.stat()
+                cache_key = f"{latest}:{st.st_mtime_ns}:{st.st_size}"
+            except OSError:
+                cache_key = None
+            if cache_key:
+                try:
+                    cached = json.loads(EXECUTOR_ADDR_CACHE.read_text())
+                    if cached.get("key") == cache_key:
+                        return cached["address"]
+                except Exception:
+                    pass
             try:
-                with open(deployment_files[-1]) as f:
+                with open(latest) as f:
                     data = json.load(f)
                     if data.get("address"):
-                        return self.w3.to_checksum_address(data["address"])
+                        address = Web3.to_checksum_address(data["address"])
+                        if cache_key:
+                            try:
+                                EXECUTOR_ADDR_CACHE.parent.mkdir(parents=True, exist_ok=True)
+                                EXECUTOR_ADDR_CACHE.write_text(json.dumps({"key": cache_key, "address": address}))
+                            except OSError:
+                                pass
+                        return address
             except Exception:
                 pass
                 
         raise SystemExit("Could not determine executor contract address")
         
-    def setup_token_contracts(self) -> None:
-        """Setup token contract interfaces for balance checking."""
-        # Minimal ERC20 ABI for balance checking
-        erc20_abi = [
-            {
-                "constant": True,
-                "inputs": [{"name": "owner", "type": "address"}],
-                "name": "balanceOf",
-                "outputs": [{"name": "", "type": "uint256"}],
-                "stateMutability": "view",
-                "type": "function"
-            }
-        ]
-        
-        # Setup token contracts
-        self.tokens = {}
+    @cached_property
+    def tokens(self) -> dict[str, Any]:
+        """Token contract interfaces for balance checking, created on first use."""
         token_addresses = {
             "sDAI": os.getenv("SDAI_TOKEN_ADDRESS", "0xaf204776c7245bF4147c2612BF6e5972Ee483701"),
             "GNO": os.getenv("COMPANY_TOKEN_ADDRESS", "0x9C58BAcC331c9aa871AFD802DB6379a98e80CEdb"),
@@ -138,13 +249,39 @@ class ArbitrageBot:
             "YES_sDAI": os.getenv("SWAPR_SDAI_YES_ADDRESS"),
             "NO_sDAI": os.getenv("SWAPR_SDAI_NO_ADDRESS")
         }
+        return {
+            name: self.w3.eth.contract(address=self.w3.to_checksum_address(addr), abi=ERC20_MIN_ABI)
+            for name, addr in token_addresses.items()
+            if addr
+        }
+    
+    @cached_property
+    def _token_scale(self) -> dict[str, int]:
+        """10**decimals per token; balances divide by this integer scale.
         
-        for name, addr in token_addresses.items():
-            if addr:
-                self.tokens[name] = self.w3.eth.contract(
-                    address=self.w3.to_checksum_address(addr),
-                    abi=erc20_abi
-                )
+        Decimals are read once, in one Multicall3 round-trip (per-token calls if
+        Multicall3 fails). Only a token without decimals() falls back to 18; an
+        unreachable RPC raises instead of silently assuming 18 everywhere.
+        """
+        try:
+            decimals = aggregate3(
+                self.w3,
+                [fn_call(c.address, ERC20_MIN_ABI, "decimals") for c in self.tokens.values()],
+                allow_failure=True,
+            )
+        except Exception as e:
+            if not self.w3.is_connected():
+                raise SystemExit(f"Failed to connect to RPC: {e}")
+            decimals = []
+            for contract in self.tokens.values():
+                try:
+                    decimals.append(contract.functions.decimals().call())
+                except Exception:
+                    decimals.append(None)
+        return {
+            name: 10 ** (18 if dec is None else dec)
+            for name, dec in zip(self.tokens, decimals)
+        }
         
     def validate_environment(self) -> None:
         """Ensure all required environment variables are set."""
@@ -160,27 +297,54 @@ class ArbitrageBot:
         missing = [var for var in required if not os.getenv(var)]
         if missing:
             raise SystemExit(f"Missing required environment variables: {', '.join(missing)}")
+        
+        # Resolved and checksummed once; fetch_prices reads these every iteration
+        self.pool_addrs = {
+            key: Web3.to_checksum_address(os.environ[var])
+            for key, var in (
+                ("yes", "SWAPR_POOL_YES_ADDRESS"),
+                ("pred_yes", "SWAPR_POOL_PRED_YES_ADDRESS"),
+                ("no", "SWAPR_POOL_NO_ADDRESS"),
+                ("bal", "BALANCER_POOL_ADDRESS"),
+            )
+        }
             
-    def fetch_prices(self) -> dict:
-        """Fetch current prices from all pools."""
-        addr_yes = os.getenv("SWAPR_POOL_YES_ADDRESS")
-        addr_pred_yes = os.getenv("SWAPR_POOL_PRED_YES_ADDRESS")
-        addr_no = os.getenv("SWAPR_POOL_NO_ADDRESS")
-        addr_bal = os.getenv("BALANCER_POOL_ADDRESS")
+    def fetch_prices(self, block_identifier: Any = "latest") -> dict:
+        """Fetch current prices from all pools, all read at *block_identifier*.
         
-        # Fetch Swapr prices (YES and NO pools have GNO as token1)
-        yes_price, yes_base, yes_quote = swapr_price(self.w3, addr_yes)
-        pred_yes_price, _, _ = swapr_price(self.w3, addr_pred_yes)
-        no_price, no_base, no_quote = swapr_price(self.w3, addr_no)
+        Reads pinned to a block number are cached, so sampling the same block
+        twice costs no RPC; ``"latest"`` is always read fresh.
+        """
+        swapr_pools = [self.pool_addrs["yes"], self.pool_addrs["pred_yes"], self.pool_addrs["no"]]
+        addr_bal = self.pool_addrs["bal"]
         
-        # Fetch Balancer price
-        bal_price_val, bal_base, bal_quote = bal_price(self.w3, addr_bal)
+        cache_key = None
+        if isinstance(block_identifier, int):
+            cache_key = block_identifier
+            cached = self._price_cache.get(cache_key)
+            if cached is not None:
+                self._price_cache.move_to_end(cache_key)
+                return dict(cached)
         
-        return {
+        try:
+            quotes = self._read_prices_multicall(swapr_pools, addr_bal, block_identifier)
+        except Exception as e:
+            print(f"Warning: Multicall3 price read failed ({e}); reading pools concurrently")
+            quotes = self._read_prices_concurrent(swapr_pools, addr_bal)
+        
+        # Swapr prices (YES and NO pools have GNO as token1), then Balancer
+        (yes_price, yes_base, yes_quote), (pred_yes_price, _, _), (no_price, no_base, no_quote), \
+            (bal_price_val, bal_base, bal_quote) = quotes
+        
+        prices = {
             "yes_price": float(yes_price),
             "pred_yes_price": float(pred_yes_price),
             "no_price": float(no_price),
             "bal_price": float(bal_price_val),
+            "yes_q64": _to_q64(yes_price),
+            "pred_yes_q64": _to_q64(pred_yes_price),
+            "no_q64": _to_q64(no_price),
+            "bal_q64": _to_q64(bal_price_val),
             "yes_base": yes_base,
             "yes_quote": yes_quote,
             "no_base": no_base,
@@ -188,12 +352,83 @@ class ArbitrageBot:
             "bal_base": bal_base,
             "bal_quote": bal_quote
         }
+        if cache_key is not None:
+            self._price_cache[cache_key] = prices
+            while len(self._price_cache) > PRICE_CACHE_SIZE:
+                self._price_cache.popitem(last=False)
+            return dict(prices)
+        return prices
+    
+    def _read_prices_multicall(self, swapr_pools: list[str], addr_bal: str,
+                               block_identifier: Any = "latest") -> list[tuple]:
+        """(price, base, quote) per Swapr pool, then Balancer, in one Multicall3 round-trip.
+        
+        Token addresses, decimals and base-token orientation never change for a
+        pool, so they are read once (see ``_read_prices_and_meta``) and reused.
+        """
+        if any(addr not in self._pool_meta for addr in (*swapr_pools, addr_bal)):
+            return self._read_prices_and_meta(swapr_pools, addr_bal, block_identifier)
+        
+        if self._state_calls is None:
+            self._state_calls = [swapr_state_call(self.w3, addr) for addr in swapr_pools]
+            self._state_calls += bal_calls(self.w3, addr_bal)
+        state = aggregate3(self.w3, self._state_calls, block_identifier=block_identifier)
+        
+        quotes = []
+        for addr, sqrt_price_x96 in zip(swapr_pools, state):
+            token0, token1, dec0, dec1, base_index = self._pool_meta[addr]
+            quotes.append(swapr_price_from_state(
+                addr, sqrt_price_x96, token0, token1, dec0, dec1, base_token_index=base_index
+            ))
+        bal_tokens, bal_balances = state[-1]
+        quotes.append(bal_price_from_state(bal_tokens, bal_balances, self._pool_meta[addr_bal]))
+        return quotes
+    
+    def _read_prices_and_meta(self, swapr_pools: list[str], addr_bal: str,
+                              block_identifier: Any = "latest") -> list[tuple]:
+        """First read: prices plus pool metadata, in two Multicall3 round-trips."""
+        # Round 1: pool state - (sqrtPriceX96, token0, token1) per Swapr pool
+        # and (tokens, balancesRaw) for the Balancer pool
+        calls = [c for addr in swapr_pools for c in swapr_calls(self.w3, addr)]
+        calls += bal_calls(self.w3, addr_bal)
+        state = aggregate3(self.w3, calls, block_identifier=block_identifier)
+        swapr_states = [state[i:i + 3] for i in range(0, 3 * len(swapr_pools), 3)]
+        bal_tokens, bal_balances = state[-1]
         
+        # Round 2: token decimals, plus names for Swapr base-token detection
+        calls = [c for _, token0, token1 in swapr_states for c in swapr_token_calls(token0, token1)]
+        calls += [fn_call(t, ERC20_ABI, "decimals") for t in bal_tokens[:2]]
+        meta = aggregate3(self.w3, calls, allow_failure=True, block_identifier=block_identifier)
+        
+        quotes = []
+        for k, (addr, (sqrt_price_x96, token0, token1)) in enumerate(zip(swapr_pools, swapr_states)):
+            dec0, dec1, name0, name1 = meta[4 * k:4 * k + 4]
+            quote = swapr_price_from_state(addr, sqrt_price_x96, token0, token1, dec0, dec1,
+                                           name0=name0, name1=name1)
+            self._pool_meta[addr] = (token0, token1, dec0, dec1, 0 if quote[1] == token0 else 1)
+            quotes.append(quote)
+        bal_decimals = dict(zip(bal_tokens[:2], meta[4 * len(swapr_pools):]))
+        quotes.append(bal_price_from_state(bal_tokens, bal_balances, bal_decimals))
+        self._pool_meta[addr_bal] = bal_decimals
+        return quotes
+    
+    def _read_prices_concurrent(self, swapr_pools: list[str], addr_bal: str) -> list[tuple]:
+        """Fallback without Multicall3: the four per-pool price reads overlap on a thread pool.
+
+        The per-pool helpers always read the latest block.
+        """
+        futures = [self._fallback_pool.submit(swapr_price, self.w3, addr) for addr in swapr_pools]
+        futures.append(self._fallback_pool.submit(bal_price, self.w3, addr_bal))
+        return [f.result() for f in futures]
+        
+    def calculate_ideal_price_q64(self, prices: dict) -> int:
+        """Ideal Balancer price based on prediction market, as a Q64 fixed-point int."""
+        pred_yes = prices["pred_yes_q64"]
+        return (pred_yes * prices["yes_q64"] + (Q64 - pred_yes) * prices["no_q64"]) >> 64
+    
     def calculate_ideal_price(self, prices: dict) -> float:
         """Calculate the ideal Balancer price based on prediction market."""
-        ideal = prices["pred_yes_price"] * prices["yes_price"] + \
-                (1.0 - prices["pred_yes_price"]) * prices["no_price"]
-        return ideal
+        return self.calculate_ideal_price_q64(prices) / Q64
         
     def determine_opportunity(self, prices: dict, tolerance: float) -> tuple[str | None, str | None]:
         """
@@ -202,53 +437,99 @@ class ArbitrageBot:
         Returns:
             (flow, cheaper): 'sell'/'buy' and 'yes'/'no', or (None, None) if no opportunity
         """
-        ideal_price = self.calculate_ideal_price(prices)
+        ideal_q64 = self.calculate_ideal_price_q64(prices)
+        bal_q64 = prices["bal_q64"]
+        deviation_q64 = abs(bal_q64 - ideal_q64)
+        
+        below_tolerance = deviation_q64 < _tolerance_q64(tolerance)
+        
+        # Floats below are for display only
+        deviation = deviation_q64 / Q64
+        if below_tolerance and not self.verbose:
+            print(f"{time.strftime('%H:%M:%S')} no opportunity: deviation {deviation:.4g} < tolerance {tolerance:.4g}")
+            return None, None
+        ideal_price = ideal_q64 / Q64
         bal_price = prices["bal_price"]
-        deviation = abs(bal_price - ideal_price)
+        yes_price, no_price = prices["yes_price"], prices["no_price"]
         
         print(f"\nPrice Analysis:")
-        print(f"  YES price:       {prices['yes_price']:.6f}")
-        print(f"  NO price:        {prices['no_price']:.6f}")
+        print(f"  YES price:       {yes_price:.6f}")
+        print(f"  NO price:        {no_price:.6f}")
         print(f"  Prediction YES:  {prices['pred_yes_price']:.6f}")
         print(f"  Balancer price:  {bal_price:.6f}")
         print(f"  Ideal price:     {ideal_price:.6f}")
         print(f"  Deviation:       {deviation:.6f} ({deviation/ideal_price*100:.2f}%)")
         
-        if deviation < tolerance:
+        if below_tolerance:
             print(f"  → No opportunity (deviation {deviation:.6f} < tolerance {tolerance:.6f})")
             return None, None
             
         # Determine flow direction
-        if bal_price > ideal_price:
+        if bal_q64 > ideal_q64:
             flow = "buy"  # Buy conditionals cheap, merge, sell composite high
             print(f"  → BUY opportunity: Balancer overpriced by {bal_price - ideal_price:.6f}")
         else:
             flow = "sell"  # Buy composite cheap, split, sell conditionals high
             print(f"  → SELL opportunity: Balancer underpriced by {ideal_price - bal_price:.6f}")
             
-        # Determine which conditional is cheaper
-        if prices["yes_price"] < prices["no_price"]:
-            cheaper = "yes"
-            print(f"  → YES is cheaper ({prices['yes_price']:.6f} < {prices['no_price']:.6f})")
-        else:
-            cheaper = "no"
-            print(f"  → NO is cheaper ({prices['no_price']:.6f} < {prices['yes_price']:.6f})")
+        # Determine which conditional is cheaper (index 1 when YES is)
+        yes_cheaper = prices["yes_q64"] < prices["no_q64"]
+        cheaper = ("no", "yes")[yes_cheaper]
+        low, high = ((no_price, yes_price), (yes_price, no_price))[yes_cheaper]
+        print(f"  → {cheaper.upper()} is cheaper ({low:.6f} < {high:.6f})")
             
         return flow, cheaper
         
+    def get_balances_multi(self, addresses: list[str]) -> dict[str, dict[str, float]]:
+        """Token balances for several addresses in one Multicall3 round-trip.
+        
+        Returns {address: {token_name: balance}}; falls back to per-call reads
+        if the aggregate call itself fails.
+        """
+        pairs = [(addr, name) for addr in addresses for name in self.tokens]
+        calls = [
+            (self.tokens[name].address, _balance_of_data(addr), _decode_uint256)
+            for addr, name in pairs
+        ]
+        try:
+            results = aggregate3(self.w3, calls, allow_failure=True)
+        except Exception:
+            return self._get_balances_per_call(addresses)
+        
+        balances: dict[str, dict[str, float]] = {addr: {} for addr in addresses}
+        for (addr, name), balance_wei in zip(pairs, results):
+            if balance_wei is None:
+                print(f"Warning: Could not fetch {name} balance")
+                balances[addr][name] = 0.0
+            else:
+                balances[addr][name] = balance_wei / self._token_scale[name]
+        return balances
+        
     def get_balances(self, address: str | None = None) -> dict:
         """Get current token balances for the specified address (defaults to executor contract)."""
         target_address = address or self.executor_address
-        balances = {}
-        for name, contract in self.tokens.items():
-            if contract:
-                try:
-                    balance_wei = contract.functions.balanceOf(target_address).call()
-                    balance_ether = self.w3.from_wei(balance_wei, 'ether')
-                    balances[name] = float(balance_ether)
-                except Exception as e:
-                    print(f"Warning: Could not fetch {name} balance: {e}")
-                    balances[name] = 0.0
+        return self.get_balances_multi([target_address])[target_address]
+    
+    def _balance_of(self, token_address: str, holder: str) -> int:
+        """balanceOf via a raw eth_call on pre-encoded calldata (no ContractFunction)."""
+        raw = self.w3.eth.call({"to": token_address, "data": _balance_of_data(holder)})
+        return _decode_uint256(raw)
+    
+    def _get_balances_per_call(self, addresses: list[str]) -> dict[str, dict[str, float]]:
+        """Fallback for get_balances_multi: one eth_call per (address, token), all in flight at once."""
+        futures = {
+            (addr, name): self._fallback_pool.submit(self._balance_of, contract.address, addr)
+            for addr in addresses
+            for name, contract in self.tokens.items()
+            if contract
+        }
+        balances: dict[str, dict[str, float]] = {addr: {} for addr in addresses}
+        for (addr, name), future in futures.items():
+            try:
+                balances[addr][name] = future.result() / self._token_scale[name]
+            except Exception as e:
+                print(f"Warning: Could not fetch {name} balance: {e}")
+                balances[addr][name] = 0.0
         return balances
     
     def get_wallet_balances(self) -> dict:
@@ -272,105 +553,185 @@ class ArbitrageBot:
         if warnings:
             print("\n" + "\n".join(warnings))
     
-    def parse_tx_hash(self, output: str) -> str | None:
-        """Parse transaction hash from executor output."""
-        # Look for patterns like "Tx sent: 0x..." or "Tx sent: abc123..."
-        patterns = [
-            r"Tx sent:\s*(?:0x)?([a-fA-F0-9]{64})",
-            r"Transaction hash:\s*(?:0x)?([a-fA-F0-9]{64})",
-            r"tx:\s*(?:0x)?([a-fA-F0-9]{64})"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, output, re.IGNORECASE)
-            if match:
-                tx_hash = match.group(1)
-                # Ensure it starts with 0x
-                if not tx_hash.startswith('0x'):
-                    tx_hash = '0x' + tx_hash
-                return tx_hash
-        return None
-    
     def execute_arbitrage(self, flow: str, cheaper: str, amount: float, 
                          min_profit: float, dry_run: bool, prefund: bool) -> tuple[bool, str | None]:
         """
         Execute arbitrage trade via the arbitrage_executor module.
+
+        The in-process call is abandoned after EXECUTOR_TIMEOUT seconds; the
+        worker thread can't be stopped, so no new trade starts until it returns.
         
         Returns:
             (success, tx_hash): True if execution was successful and optional transaction hash
         """
-        # Build command for arbitrage_executor
-        cmd = [
-            sys.executable, "-m", "src.executor.arbitrage_executor",
-            "--flow", flow,
-            "--amount", str(amount),
-            "--cheaper", cheaper,
-            "--min-profit", str(min_profit)
-        ]
+        if self.isolate:
+            return self._execute_arbitrage_subprocess(flow, cheaper, amount, min_profit, dry_run, prefund)
         
-        if self.env_file:
-            cmd.extend(["--env", self.env_file])
-            
-        if prefund:
-            cmd.append("--prefund")
+        if dry_run:
+            print(f"\n[DRY RUN] Would execute: {flow.upper()} flow, {cheaper.upper()} cheaper, "
+                  f"{amount} sDAI, min profit {min_profit}{' (prefund)' if prefund else ''}")
+            return True, None
+        
+        from src.executor.arbitrage_executor import execute
+        
+        if self._exec_future is not None and not self._exec_future.done():
+            print("✗ Previous trade has not returned yet; skipping this trade")
+            return False, None
+
+        print(f"\nExecuting arbitrage: {flow.upper()} flow, {cheaper.upper()} cheaper")
+        self._exec_future = self._exec_pool.submit(
+            execute, flow, cheaper, amount, min_profit, execute=True, prefund=prefund,
+            w3=self.w3, account=self.account, address=self.executor_address
+        )
+        try:
+            result = self._exec_future.result(timeout=EXECUTOR_TIMEOUT)
+        except FuturesTimeout:
+            print("✗ Trade execution timed out")
+            return False, None
+        return self._report_execution(result.success, result.tx_hash, result.error)
+    
+    def _report_execution(self, ok: bool, tx_hash: str | None, error: str | None) -> tuple[bool, str | None]:
+        """Print the outcome of an executor run and return (success, tx_hash)."""
+        if ok:
+            print("✓ Trade executed successfully")
+            if tx_hash:
+                print(f"🔗 View on GnosisScan: https://gnosisscan.io/tx/{tx_hash}")
+            return True, tx_hash
+        # Check if it's a "min profit not met" error which is expected
+        if "min profit not met" in (error or ""):
+            print("⚠️  Trade skipped: Min profit threshold not met")
+        else:
+            print("✗ Trade failed")
+            error_lines = (error or "").strip().splitlines()
+            if error_lines:
+                print(f"   Error: {error_lines[-1]}")
+        return False, None
+    
+    def _executor_worker(self) -> subprocess.Popen:
+        """The ``--isolate`` executor process, (re)started on demand.
+
+        One ``arbitrage_executor --serve`` child handles every trade, so the
+        interpreter start-up and RPC connect are paid once, not per trade. Its
+        stderr (where the executor's prints and tracebacks go) is the bot's own.
 
-        # Default executor behavior is preview-only; add --execute for live runs
-        if not dry_run:
-            cmd.append("--execute")
+        The child inherits the env this bot already loaded (see load_environment)
+        and is not given ``--env``, whose override=True would let the file beat
+        the shell here but not in-process.
+        """
+        if self._worker is None or self._worker.poll() is not None:
+            cmd = [sys.executable, "-m", "src.executor.arbitrage_executor", "--serve"]
+            print(f"Starting executor worker: {' '.join(cmd)}")
+            self._worker = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1,
+            )
+        return self._worker
+
+    def _discard_worker(self) -> int | None:
+        """Kill (if needed) and reap the worker so the next trade starts a new one."""
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return None
+        if worker.poll() is None:
+            worker.kill()
+        return worker.wait()
+    
+    def close(self) -> None:
+        """Release the fallback and executor threads, the newHeads listener and the ``--isolate`` worker."""
+        self._fallback_pool.shutdown(wait=False)
+        self._exec_pool.shutdown(wait=False)
+        if self._heads is not None:
+            self._heads.stop()
+            self._heads = None
+        worker, self._worker = self._worker, None
+        if worker is not None and worker.poll() is None:
+            worker.stdin.close()  # the worker exits at EOF
+            try:
+                worker.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                worker.kill()
+    
+    def _execute_arbitrage_subprocess(self, flow: str, cheaper: str, amount: float,
+                                      min_profit: float, dry_run: bool, prefund: bool) -> tuple[bool, str | None]:
+        """Run the trade in the executor worker process (``--isolate``).
+        
+        Each trade is one JSON request line to the worker's stdin and one JSON
+        result line back.
+        """
+        request = {
+            "flow": flow,
+            "cheaper": cheaper,
+            "amount": str(amount),
+            "min_profit": str(min_profit),
+            "execute": not dry_run,
+            "prefund": prefund,
+        }
 
         if dry_run:
-            print(f"\n[DRY RUN] Would execute: {' '.join(cmd)}")
+            print(f"\n[DRY RUN] Would send to executor worker: {json.dumps(request)}")
             return True, None
             
         print(f"\nExecuting arbitrage: {flow.upper()} flow, {cheaper.upper()} cheaper")
-        print(f"Command: {' '.join(cmd)}")
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120  # 2 minute timeout
-            )
-            
-            # Parse transaction hash from output
-            tx_hash = self.parse_tx_hash(result.stdout)
+            worker = self._executor_worker()
+            try:
+                worker.stdin.write(json.dumps(request) + "\n")
+                worker.stdin.flush()
+            except OSError:
+                # The worker died since the last trade (broken pipe): start a new one
+                self._discard_worker()
+                worker = self._executor_worker()
+                worker.stdin.write(json.dumps(request) + "\n")
+                worker.stdin.flush()
+            # EXECUTOR_TIMEOUT; a killed worker is reaped and restarted on the next trade
+            expired = threading.Event()
+
+            def _expire():
+                expired.set()
+                worker.kill()
+
+            killer = threading.Timer(EXECUTOR_TIMEOUT, _expire)
+            killer.start()
+            try:
+                line = worker.stdout.readline()
+            finally:
+                killer.cancel()
             
-            if result.returncode == 0:
-                print("✓ Trade executed successfully")
-                if tx_hash:
-                    print(f"🔗 View on GnosisScan: https://gnosisscan.io/tx/{tx_hash}")
-                return True, tx_hash
-            else:
-                # Check if it's a "min profit not met" error which is expected
-                if "min profit not met" in result.stderr:
-                    print("⚠️  Trade skipped: Min profit threshold not met")
+            try:
+                result = json.loads(line)
+            except ValueError:
+                code = self._discard_worker()
+                if expired.is_set():
+                    print("✗ Trade execution timed out")
                     return False, None
-                else:
-                    print(f"✗ Trade failed with exit code {result.returncode}")
-                    # Only show error details for unexpected failures
-                    if result.stderr:
-                        # Extract just the error message, not the full trace
-                        error_lines = result.stderr.strip().split('\n')
-                        for line in reversed(error_lines):
-                            if 'Error' in line or 'error' in line or 'Exception' in line:
-                                print(f"   Error: {line.strip()}")
-                                break
-                return False, None
+                return self._report_execution(False, None, f"executor exited with code {code}")
+            return self._report_execution(result["ok"], result["tx"], result["err"])
                 
-        except subprocess.TimeoutExpired:
-            print("✗ Trade execution timed out")
-            return False, None
         except Exception as e:
+            self._discard_worker()
             print(f"✗ Error executing trade: {e}")
             return False, None
             
+    def start_head_listener(self) -> new_heads.NewHeadsListener | None:
+        """Subscribe to newHeads on WSS_URL, or return None to fall back to polling."""
+        wss_url = os.getenv("WSS_URL")
+        if not wss_url:
+            return None
+        if not new_heads.available():
+            print("Warning: WSS_URL is set but 'websockets' is not installed; polling instead")
+            return None
+        return new_heads.NewHeadsListener(wss_url).start()
+    
     def run_loop(self, amount: float, interval: int, tolerance: float, 
-                 min_profit: float, dry_run: bool, prefund: bool) -> None:
+                 min_profit: float, dry_run: bool, prefund: bool,
+                 block_stride: int = 1) -> None:
         """Main monitoring loop."""
+        heads = self._heads = self.start_head_listener()
         print(f"\n🤖 Starting Futarchy Arbitrage Bot")
         print(f"   Amount:      {amount} sDAI")
-        print(f"   Interval:    {interval} seconds")
+        print(f"   Interval:    {interval} seconds{' (max wait per block)' if heads else ''}")
+        if heads:
+            print(f"   Trigger:     newHeads every {block_stride} block(s)")
         print(f"   Tolerance:   {tolerance}")
         print(f"   Min Profit:  {min_profit} sDAI")
         print(f"   Mode:        {'DRY RUN' if dry_run else 'LIVE'}")
@@ -378,15 +739,18 @@ class ArbitrageBot:
         print("\nPress Ctrl+C to stop\n")
         
         iteration = 0
+        block = "latest"
         while True:
             iteration += 1
-            print(f"\n{'='*60}")
-            print(f"Iteration #{iteration} - {time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print('='*60)
+            if self.verbose:
+                print(f"\n{'='*60}")
+                print(f"Iteration #{iteration} - {time.strftime('%Y-%m-%d %H:%M:%S')}"
+                      + (f" - block {block}" if block != "latest" else ""))
+                print('='*60)
             
             try:
-                # Fetch current prices
-                prices = self.fetch_prices()
+                # Fetch current prices (one consistent snapshot when triggered by a head)
+                prices = self.fetch_prices(block)
                 
                 # Check for arbitrage opportunity
                 flow, cheaper = self.determine_opportunity(prices, tolerance)
@@ -394,14 +758,16 @@ class ArbitrageBot:
                 if flow and cheaper:
                     # Get balances before trade
                     if not dry_run:
+                        # Executor contract and wallet balances in one round-trip
+                        snapshot = self.get_balances_multi([self.executor_address, self.wallet_address])
                         print("\n--- Pre-trade balances (Executor Contract) ---")
-                        balances_before = self.get_balances()  # Executor contract balances
+                        balances_before = snapshot[self.executor_address]
                         sdai_before = balances_before.get("sDAI", 0)
                         print(f"  sDAI: {sdai_before:.6f}")
                         self.check_residual_balances(balances_before)
                         
                         # Also check wallet balance
-                        wallet_balances = self.get_wallet_balances()
+                        wallet_balances = snapshot[self.wallet_address]
                         wallet_sdai_before = wallet_balances.get("sDAI", 0)
                         print(f"\n--- Wallet sDAI: {wallet_sdai_before:.6f} ---")
                     
@@ -412,8 +778,9 @@ class ArbitrageBot:
                     
                     if success and not dry_run:
                         # Get balances after trade
+                        snapshot = self.get_balances_multi([self.executor_address, self.wallet_address])
                         print("\n--- Post-trade balances (Executor Contract) ---")
-                        balances_after = self.get_balances()  # Executor contract balances
+                        balances_after = snapshot[self.executor_address]
                         sdai_after = balances_after.get("sDAI", 0)
                         sdai_change = sdai_after - sdai_before
                         
@@ -424,7 +791,7 @@ class ArbitrageBot:
                         self.check_residual_balances(balances_after)
                         
                         # Also check wallet balance change
-                        wallet_balances_after = self.get_wallet_balances()
+                        wallet_balances_after = snapshot[self.wallet_address]
                         wallet_sdai_after = wallet_balances_after.get("sDAI", 0)
                         wallet_change = wallet_sdai_after - wallet_sdai_before
                         if abs(wallet_change) > 0.000001:
@@ -456,9 +823,16 @@ class ArbitrageBot:
                 print(f"\n⚠️ Error in iteration #{iteration}: {e}")
                 
             # Wait for next iteration
-            print(f"\n💤 Sleeping for {interval} seconds...")
             try:
-                time.sleep(interval)
+                if heads:
+                    if self.verbose:
+                        print(f"\n💤 Waiting for next block (up to {interval} seconds)...")
+                    head = heads.wait(interval, block_stride)
+                    block = head if head is not None else "latest"
+                else:
+                    if self.verbose:
+                        print(f"\n💤 Sleeping for {interval} seconds...")
+                    time.sleep(interval)
             except KeyboardInterrupt:
                 print("\n👋 Shutting down gracefully...")
                 break
@@ -484,7 +858,13 @@ def main():
         "--interval",
         type=int,
         required=True,
-        help="Seconds between price checks"
+        help="Seconds between price checks (max wait per block when WSS_URL is set)"
+    )
+    parser.add_argument(
+        "--block-stride",
+        type=int,
+        default=1,
+        help="With WSS_URL, only check on blocks whose number is a multiple of this"
     )
     parser.add_argument(
         "--tolerance",
@@ -508,23 +888,38 @@ def main():
         action="store_true",
         help="Transfer sDAI to executor contract if needed"
     )
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Run the executor in a separate worker process instead of in-process (debugging)"
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print the full price analysis and iteration banner on every check"
+    )
     
     args = parser.parse_args()
     
     # Create and run bot
     try:
-        bot = ArbitrageBot(args.env_file)
+        bot = ArbitrageBot(args.env_file, isolate=args.isolate, verbose=args.verbose,
+                           dry_run=args.dry_run)
     except Exception as e:
         print(f"Failed to initialize bot: {e}")
         sys.exit(1)
-    bot.run_loop(
-        amount=args.amount,
-        interval=args.interval,
-        tolerance=args.tolerance,
-        min_profit=args.min_profit,
-        dry_run=args.dry_run,
-        prefund=args.prefund
-    )
+    try:
+        bot.run_loop(
+            amount=args.amount,
+            interval=args.interval,
+            tolerance=args.tolerance,
+            min_profit=args.min_profit,
+            dry_run=args.dry_run,
+            prefund=args.prefund,
+            block_stride=args.block_stride
+        )
+    finally:
+        bot.close()
 
 
 if __name__ == "__main__":
@@ -27,22 +27,32 @@ from src.config.logging_config import setup_logger, log_trade, log_price_check
 logger = setup_logger("arbitrage_bot_v2", level=10)  # DEBUG level
 
 import argparse
+import importlib
+import io
 import json
+import logging
 import os
 import sys
 import time
-import subprocess
 import re
+from collections.abc import Mapping
+from contextlib import contextmanager, redirect_stdout
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
 from decimal import Decimal
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-from dotenv import load_dotenv
+import requests
+from dotenv import dotenv_values
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 from eth_account import Account
 
 from helpers.swapr_price import get_pool_price as swapr_price
 from helpers.balancer_price import get_pool_price as bal_price
+from helpers.multicall import aggregate3
 import asyncio
 try:
     # Optional import for Kleros price mode
@@ -51,13 +61,177 @@ except Exception:
     kleros_get_pnk_price = None
 from config.network import DEFAULT_RPC_URLS
 
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+# Executor tx-hash lines, fused into one pattern. The group that matched gives the
+# label's priority: "Tx sent" beats "Transaction hash" beats a bare "tx:" (the
+# executors print "Prefund tx: ..." before "Tx sent: ...").
+_TX_HASH_RE = re.compile(
+    r"(?:(Tx sent)|(Transaction hash)|(tx)):\s*(?:0x)?(?P<hash>[a-fA-F0-9]{64})",
+    re.IGNORECASE,
+)
+
+# balanceOf(address) selector; calldata is this + the 32-byte left-padded holder
+BALANCE_OF_SELECTOR = bytes(Web3.keccak(text="balanceOf(address)")[:4])
+
+
+# Gas limit passed to every executor variant (overrides their internal defaults)
+EXECUTOR_GAS = 4_000_000
+
+# Seconds an executor call may take before the bot gives up on it
+# (same budget the old subprocess call had)
+EXECUTOR_TIMEOUT = 120
+
+# Quiet-market backoff in run_loop: while the deviation stays under
+# tolerance * QUIET_FRACTION the poll interval doubles, up to QUIET_MAX_FACTOR x
+QUIET_FRACTION = 0.25
+QUIET_MAX_FACTOR = 8
+
+# Config paths validate_configuration() requires, per bot type
+_REQ_PREDICTION: tuple[str, ...] = (
+    # Core
+    "wallet.private_key",
+    "network.rpc_url",
+    "proposal.address",
+    # Tokens (currency + conditional currency)
+    "proposal.tokens.currency.address",
+    "proposal.tokens.yes_currency.address",
+    "proposal.tokens.no_currency.address",
+    # Pools (prediction YES/NO vs currency)
+    "proposal.pools.swapr_yes_currency_currency.address",
+    "proposal.pools.swapr_no_currency_currency.address",
+    # Routers
+    "contracts.routers.swapr",
+    "contracts.routers.futarchy",
+)
+_REQ_KLEROS: tuple[str, ...] = (
+    "proposal.pools.swapr_yes_company_yes_currency.address",
+    "proposal.pools.swapr_yes_currency_currency.address",
+    "proposal.pools.swapr_no_company_no_currency.address",
+    "wallet.private_key",
+    "network.rpc_url",
+)
+# Only require the Balancer pool in balancer/pnk modes
+_REQ_BALANCER: tuple[str, ...] = _REQ_KLEROS + ("proposal.pools.balancer_company_currency.address",)
+
+
+class _LazyTokens(Mapping):
+    """Token name -> ERC20 Contract, each built on first access.
+
+    Addresses are known up front (``address(name)``), so the Multicall3 balance
+    path never needs a Contract; only the per-call fallback materializes them.
+    """
+
+    def __init__(self, w3: Web3, addrs: dict[str, str], abi: list):
+        self._w3 = w3
+        self._addrs = addrs
+        self._abi = abi
+        self._contracts: dict[str, Any] = {}
+
+    def address(self, name: str) -> str:
+        return self._addrs[name]
+
+    def __getitem__(self, name: str):
+        contract = self._contracts.get(name)
+        if contract is None:
+            contract = self._w3.eth.contract(address=self._addrs[name], abi=self._abi)
+            self._contracts[name] = contract
+        return contract
+
+    def __iter__(self):
+        return iter(self._addrs)
+
+    def __len__(self) -> int:
+        return len(self._addrs)
+
+
+# orjson turns integers wider than 64 bits (wei amounts) into floats; any run of
+# 19+ digits sends the file to the stdlib parser instead
+_LONG_DIGITS_RE = re.compile(rb"\d{19}")
+
+
+def _load_json_file(path: Path | str) -> Any:
+    """Parse a JSON file from its raw bytes; orjson when available and lossless."""
+    raw = Path(path).read_bytes()
+    if orjson is not None and not _LONG_DIGITS_RE.search(raw):
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dump_json(obj: Any) -> str:
+    """Indented JSON (for --dump-config); orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # orjson rejects ints wider than 64 bits and non-str dict keys
+            pass
+    return json.dumps(obj, indent=2)
+
+
+# (path, mtime_ns) -> parsed .env contents; a file is only re-parsed after it changes
+_ENV_CACHE: dict[tuple[str, int], dict[str, str]] = {}
+
+
+def _cached_dotenv(path: Path | str) -> None:
+    """``load_dotenv(path, override=False)`` backed by a parse cache."""
+    path = str(path)
+    try:
+        key = (path, os.stat(path).st_mtime_ns)
+    except OSError:
+        return  # load_dotenv ignores a missing file too
+    values = _ENV_CACHE.get(key)
+    if values is None:
+        values = {k: v for k, v in dotenv_values(path).items() if v is not None}
+        _ENV_CACHE[key] = values
+    for k, v in values.items():
+        os.environ.setdefault(k, v)
+
+
+@contextmanager
+def _patch_env(env: dict[str, str]):
+    """Overlay *env* on ``os.environ``; restore the original environment on exit.
+
+    The executors also ``load_dotenv`` the repo ``.env``, which can add keys, so
+    the whole environment is snapshotted rather than just the overlaid keys.
+    """
+    saved = dict(os.environ)
+    os.environ.update({k: str(v) for k, v in env.items() if v is not None})
+    try:
+        yield
+    finally:
+        _restore_env(saved)
+
+
+def _restore_env(saved: dict[str, str]) -> None:
+    """Make ``os.environ`` equal *saved* again."""
+    # Undo only what changed: each os.environ write is a putenv/unsetenv
+    for k in [k for k in os.environ if k not in saved]:
+        del os.environ[k]
+    for k, v in saved.items():
+        if os.environ.get(k) != v:
+            os.environ[k] = v
+
 
 class ConfigManager:
     """Manages configuration from both JSON and environment sources."""
-    
+
+    # (section, key) -> value read from the process env by refresh_env_overrides();
+    # the env doesn't change under a running bot, so it is read once per process
+    _ENV_OVERRIDES: dict[tuple[str, str], str] | None = None
+
     def __init__(self, config_path: str | None = None, env_file: str | None = None):
         """Initialize configuration from JSON or environment file."""
         self.config = {}
+        # Every dot path in self.config -> value, rebuilt after each mutation so
+        # get() is a single dict lookup
+        self._flat: dict[str, Any] = {}
+        # to_env_dict() result, dropped whenever the config changes
+        self._env_dict_cache: dict[str, str] | None = None
+        self._config_version = 0
         self.env_file = env_file
         
         if config_path:
@@ -72,9 +246,9 @@ class ConfigManager:
     
     def load_json_config(self, config_path: str) -> None:
         """Load configuration from JSON file."""
-        with open(config_path) as f:
-            self.config = json.load(f)
+        self.config = _load_json_file(config_path)
         # After loading explicit config, apply env overrides (PRIVATE_KEY, FUTARCHY address)
+        # (this also rebuilds the flat lookup table)
         self._apply_process_env_overrides()
             
     def load_env_config(self, env_file: str) -> None:
@@ -83,10 +257,12 @@ class ConfigManager:
         base_env = Path(".env")
         if base_env.exists():
             # Do not override existing process env
-            load_dotenv(base_env, override=False)
+            _cached_dotenv(base_env)
         if env_file:
             # Do not override existing process env
-            load_dotenv(env_file, override=False)
+            _cached_dotenv(env_file)
+        # The .env files may have added override variables
+        self.refresh_env_overrides()
             
         # Map env variables to config structure
         self.config = self._map_env_to_config()
@@ -106,7 +282,8 @@ class ConfigManager:
         # Fall back to environment
         base_env = Path(".env")
         if base_env.exists():
-            load_dotenv(base_env, override=False)
+            _cached_dotenv(base_env)
+            self.refresh_env_overrides()
         self.config = self._map_env_to_config()
         self._apply_process_env_overrides()
     
@@ -187,29 +364,77 @@ class ConfigManager:
         - FUTARCHY_ARB_EXECUTOR_V5 (or EXECUTOR_V5_ADDRESS) over contracts.executor_v5
         - PREDICTION_ARB_EXECUTOR_V1 over contracts.executor_prediction_v1
         """
-        try:
-            # Wallet private key
-            pk = os.getenv("PRIVATE_KEY")
-            if pk:
-                self.config.setdefault("wallet", {})
-                self.config["wallet"]["private_key"] = pk
-
-            # Executor addresses
-            v5 = os.getenv("FUTARCHY_ARB_EXECUTOR_V5") or os.getenv("EXECUTOR_V5_ADDRESS")
-            if v5:
-                self.config.setdefault("contracts", {})
-                self.config["contracts"]["executor_v5"] = v5
-
-            pred = os.getenv("PREDICTION_ARB_EXECUTOR_V1") or os.getenv("PREDICTION_EXECUTOR_V1_ADDRESS")
-            if pred:
-                self.config.setdefault("contracts", {})
-                self.config["contracts"]["executor_prediction_v1"] = pred
-        except Exception:
-            # Non-fatal; best-effort overlay
-            pass
+        if self._ENV_OVERRIDES is None:
+            self.refresh_env_overrides()
+        for (section, key), value in self._ENV_OVERRIDES.items():
+            node = self.config.setdefault(section, {})
+            if isinstance(node, dict):
+                node[key] = value
+        self._rebuild_flat()
+
+    @classmethod
+    def refresh_env_overrides(cls) -> None:
+        """Re-read the override variables; needed only if os.environ changed since."""
+        overrides = {
+            ("wallet", "private_key"): os.getenv("PRIVATE_KEY"),
+            ("contracts", "executor_v5"): (
+                os.getenv("FUTARCHY_ARB_EXECUTOR_V5") or os.getenv("EXECUTOR_V5_ADDRESS")
+            ),
+            ("contracts", "executor_prediction_v1"): (
+                os.getenv("PREDICTION_ARB_EXECUTOR_V1") or os.getenv("PREDICTION_EXECUTOR_V1_ADDRESS")
+            ),
+        }
+        cls._ENV_OVERRIDES = {k: v for k, v in overrides.items() if v}
+    
+    def _rebuild_flat(self) -> None:
+        """Flatten self.config into {"a.b.c": value}, including intermediate dicts.
+
+        Every mutator ends here, so this is also where derived caches are invalidated.
+        """
+        self._config_version += 1
+        self._env_dict_cache = None
+        flat: dict[str, Any] = {}
+        stack = [("", self.config)]
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                if not isinstance(key, str):
+                    continue
+                path = prefix + key
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((path + ".", value))
+        self._flat = flat
+
+    @property
+    def version(self) -> int:
+        """Bumped on every config change; callers key derived caches on it."""
+        return self._config_version
+
+    def flat(self) -> Mapping[str, Any]:
+        """Read-only ``{"a.b.c": value}`` view of the config (intermediate dicts included)."""
+        return MappingProxyType(self._flat)
     
     def get(self, path: str, default: Any = None) -> Any:
         """Get a value from config using dot notation path."""
+        value = self._flat.get(path)
+        if value is None:
+            # Paths written straight into self.config after the last rebuild
+            return self._slow_get(path, default)
+        return value
+    
+    def set(self, path: str, value: Any) -> None:
+        """Set a value by dot notation path, creating intermediate sections."""
+        *parents, leaf = path.split('.')
+        node = self.config
+        for key in parents:
+            if not isinstance(node.get(key), dict):
+                node[key] = {}
+            node = node[key]
+        node[leaf] = value
+        self._rebuild_flat()
+    
+    def _slow_get(self, path: str, default: Any = None) -> Any:
         keys = path.split('.')
         value = self.config
         for key in keys:
@@ -239,9 +464,18 @@ class ConfigManager:
             self.config["bot"]["run_options"]["tolerance"] = tolerance
         if min_profit is not None:
             self.config["bot"]["run_options"]["min_profit"] = min_profit
+        self._rebuild_flat()
     
     def to_env_dict(self) -> dict[str, str]:
-        """Convert config back to environment variable format for subprocess."""
+        """Convert config back to environment variable format for subprocess.
+
+        Computed once per config version; callers get their own copy.
+        """
+        if self._env_dict_cache is None:
+            self._env_dict_cache = self._build_env_dict()
+        return dict(self._env_dict_cache)
+    
+    def _build_env_dict(self) -> dict[str, str]:
         env_dict = {}
         
         # Network and wallet
@@ -305,18 +539,67 @@ class ArbitrageBot:
     def __init__(self, config: ConfigManager):
         """Initialize the bot with configuration."""
         self.config = config
+        # The four pool reads per check run side by side (HTTPProvider is thread-safe)
+        self._price_pool = ThreadPoolExecutor(max_workers=4)
+        # Event loop for the async Kleros price helper, reused across polls
+        self._loop = asyncio.new_event_loop()
+        # Pool state only changes per block: fetch_prices(block) reuses the last
+        # read while run_loop's block number is unchanged
+        self._last_block: int | None = None
+        self._last_prices: dict | None = None
+        # run_loop output, written out once per phase by _log_flush()
+        self._log: list[str] = []
+        # |market - ideal| from the last determine_opportunity() call
+        self._deviation_prev: float | None = None
+        # bot type -> imported executor module, and the env overlay it runs under
+        # (see execute_arbitrage / _executor_env)
+        self._executors: dict[str, Any] = {}
+        self._merged_env: dict[str, str] = {}
+        self._merged_env_version = -1
+        # Executor calls run on their own thread so they can be given up on after
+        # EXECUTOR_TIMEOUT; _exec_future is the latest call (see execute_arbitrage)
+        self._exec_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="executor")
+        self._exec_future = None
+        # deployments/ glob pattern -> executor address (or None), see get_executor_address
+        self._executor_addr_cache: dict[str, str | None] = {}
+        # Config "*.address" path -> checksummed address, rebuilt only when the
+        # config version changes (see _address)
+        self._addr_cache: dict[str, str] = {}
+        self._addr_cache_version = -1
+        self.bot_type = str(self.config.get("bot.type", "balancer") or "balancer").lower()
         self.w3 = self.create_web3()
         self.validate_configuration()
+        # Pool addresses read on every fetch_prices()
+        self.addr_yes = self._address("proposal.pools.swapr_yes_company_yes_currency.address")
+        self.addr_pred_yes = self._address("proposal.pools.swapr_yes_currency_currency.address")
+        self.addr_no = self._address("proposal.pools.swapr_no_company_no_currency.address")
+        self.addr_bal = self._address("proposal.pools.balancer_company_currency.address")
         self.setup_account()
         self.setup_token_contracts()
         
+    def close(self) -> None:
+        """Release the price and executor worker threads and the Kleros event loop."""
+        self._price_pool.shutdown(wait=False)
+        self._exec_pool.shutdown(wait=False)
+        self._loop.close()
+
     def create_web3(self) -> Web3:
         """Create Web3 connection."""
         rpc_url = self.config.get("network.rpc_url")
         if not rpc_url:
             rpc_url = DEFAULT_RPC_URLS[0]
             
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
+        # One keep-alive session for every RPC call: the price workers and the
+        # main thread reuse pooled connections instead of re-handshaking TLS
+        self._http_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        )
+        self._http_session.mount("https://", adapter)
+        self._http_session.mount("http://", adapter)
+        w3 = Web3(Web3.HTTPProvider(rpc_url, session=self._http_session, request_kwargs={"timeout": 10}))
         
         # Add POA middleware if needed
         try:
@@ -346,44 +629,60 @@ class ArbitrageBot:
         self.executor_address = self.get_executor_address()
         print(f"Monitoring executor contract: {self.executor_address}")
     
+    def _address(self, path: str) -> str | None:
+        """Checksummed address at config *path* (a ``*.address`` key), or None."""
+        if self._addr_cache_version != self.config.version:
+            # Malformed values pass through unchanged and fail where they are used
+            self._addr_cache = {
+                key: Web3.to_checksum_address(value) if Web3.is_address(value) else value
+                for key, value in self.config.flat().items()
+                if key.endswith(".address") and isinstance(value, str) and value
+            }
+            self._addr_cache_version = self.config.version
+        return self._addr_cache.get(path)
+
     def get_executor_address(self) -> str:
         """Get the executor contract address from config or deployment files."""
-        import glob
-        import json
-        
-        bot_type = str(self.config.get("bot.type", "balancer") or "balancer").lower()
-
-        if bot_type == "prediction":
+        if self.bot_type == "prediction":
             # Prefer explicit prediction executor address
             pred_exec = self.config.get("contracts.executor_prediction_v1")
             if pred_exec:
                 return self.w3.to_checksum_address(pred_exec)
             # Fallback to latest prediction deployments file
-            deployment_files = sorted(glob.glob("deployments/deployment_prediction_arb_v1_*.json"))
-            if deployment_files:
-                try:
-                    with open(deployment_files[-1]) as f:
-                        data = json.load(f)
-                        if data.get("address"):
-                            return self.w3.to_checksum_address(data["address"])
-                except Exception:
-                    pass
+            address = self._latest_deployment_address("deployment_prediction_arb_v1_*.json")
+            if address:
+                return address
             raise SystemExit("Could not determine PredictionArbExecutorV1 address (set PREDICTION_ARB_EXECUTOR_V1 or keep a deployments file).")
 
         # Non-prediction: use V5 executor discovery
         executor = self.config.get("contracts.executor_v5")
         if executor:
             return self.w3.to_checksum_address(executor)
-        deployment_files = sorted(glob.glob("deployments/deployment_executor_v5_*.json"))
-        if deployment_files:
+        address = self._latest_deployment_address("deployment_executor_v5_*.json")
+        if address:
+            return address
+        raise SystemExit("Could not determine FutarchyArbExecutorV5 address")
+
+    def _latest_deployment_address(self, pattern: str) -> str | None:
+        """Address from the newest ``deployments/<pattern>`` file, cached per pattern.
+
+        File names embed the deployment timestamp, so the lexicographic max is the
+        latest; deployments don't change under a running bot.
+        """
+        cache = self._executor_addr_cache
+        if pattern in cache:
+            return cache[pattern]
+        address = None
+        latest = max(Path("deployments").glob(pattern), default=None)
+        if latest is not None:
             try:
-                with open(deployment_files[-1]) as f:
-                    data = json.load(f)
-                    if data.get("address"):
-                        return self.w3.to_checksum_address(data["address"])
+                data = _load_json_file(latest)
+                if data.get("address"):
+                    address = self.w3.to_checksum_address(data["address"])
             except Exception:
                 pass
-        raise SystemExit("Could not determine FutarchyArbExecutorV5 address")
+        cache[pattern] = address
+        return address
         
     def setup_token_contracts(self) -> None:
         """Setup token contract interfaces for balance checking."""
@@ -399,8 +698,7 @@ class ArbitrageBot:
             }
         ]
         
-        # Setup token contracts
-        self.tokens = {}
+        # Setup token contracts (Contract objects are created lazily)
         token_mapping = {
             "sDAI": "proposal.tokens.currency.address",
             "GNO": "proposal.tokens.company.address",
@@ -410,82 +708,78 @@ class ArbitrageBot:
             "NO_sDAI": "proposal.tokens.no_currency.address"
         }
         
+        token_addrs = {}
         for name, path in token_mapping.items():
-            addr = self.config.get(path)
+            addr = self._address(path)
             if addr:
-                self.tokens[name] = self.w3.eth.contract(
-                    address=self.w3.to_checksum_address(addr),
-                    abi=erc20_abi
-                )
+                token_addrs[name] = addr
+        self.tokens = _LazyTokens(self.w3, token_addrs, erc20_abi)
+        
+        # Built once and reused every poll: bound balanceOf per token (per-call
+        # fallback, bound on first use) and the Multicall3 call list per holder
+        # (see get_balances)
+        self._balance_fns: dict[str, Any] = {}
+        self._balance_calls: dict[str, list] = {}
         
     def validate_configuration(self) -> None:
         """Ensure all required configuration values are set."""
-        bot_type = str(self.config.get("bot.type", "balancer") or "balancer").lower()
-
-        if bot_type == "prediction":
-            required_paths = [
-                # Core
-                "wallet.private_key",
-                "network.rpc_url",
-                "proposal.address",
-                # Tokens (currency + conditional currency)
-                "proposal.tokens.currency.address",
-                "proposal.tokens.yes_currency.address",
-                "proposal.tokens.no_currency.address",
-                # Pools (prediction YES/NO vs currency)
-                "proposal.pools.swapr_yes_currency_currency.address",
-                "proposal.pools.swapr_no_currency_currency.address",
-                # Routers
-                "contracts.routers.swapr",
-                "contracts.routers.futarchy",
-            ]
+        if self.bot_type == "prediction":
+            required_paths = _REQ_PREDICTION
+        elif self.bot_type == "kleros":
+            required_paths = _REQ_KLEROS
         else:
-            required_paths = [
-                "proposal.pools.swapr_yes_company_yes_currency.address",
-                "proposal.pools.swapr_yes_currency_currency.address",
-                "proposal.pools.swapr_no_company_no_currency.address",
-                "wallet.private_key",
-                "network.rpc_url"
-            ]
-            # Only require Balancer pool in balancer/pnk modes
-            if bot_type != "kleros":
-                required_paths.append("proposal.pools.balancer_company_currency.address")
-        
-        missing = []
-        for path in required_paths:
-            if not self.config.get(path):
-                missing.append(path)
-                
+            required_paths = _REQ_BALANCER
+
+        flat = self.config.flat()
+        missing = [path for path in required_paths if not flat.get(path)]
+
         if missing:
             raise SystemExit(f"Missing required configuration: {', '.join(missing)}")
             
-    def fetch_prices(self) -> dict:
-        """Fetch current prices from Swapr and either Balancer or Kleros (PNK) depending on BOT_TYPE."""
-        addr_yes = self.config.get("proposal.pools.swapr_yes_company_yes_currency.address")
-        addr_pred_yes = self.config.get("proposal.pools.swapr_yes_currency_currency.address")
-        addr_no = self.config.get("proposal.pools.swapr_no_company_no_currency.address")
-        addr_bal = self.config.get("proposal.pools.balancer_company_currency.address")
+    def fetch_prices(self, block: int | None = None, force: bool = False) -> dict:
+        """Fetch current prices from Swapr and either Balancer or Kleros (PNK) depending on BOT_TYPE.
+
+        A repeat call for the same *block* returns (a copy of) the previous
+        result without the four pool reads; ``force=True`` always re-reads.
+        """
+        if not force and block is not None and block == self._last_block and self._last_prices is not None:
+            return dict(self._last_prices)
+        prices = self._read_prices()
+        self._last_block, self._last_prices = block, prices
+        return dict(prices)
+
+    def _read_prices(self) -> dict:
+        # Market price depends on bot type
+        kleros = self.bot_type in ("kleros", "pnk")
+        if kleros and kleros_get_pnk_price is None:
+            raise SystemExit("BOT_TYPE=kleros but Kleros price helper unavailable")
         
-        # Fetch Swapr prices (YES and NO pools have GNO as token1)
-        yes_price, yes_base, yes_quote = swapr_price(self.w3, addr_yes)
-        pred_yes_price, _, _ = swapr_price(self.w3, addr_pred_yes)
-        no_price, no_base, no_quote = swapr_price(self.w3, addr_no)
+        # Submit all four reads at once: latency is the slowest RPC, not the sum
+        pool = self._price_pool
+        yes_future = pool.submit(swapr_price, self.w3, self.addr_yes)
+        pred_yes_future = pool.submit(swapr_price, self.w3, self.addr_pred_yes)
+        no_future = pool.submit(swapr_price, self.w3, self.addr_no)
+        if kleros:
+            market_future = pool.submit(self._loop.run_until_complete, kleros_get_pnk_price(self.w3))
+        else:
+            market_future = pool.submit(bal_price, self.w3, self.addr_bal)
+        
+        # Swapr prices (YES and NO pools have GNO as token1)
+        yes_price, yes_base, yes_quote = yes_future.result()
+        pred_yes_price, _, _ = pred_yes_future.result()
+        no_price, no_base, no_quote = no_future.result()
         
-        # Market price depends on bot type
-        bot_type = str(self.config.get("bot.type", "balancer") or "balancer").lower()
         market_label = "Balancer"
         market_price = None
         bal_price_val = None
         bal_base = bal_quote = None
         pnk_price_val = None
-        if bot_type in ("kleros", "pnk"):
-            if kleros_get_pnk_price is None:
-                raise SystemExit("BOT_TYPE=kleros but Kleros price helper unavailable")
-            pnk_price_val = float(asyncio.run(kleros_get_pnk_price(self.w3)))
+        if kleros:
+            pnk_price_val = float(market_future.result())
             market_label = "PNK"
             market_price = pnk_price_val
         else:
-            bal_price_val, bal_base, bal_quote = bal_price(self.w3, addr_bal)
+            bal_price_val, bal_base, bal_quote = market_future.result()
             market_label = "Balancer"
             market_price = float(bal_price_val)
         
@@ -519,52 +813,112 @@ class ArbitrageBot:
         ideal_price = self.calculate_ideal_price(prices)
         market_price = prices.get("market_price")
         market_label = prices.get("market_label", "Market")
-        deviation = abs(market_price - ideal_price) if market_price is not None else float('inf')
-        
-        print(f"\nPrice Analysis:")
-        print(f"  YES price:       {prices['yes_price']:.6f}")
-        print(f"  NO price:        {prices['no_price']:.6f}")
-        print(f"  Prediction YES:  {prices['pred_yes_price']:.6f}")
-        print(f"  {market_label} price:  {market_price:.6f}")
-        print(f"  Ideal price:     {ideal_price:.6f}")
-        print(f"  Deviation:       {deviation:.6f} ({deviation/ideal_price*100:.2f}%)")
-        
+        diff = market_price - ideal_price if market_price is not None else float('inf')
+        deviation = abs(diff)
+        self._deviation_prev = deviation
+
         if deviation < tolerance:
-            print(f"  → No opportunity (deviation {deviation:.6f} < tolerance {tolerance:.6f})")
-            return None, None
-            
-        # Determine flow direction
-        if market_price > ideal_price:
-            flow = "buy"  # Buy conditionals cheap, merge, sell composite high
-            print(f"  → BUY opportunity: {market_label} overpriced by {market_price - ideal_price:.6f}")
+            flow = cheaper = None
+            decision = f"  → No opportunity (deviation {deviation:.6f} < tolerance {tolerance:.6f})"
         else:
-            flow = "sell"  # Buy composite cheap, split, sell conditionals high
-            print(f"  → SELL opportunity: {market_label} underpriced by {ideal_price - market_price:.6f}")
-            
-        # Determine which conditional is cheaper
-        if prices["yes_price"] < prices["no_price"]:
-            cheaper = "yes"
-            print(f"  → YES is cheaper ({prices['yes_price']:.6f} < {prices['no_price']:.6f})")
+            # buy: conditionals cheap, merge, sell composite high; sell: the reverse
+            overpriced = diff > 0
+            flow = ("sell", "buy")[overpriced]
+            yes_price, no_price = prices["yes_price"], prices["no_price"]
+            yes_cheaper = yes_price < no_price
+            cheaper = ("no", "yes")[yes_cheaper]
+            low, high = ((no_price, yes_price), (yes_price, no_price))[yes_cheaper]
+            decision = (
+                f"  → {flow.upper()} opportunity: {market_label} "
+                f"{('underpriced', 'overpriced')[overpriced]} by {deviation:.6f}\n"
+                f"  → {cheaper.upper()} is cheaper ({low:.6f} < {high:.6f})"
+            )
+
+        # One write per decision; the full price table only when DEBUG logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            sys.stdout.write(
+                f"\nPrice Analysis:\n"
+                f"  YES price:       {prices['yes_price']:.6f}\n"
+                f"  NO price:        {prices['no_price']:.6f}\n"
+                f"  Prediction YES:  {prices['pred_yes_price']:.6f}\n"
+                f"  {market_label} price:  {market_price:.6f}\n"
+                f"  Ideal price:     {ideal_price:.6f}\n"
+                f"  Deviation:       {deviation:.6f} ({deviation/ideal_price*100:.2f}%)\n"
+                f"{decision}\n"
+            )
         else:
-            cheaper = "no"
-            print(f"  → NO is cheaper ({prices['no_price']:.6f} < {prices['yes_price']:.6f})")
-            
+            sys.stdout.write(f"{decision}\n")
+        sys.stdout.flush()
         return flow, cheaper
         
     def get_balances(self, address: str | None = None) -> dict:
         """Get current token balances for the specified address (defaults to executor contract)."""
         target_address = address or self.executor_address
-        balances = {}
-        for name, contract in self.tokens.items():
-            if contract:
-                try:
-                    balance_wei = contract.functions.balanceOf(target_address).call()
-                    balance_ether = self.w3.from_wei(balance_wei, 'ether')
-                    balances[name] = float(balance_ether)
-                except Exception as e:
-                    logger.warning(f" Could not fetch {name} balance: {e}")
+        return self.get_balances_multi([target_address])[target_address]
+
+    def get_balance_snapshot(self) -> tuple[dict, dict]:
+        """(executor balances, wallet balances), read in one Multicall3 round-trip."""
+        balances = self.get_balances_multi([self.executor_address, self.wallet_address])
+        return balances[self.executor_address], balances[self.wallet_address]
+
+    def get_balances_multi(self, addresses: list[str]) -> dict[str, dict]:
+        """Token balances for several holders: {address: {token_name: balance}}."""
+        # All (holder, token) pairs in one Multicall3 round-trip; per-token calls only if that fails
+        names = list(self.tokens)
+        calls = []
+        for target_address in addresses:
+            holder_calls = self._balance_calls.get(target_address)
+            if holder_calls is None:
+                holder = bytes.fromhex(target_address[2:].rjust(64, "0"))
+                holder_calls = [
+                    (self.tokens.address(name), BALANCE_OF_SELECTOR + holder, lambda raw: int.from_bytes(raw[-32:], "big"))
+                    for name in names
+                ]
+                self._balance_calls[target_address] = holder_calls
+            calls.extend(holder_calls)
+        try:
+            results = aggregate3(self.w3, calls, allow_failure=True)
+        except Exception as e:
+            logger.debug(f"Multicall3 balance read failed ({e}); falling back to per-token calls")
+            return self._get_balances_multi_per_call(addresses)
+        
+        all_balances = {}
+        for i, target_address in enumerate(addresses):
+            balances = {}
+            for name, balance_wei in zip(names, results[i * len(names):(i + 1) * len(names)]):
+                if balance_wei is None:
+                    logger.warning(f" Could not fetch {name} balance")
                     balances[name] = 0.0
-        return balances
+                else:
+                    balances[name] = float(self.w3.from_wei(balance_wei, 'ether'))
+            all_balances[target_address] = balances
+        return all_balances
+    
+    def _balance_of(self, name: str, holder: str) -> int:
+        balance_of = self._balance_fns.get(name)
+        if balance_of is None:
+            balance_of = self._balance_fns[name] = self.tokens[name].functions.balanceOf
+        return balance_of(holder).call()
+
+    def _get_balances_multi_per_call(self, addresses: list[str]) -> dict[str, dict]:
+        """Fallback for get_balances_multi: one eth_call per (holder, token), all in flight at once."""
+        futures = {
+            (addr, name): self._price_pool.submit(self._balance_of, name, addr)
+            for addr in addresses
+            for name in self.tokens
+        }
+        all_balances: dict[str, dict] = {addr: {} for addr in addresses}
+        for (addr, name), future in futures.items():
+            try:
+                balance_ether = self.w3.from_wei(future.result(), 'ether')
+                all_balances[addr][name] = float(balance_ether)
+            except Exception as e:
+                logger.warning(f" Could not fetch {name} balance: {e}")
+                all_balances[addr][name] = 0.0
+        return all_balances
+
+    def _get_balances_per_call(self, target_address: str) -> dict:
+        return self._get_balances_multi_per_call([target_address])[target_address]
     
     def get_wallet_balances(self) -> dict:
         """Get current token balances for the user's wallet."""
@@ -585,37 +939,51 @@ class ArbitrageBot:
                 warnings.append(f"⚠️  {token} balance: {balances[token]:.6f} (should be ~0)")
                 
         if warnings:
-            print("\n" + "\n".join(warnings))
+            self._log.append("\n" + "\n".join(warnings))
+
+    def _log_flush(self) -> None:
+        """Write the lines buffered in self._log with one write and flush."""
+        if self._log:
+            self._log.append("")
+            sys.stdout.write("\n".join(self._log))
+            sys.stdout.flush()
+            self._log.clear()
     
     def parse_tx_hash(self, output: str) -> str | None:
         """Parse transaction hash from executor output."""
-        patterns = [
-            r"Tx sent:\s*(?:0x)?([a-fA-F0-9]{64})",
-            r"Transaction hash:\s*(?:0x)?([a-fA-F0-9]{64})",
-            r"tx:\s*(?:0x)?([a-fA-F0-9]{64})"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, output, re.IGNORECASE)
-            if match:
-                tx_hash = match.group(1)
-                if not tx_hash.startswith('0x'):
-                    tx_hash = '0x' + tx_hash
-                return tx_hash
-        return None
+        # One scan; keep the first match of the highest-priority label
+        best, best_rank = None, 4
+        for match in _TX_HASH_RE.finditer(output):
+            rank = next(i for i in (1, 2, 3) if match.group(i))
+            if rank < best_rank:
+                best, best_rank = match, rank
+                if rank == 1:
+                    break
+        return "0x" + best.group("hash") if best else None
     
     def execute_arbitrage(self, flow: str | None, cheaper: str | None, amount: float, 
                          min_profit: float, dry_run: bool, prefund: bool) -> tuple[bool, str | None]:
         """
         Execute arbitrage trade via the arbitrage_executor module.
+
+        The executor runs in-process under the merged env (module imported once,
+        kept in ``self._executors``). The Balancer executor is called through its
+        ``execute()`` API on this bot's Web3/account, which returns the tx hash
+        directly; the PNK and prediction executors run their ``main(argv)`` and
+        the tx hash is parsed from their captured stdout.
+
+        The call runs on a worker thread and is abandoned after EXECUTOR_TIMEOUT
+        seconds. The main loop waits for it, so no price fetch runs while the
+        env overlay is in place. A timed-out call keeps running with the overlay
+        still applied (only stdout is taken back); its own ``_patch_env`` puts
+        the env back when it returns, and run_loop skips whole iterations until
+        then so nothing reads or changes the process env in the meantime.
         
         Returns:
             (success, tx_hash): True if execution was successful and optional transaction hash
         """
-        bot_type = str(self.config.get("bot.type", "balancer") or "balancer").lower()
-
         # Prediction mode delegates to prediction_arb_executor (no price args)
-        if bot_type == "prediction":
+        if self.bot_type == "prediction":
             module = "src.executor.prediction_arb_executor"
             cmd = [
                 sys.executable, "-m", module,
@@ -630,7 +998,7 @@ class ArbitrageBot:
             # Select executor module by bot type (default: balancer)
             module = (
                 "src.executor.arbitrage_pnk_executor"
-                if bot_type in ("pnk", "kleros")
+                if self.bot_type in ("pnk", "kleros")
                 else "src.executor.arbitrage_executor"
             )
             # Build command for chosen executor
@@ -644,60 +1012,9 @@ class ArbitrageBot:
 
         # Increase default gas limit for all executor variants when launched via arbitrage_bot_v2
         # This overrides the executors' internal defaults without exposing a new CLI here.
-        cmd.extend(["--gas", "4000000"])  # 4,000,000
+        cmd.extend(["--gas", str(EXECUTOR_GAS)])
         
-        # Build a merged .env file for the executor with explicit precedence:
-        #   process env > config-derived env > file .envs.
-        # Then pass that merged file via --env to avoid accidental overrides.
-        merged_env: dict[str, str] = self.config.to_env_dict()
-        # Overlay with any same-name keys from the current process env
-        for k in list(merged_env.keys()):
-            v = os.environ.get(k)
-            if v is not None:
-                merged_env[k] = v
-        # Ensure critical keys from process env are included even if missing in config
-        critical = [
-            "PRIVATE_KEY",
-            "FUTARCHY_ARB_EXECUTOR_V5",
-            "EXECUTOR_V5_ADDRESS",
-            "PREDICTION_ARB_EXECUTOR_V1",
-            "RPC_URL",
-            "GNOSIS_RPC_URL",
-            "CHAIN_ID",
-            "BALANCER_ROUTER_ADDRESS",
-            "BALANCER_VAULT_ADDRESS",
-            "SWAPR_ROUTER_ADDRESS",
-            "FUTARCHY_ROUTER_ADDRESS",
-            "BALANCER_POOL_ADDRESS",
-            "SWAPR_POOL_YES_ADDRESS",
-            "SWAPR_POOL_NO_ADDRESS",
-            "SWAPR_POOL_PRED_YES_ADDRESS",
-            "SWAPR_POOL_PRED_NO_ADDRESS",
-            "SDAI_TOKEN_ADDRESS",
-            "COMPANY_TOKEN_ADDRESS",
-        ]
-        for k in critical:
-            v = os.environ.get(k)
-            if v is not None and k not in merged_env:
-                merged_env[k] = v
-
-        # Write merged env to a persistent file under build/envs
-        tmp_dir = Path("build/envs")
-        tmp_dir.mkdir(parents=True, exist_ok=True)
-        tmp_env_path = tmp_dir / f"exec_env_{int(time.time())}_{os.getpid()}.env"
-        try:
-            with open(tmp_env_path, "w") as f:
-                for k, v in merged_env.items():
-                    if v is None:
-                        continue
-                    f.write(f"{k}={v}\n")
-            print(f"Merged executor env written: {tmp_env_path}")
-        except Exception as e:
-            print(f"✗ Failed to write merged env file: {e}")
-            return False, None
-
-        # Ensure the executor loads exactly the merged env file
-        cmd.extend(["--env", str(tmp_env_path)])
+        merged_env = self._executor_env()
         
         if prefund:
             cmd.append("--prefund")
@@ -710,60 +1027,102 @@ class ArbitrageBot:
             print(f"\n[DRY RUN] Would execute: {' '.join(cmd)}")
             return True, None
             
-        if bot_type == "prediction":
+        if self.bot_type == "prediction":
             print(f"\nExecuting prediction arbitrage via prediction_arb_executor")
         else:
             print(f"\nExecuting arbitrage: {str(flow or '').upper()} flow, {str(cheaper or '').upper()} cheaper")
-        print(f"Executor type: {bot_type}")
+        print(f"Executor type: {self.bot_type}")
         print(f"Command: {' '.join(cmd)}")
         
-        # Prepare child env: start from current process env, but remove keys we want the file to define
-        child_env = os.environ.copy()
-        for k in merged_env.keys():
-            child_env.pop(k, None)
-        
+        if self._exec_future is not None and not self._exec_future.done():
+            print("✗ Previous executor call has not returned yet; skipping this trade")
+            return False, None
+
+        out = io.StringIO()
+        real_stdout = sys.stdout
+        self._exec_future = self._exec_pool.submit(
+            self._run_executor, module, cmd, merged_env, out,
+            flow, cheaper, amount, min_profit, prefund,
+        )
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120,  # 2 minute timeout
-                env=child_env
-            )
-            
+            rc, error, tx_hash = self._exec_future.result(timeout=EXECUTOR_TIMEOUT)
+        except FuturesTimeout:
+            # The worker thread can't be stopped. Take back stdout only: the call
+            # still runs under the env overlay, which it restores itself on return
+            sys.stdout = real_stdout
+            rc, error, tx_hash = 1, f"executor timed out after {EXECUTOR_TIMEOUT}s", None
+        output = out.getvalue()
+
+        if tx_hash is None:
             # Parse transaction hash from output
-            tx_hash = self.parse_tx_hash(result.stdout)
+            tx_hash = self.parse_tx_hash(output)
+
+        if not rc:
+            logger.debug(f"Executor output:\n{output}")
+            print("✓ Trade executed successfully")
+            if tx_hash:
+                print(f"🔗 View on GnosisScan: https://gnosisscan.io/tx/{tx_hash}")
+            return True, tx_hash
+        # Check if it's a "min profit not met" error which is expected; the PNK and
+        # prediction executors only print theirs
+        if "min profit not met" in f"{error or ''}\n{output}".lower():
+            logger.warning("  Trade skipped: Min profit threshold not met")
+            logger.debug(f"Executor output:\n{output}")
+            return False, None
+        print(f"✗ Trade failed with exit code {rc}")
+        if output:
+            print(f"--- Executor output ---\n{output.rstrip()}\n-----------------------")
+        # Only show the error message, not the full trace
+        if error:
+            print(f"   Error: {error}")
+        return False, None
             
-            if result.returncode == 0:
-                print("✓ Trade executed successfully")
-                if tx_hash:
-                    print(f"🔗 View on GnosisScan: https://gnosisscan.io/tx/{tx_hash}")
-                return True, tx_hash
-            else:
-                # Check if it's a "min profit not met" error which is expected
-                if "min profit not met" in result.stderr:
-                    logger.warning("  Trade skipped: Min profit threshold not met")
-                    return False, None
+    def _run_executor(
+        self, module: str, cmd: list[str], env: dict[str, str], out: io.StringIO,
+        flow: str | None, cheaper: str | None, amount: float, min_profit: float, prefund: bool,
+    ) -> tuple[int, str | None, str | None]:
+        """Run one executor call under *env* with stdout captured in *out*: (rc, error, tx_hash)."""
+        error: str | None = None
+        tx_hash: str | None = None
+        try:
+            executor = self._executors.get(self.bot_type)
+            if executor is None:
+                executor = self._executors[self.bot_type] = importlib.import_module(module)
+            with _patch_env(env), redirect_stdout(out):
+                if module == "src.executor.arbitrage_executor":
+                    result = executor.execute(
+                        str(flow or "buy"), str(cheaper), amount, min_profit,
+                        execute=True, prefund=prefund,
+                        w3=self.w3, account=self.account, address=self.executor_address,
+                        gas=EXECUTOR_GAS,
+                    )
+                    rc, error, tx_hash = (0 if result.success else 1), result.error, result.tx_hash
                 else:
-                    print(f"✗ Trade failed with exit code {result.returncode}")
-                    # Only show error details for unexpected failures
-                    if result.stderr:
-                        # Extract just the error message, not the full trace
-                        error_lines = result.stderr.strip().split('\n')
-                        for line in reversed(error_lines):
-                            if 'Error' in line or 'error' in line or 'Exception' in line:
-                                print(f"   Error: {line.strip()}")
-                                break
-                return False, None
-        
-        except subprocess.TimeoutExpired:
-            print("✗ Trade execution timed out")
-            return False, None
+                    rc = executor.main(cmd[3:])
+        except SystemExit as e:
+            # argparse usage errors and the executors' fatal checks
+            rc = e.code if isinstance(e.code, int) else 1
+            error = None if isinstance(e.code, int) else str(e.code)
         except Exception as e:
-            print(f"✗ Error executing trade: {e}")
-            return False, None
-        # Note: We intentionally persist the merged env file under build/envs for debugging/reuse.
-            
+            rc = 1
+            error = f"{type(e).__name__}: {e}"
+        return rc, error, tx_hash
+
+    def _executor_env(self) -> dict[str, str]:
+        """Env overlay for the executor, rebuilt only when the config changes.
+
+        Precedence: process env > config-derived env > .env files. Process env
+        keys are already in os.environ, so only the config-derived keys it lacks
+        are overlaid (see _patch_env).
+        """
+        if self._merged_env_version != self.config.version:
+            self._merged_env = {
+                k: v for k, v in self.config.to_env_dict().items()
+                if v is not None and k not in os.environ
+            }
+            self._merged_env_version = self.config.version
+        return self._merged_env
+
     def run_loop(self, dry_run: bool = False, prefund: bool = False) -> None:
         """Main monitoring loop."""
         # Get runtime parameters from config
@@ -771,150 +1130,176 @@ class ArbitrageBot:
         interval = self.config.get("bot.run_options.interval_seconds", 120)
         tolerance = self.config.get("bot.run_options.tolerance", 0.04)
         min_profit = self.config.get("bot.run_options.min_profit", 0.0)
+        # Output lines are buffered and written once per phase (_log_flush)
+        log = self._log.append
         
-        print(f"\n🤖 Starting Futarchy Arbitrage Bot")
-        print(f"   Proposal:    {self.config.get('proposal.address', 'N/A')}")
-        print(f"   Amount:      {amount} {self.config.get('proposal.tokens.currency.symbol', 'sDAI')}")
-        print(f"   Interval:    {interval} seconds")
-        print(f"   Tolerance:   {tolerance}")
-        print(f"   Min Profit:  {min_profit}")
-        print(f"   Mode:        {'DRY RUN' if dry_run else 'LIVE'}")
-        print(f"   Prefund:     {prefund}")
-        print("\nPress Ctrl+C to stop\n")
+        log(f"\n🤖 Starting Futarchy Arbitrage Bot")
+        log(f"   Proposal:    {self.config.get('proposal.address', 'N/A')}")
+        log(f"   Amount:      {amount} {self.config.get('proposal.tokens.currency.symbol', 'sDAI')}")
+        log(f"   Interval:    {interval} seconds")
+        log(f"   Tolerance:   {tolerance}")
+        log(f"   Min Profit:  {min_profit}")
+        log(f"   Mode:        {'DRY RUN' if dry_run else 'LIVE'}")
+        log(f"   Prefund:     {prefund}")
+        log("\nPress Ctrl+C to stop\n")
+        self._log_flush()
         
         iteration = 0
+        # Interval multiplier: doubles on each quiet check (see QUIET_FRACTION)
+        quiet_factor = 1
+        # Iterations start every `interval` seconds on the monotonic clock, so
+        # time spent checking/trading doesn't stretch the period
+        next_tick = time.monotonic()
         while True:
             iteration += 1
-            print(f"\n{'='*60}")
-            print(f"Iteration #{iteration} - {time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print('='*60)
+            log(f"\n{'='*60}")
+            log(f"Iteration #{iteration} - {time.strftime('%Y-%m-%d %H:%M:%S')}")
+            log('='*60)
             
             try:
-                bot_type = str(self.config.get("bot.type", "balancer") or "balancer").lower()
-
-                if bot_type == "prediction":
+                if self._exec_future is not None and not self._exec_future.done():
+                    # A timed-out executor call still holds the env overlay
+                    log("\n⏳ Previous executor call has not returned yet; skipping this iteration")
+                elif self.bot_type == "prediction":
                     # In prediction mode we do not do price checks; delegate to executor
                     if not dry_run:
-                        print("\n--- Pre-trade balances (Executor Contract) ---")
-                        balances_before = self.get_balances()
+                        log("\n--- Pre-trade balances (Executor Contract) ---")
+                        balances_before, wallet_balances = self.get_balance_snapshot()
                         sdai_before = balances_before.get("sDAI", 0)
-                        print(f"  sDAI: {sdai_before:.6f}")
+                        log(f"  sDAI: {sdai_before:.6f}")
                         self.check_residual_balances(balances_before)
-                        wallet_balances = self.get_wallet_balances()
                         wallet_sdai_before = wallet_balances.get("sDAI", 0)
-                        print(f"\n--- Wallet sDAI: {wallet_sdai_before:.6f} ---")
+                        log(f"\n--- Wallet sDAI: {wallet_sdai_before:.6f} ---")
 
+                    self._log_flush()
                     success, tx_hash = self.execute_arbitrage(
                         None, None, amount, min_profit, dry_run, prefund
                     )
 
                     if success and not dry_run:
-                        print("\n--- Post-trade balances (Executor Contract) ---")
-                        balances_after = self.get_balances()
+                        log("\n--- Post-trade balances (Executor Contract) ---")
+                        balances_after, wallet_balances_after = self.get_balance_snapshot()
                         sdai_after = balances_after.get("sDAI", 0)
                         sdai_change = sdai_after - sdai_before
-                        print(f"  sDAI: {sdai_after:.6f}")
-                        print(f"  Net sDAI change (Executor): {sdai_change:+.6f} {'✅' if sdai_change >= 0 else '❌'}")
+                        log(f"  sDAI: {sdai_after:.6f}")
+                        log(f"  Net sDAI change (Executor): {sdai_change:+.6f} {'✅' if sdai_change >= 0 else '❌'}")
                         self.check_residual_balances(balances_after)
-                        wallet_balances_after = self.get_wallet_balances()
                         wallet_sdai_after = wallet_balances_after.get("sDAI", 0)
                         wallet_change = wallet_sdai_after - wallet_sdai_before
                         if abs(wallet_change) > 0.000001:
-                            print(f"\n--- Wallet sDAI: {wallet_sdai_after:.6f} (change: {wallet_change:+.6f}) ---")
+                            log(f"\n--- Wallet sDAI: {wallet_sdai_after:.6f} (change: {wallet_change:+.6f}) ---")
 
                         # No price re-fetch in prediction mode; executor already made decision
-                        print("\n📊 Trade Summary:")
-                        print(f"   Flow: delegated to executor")
-                        print(f"   Amount: {amount} sDAI")
-                        print(f"   Net Profit (Executor): {sdai_change:+.6f} sDAI")
-                        print(f"   Min Profit Target: {min_profit:+.6f} sDAI")
-                        print(f"   Target Met: {'✅ Yes' if sdai_change >= min_profit else '❌ No'}")
-                        print(f"   Executor Address: {self.executor_address}")
+                        log("\n📊 Trade Summary:")
+                        log(f"   Flow: delegated to executor")
+                        log(f"   Amount: {amount} sDAI")
+                        log(f"   Net Profit (Executor): {sdai_change:+.6f} sDAI")
+                        log(f"   Min Profit Target: {min_profit:+.6f} sDAI")
+                        log(f"   Target Met: {'✅ Yes' if sdai_change >= min_profit else '❌ No'}")
+                        log(f"   Executor Address: {self.executor_address}")
                         if tx_hash:
-                            print(f"\n🔗 Transaction: https://gnosisscan.io/tx/{tx_hash}")
+                            log(f"\n🔗 Transaction: https://gnosisscan.io/tx/{tx_hash}")
                 else:
                     # Existing flow: prices → opportunity → execute
-                    prices = self.fetch_prices()
+                    success, tx_hash = False, None
+                    # One eth_blockNumber gates the four pool reads
+                    prices = self.fetch_prices(self.w3.eth.block_number)
+                    self._log_flush()
                     flow, cheaper = self.determine_opportunity(prices, tolerance)
+                    if flow is None and self._deviation_prev < tolerance * QUIET_FRACTION:
+                        quiet_factor = min(quiet_factor * 2, QUIET_MAX_FACTOR)
+                    else:
+                        quiet_factor = 1
                     if flow and cheaper:
                         # Get balances before trade
                         if not dry_run:
-                            print("\n--- Pre-trade balances (Executor Contract) ---")
-                            balances_before = self.get_balances()
+                            log("\n--- Pre-trade balances (Executor Contract) ---")
+                            # Executor and wallet balances in one round-trip
+                            balances_before, wallet_balances = self.get_balance_snapshot()
                             sdai_before = balances_before.get("sDAI", 0)
-                            print(f"  sDAI: {sdai_before:.6f}")
+                            log(f"  sDAI: {sdai_before:.6f}")
                             self.check_residual_balances(balances_before)
                             
                             # Also check wallet balance
-                            wallet_balances = self.get_wallet_balances()
                             wallet_sdai_before = wallet_balances.get("sDAI", 0)
-                            print(f"\n--- Wallet sDAI: {wallet_sdai_before:.6f} ---")
+                            log(f"\n--- Wallet sDAI: {wallet_sdai_before:.6f} ---")
                         
                         # Execute trade
+                        self._log_flush()
                         success, tx_hash = self.execute_arbitrage(
                             flow, cheaper, amount, min_profit, dry_run, prefund
                         )
                     
                     if success and not dry_run:
                         # Get balances after trade
-                        print("\n--- Post-trade balances (Executor Contract) ---")
-                        balances_after = self.get_balances()
+                        log("\n--- Post-trade balances (Executor Contract) ---")
+                        balances_after, wallet_balances_after = self.get_balance_snapshot()
                         sdai_after = balances_after.get("sDAI", 0)
                         sdai_change = sdai_after - sdai_before
                         
-                        print(f"  sDAI: {sdai_after:.6f}")
-                        print(f"  Net sDAI change (Executor): {sdai_change:+.6f} {'✅' if sdai_change >= 0 else '❌'}")
+                        log(f"  sDAI: {sdai_after:.6f}")
+                        log(f"  Net sDAI change (Executor): {sdai_change:+.6f} {'✅' if sdai_change >= 0 else '❌'}")
                         
                         # Check for residual balances in executor
                         self.check_residual_balances(balances_after)
                         
                         # Also check wallet balance change
-                        wallet_balances_after = self.get_wallet_balances()
                         wallet_sdai_after = wallet_balances_after.get("sDAI", 0)
                         wallet_change = wallet_sdai_after - wallet_sdai_before
                         if abs(wallet_change) > 0.000001:
-                            print(f"\n--- Wallet sDAI: {wallet_sdai_after:.6f} (change: {wallet_change:+.6f}) ---")
+                            log(f"\n--- Wallet sDAI: {wallet_sdai_after:.6f} (change: {wallet_change:+.6f}) ---")
                         
                         # Re-fetch prices to see impact (respect BOT_TYPE market comparator)
-                        print("\n--- Post-trade prices ---")
-                        new_prices = self.fetch_prices()
+                        log("\n--- Post-trade prices ---")
+                        new_prices = self.fetch_prices(force=True)
                         new_ideal = self.calculate_ideal_price(new_prices)
                         post_market = new_prices.get("market_price")
                         post_label = new_prices.get("market_label", "Market")
                         if post_market is not None:
-                            print(f"  {post_label}:   {post_market:.6f}")
-                            print(f"  Ideal:      {new_ideal:.6f}")
-                            print(f"  Deviation:  {abs(post_market - new_ideal):.6f}")
+                            log(f"  {post_label}:   {post_market:.6f}")
+                            log(f"  Ideal:      {new_ideal:.6f}")
+                            log(f"  Deviation:  {abs(post_market - new_ideal):.6f}")
                         else:
                             # Fallback to Balancer if market unavailable
                             bal_p = new_prices.get("bal_price") or 0.0
-                            print(f"  Balancer:   {bal_p:.6f}")
-                            print(f"  Ideal:      {new_ideal:.6f}")
-                            print(f"  Deviation:  {abs(bal_p - new_ideal):.6f}")
+                            log(f"  Balancer:   {bal_p:.6f}")
+                            log(f"  Ideal:      {new_ideal:.6f}")
+                            log(f"  Deviation:  {abs(bal_p - new_ideal):.6f}")
                         
                         # Summary
-                        print(f"\n📊 Trade Summary:")
-                        print(f"   Flow: {flow.upper()}")
-                        print(f"   Amount: {amount} sDAI")
-                        print(f"   Net Profit (Executor): {sdai_change:+.6f} sDAI")
-                        print(f"   Min Profit Target: {min_profit:+.6f} sDAI")
-                        print(f"   Target Met: {'✅ Yes' if sdai_change >= min_profit else '❌ No'}")
-                        print(f"   Executor Address: {self.executor_address}")
+                        log(f"\n📊 Trade Summary:")
+                        log(f"   Flow: {flow.upper()}")
+                        log(f"   Amount: {amount} sDAI")
+                        log(f"   Net Profit (Executor): {sdai_change:+.6f} sDAI")
+                        log(f"   Min Profit Target: {min_profit:+.6f} sDAI")
+                        log(f"   Target Met: {'✅ Yes' if sdai_change >= min_profit else '❌ No'}")
+                        log(f"   Executor Address: {self.executor_address}")
                         if tx_hash:
-                            print(f"\n🔗 Transaction: https://gnosisscan.io/tx/{tx_hash}")
+                            log(f"\n🔗 Transaction: https://gnosisscan.io/tx/{tx_hash}")
                         
             except KeyboardInterrupt:
-                print("\n\n👋 Shutting down gracefully...")
+                log("\n\n👋 Shutting down gracefully...")
+                self._log_flush()
                 break
             except Exception as e:
-                print(f"\n⚠️ Error in iteration #{iteration}: {e}")
+                log(f"\n⚠️ Error in iteration #{iteration}: {e}")
+                quiet_factor = 1
                 
-            # Wait for next iteration
-            print(f"\n💤 Sleeping for {interval} seconds...")
+            # Wait for next iteration (longer while the market is quiet)
+            next_tick += interval * quiet_factor
+            delay = next_tick - time.monotonic()
+            if delay <= 0:
+                # Overran the period: start now and re-anchor instead of bursting to catch up
+                next_tick = time.monotonic()
+                self._log_flush()
+                continue
+            log(f"\n💤 Sleeping for {delay:.1f} seconds...")
+            self._log_flush()
             try:
-                time.sleep(interval)
+                time.sleep(delay)
             except KeyboardInterrupt:
-                print("\n👋 Shutting down gracefully...")
+                log("\n👋 Shutting down gracefully...")
+                self._log_flush()
                 break
 
 
@@ -1000,15 +1385,9 @@ def main():
 
         # Optional overrides: bot-type and force-flow for prediction mode
         if args.bot_type:
-            if "bot" not in config.config:
-                config.config["bot"] = {}
-            config.config["bot"]["type"] = args.bot_type
+            config.set("bot.type", args.bot_type)
         if args.force_flow:
-            if "bot" not in config.config:
-                config.config["bot"] = {"run_options": {}}
-            if "run_options" not in config.config["bot"]:
-                config.config["bot"]["run_options"] = {}
-            config.config["bot"]["run_options"]["force_flow"] = args.force_flow
+            config.set("bot.run_options.force_flow", args.force_flow)
         
         # Validate we have required runtime parameters
         if not config.get("bot.run_options.amount") and not args.amount:
@@ -1036,17 +1415,20 @@ def main():
         if args.dump_config:
             payload = config.config
             if args.dump_config == "-":
-                print(json.dumps(payload, indent=2))
+                print(_dump_json(payload))
                 return
             outp = Path(args.dump_config)
             outp.parent.mkdir(parents=True, exist_ok=True)
-            outp.write_text(json.dumps(payload, indent=2) + "\n")
+            outp.write_text(_dump_json(payload) + "\n")
             print(f"Wrote merged config to {outp}")
             return
 
         # Create and run bot
         bot = ArbitrageBot(config)
-        bot.run_loop(dry_run=args.dry_run, prefund=args.prefund)
+        try:
+            bot.run_loop(dry_run=args.dry_run, prefund=args.prefund)
+        finally:
+            bot.close()
         
     except Exception as e:
         print(f"Failed to initialize bot: {e}")
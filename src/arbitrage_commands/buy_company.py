@@ -8,12 +8,18 @@ This module handles:
 - Calling runTrade on the executor contract
 """
 
+from __future__ import annotations
+
 import os
 import json
 import time
+from functools import lru_cache
 from pathlib import Path
-from decimal import Decimal
+from decimal import Decimal, ROUND_DOWN
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 from eth_account import Account
 
@@ -23,6 +29,9 @@ from src.trades.balancer_vault import (
     build_execute10_buy_aave_gno,
 )
 
+# sDAI / Aave GNO both use 18 decimals
+WEI_PER_TOKEN = Decimal(10) ** 18
+
 # Minimal ERC20
 ERC20_ABI = [
     {"constant": False, "inputs": [{"name": "_to","type": "address"},{"name":"_value","type":"uint256"}],
@@ -31,23 +40,89 @@ ERC20_ABI = [
      "name": "balanceOf","outputs":[{"name":"","type":"uint256"}], "type":"function"},
 ]
 
+@lru_cache(maxsize=4)
+def _w3(rpc_url: str) -> Web3:
+    """Web3 per RPC URL over a keep-alive session, shared by every run_balancer_buy call."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.1))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return Web3(Web3.HTTPProvider(rpc_url, session=session))
+
+def _gas_price(w3: Web3, price: int | None = None) -> int:
+    """*price* (read from the node if not given) floored at 1 gwei, the gnosis min."""
+    if price is None:
+        price = w3.eth.gas_price
+    return max(price, w3.to_wei(1, "gwei"))
+
+# lowercased executor address -> deployment JSON path, built by _abi_index()
+_ABI_INDEX: dict[str, Path] | None = None
+
+def _abi_index(refresh: bool = False) -> dict[str, Path]:
+    """Scan the deployment JSONs once and index them by executor address."""
+    global _ABI_INDEX
+    if _ABI_INDEX is None or refresh:
+        index = {}
+        for p in Path(".").glob("deployment_executor_v4_*.json"):
+            with open(p) as f:
+                data = json.load(f)
+            index.setdefault(data.get("address", "").lower(), p)
+        _ABI_INDEX = index
+    return _ABI_INDEX
+
+@lru_cache(maxsize=32)
+def _load_abi(address_lower: str):
+    # A miss rescans once in case the executor was deployed after the index was built
+    path = _abi_index().get(address_lower) or _abi_index(refresh=True)[address_lower]
+    with open(path) as f:
+        return json.load(f)["abi"]
+
 def _load_executor_abi(address: str):
     """Find the deployment JSON with the matching address and return its abi."""
-    for p in Path(".").glob("deployment_executor_v4_*.json"):
-        with open(p) as f:
-            data = json.load(f)
-        if data.get("address","").lower() == address.lower():
-            return data["abi"]
-    raise RuntimeError(f"ABI json not found for executor {address}")
+    try:
+        return _load_abi(address.lower())
+    except KeyError:
+        raise RuntimeError(f"ABI json not found for executor {address}") from None
+
+@lru_cache(maxsize=64)
+def _erc20(w3: Web3, token_addr: str):
+    return w3.eth.contract(address=w3.to_checksum_address(token_addr), abi=ERC20_ABI)
+
+@lru_cache(maxsize=16)
+def _executor_contract(w3: Web3, executor_addr: str):
+    return w3.eth.contract(address=w3.to_checksum_address(executor_addr), abi=_load_executor_abi(executor_addr))
+
+def _prep_reads(w3: Web3, token, owner: str, executor: str) -> tuple[int, int, int, int]:
+    """(balance of owner, balance of executor, gas price, nonce of owner) in one JSON-RPC batch.
+
+    Falls back to sequential calls when the node rejects batch requests.
+    """
+    try:
+        with w3.batch_requests() as batch:
+            batch.add(token.functions.balanceOf(owner))
+            batch.add(token.functions.balanceOf(executor))
+            batch.add(w3.eth.gas_price)
+            batch.add(w3.eth.get_transaction_count(owner))
+            bal_eoa, bal_exec, gas_px, nonce = batch.execute()
+        gas_px = _gas_price(w3, gas_px)
+    except Exception:
+        bal_eoa = token.functions.balanceOf(owner).call()
+        bal_exec = token.functions.balanceOf(executor).call()
+        gas_px = _gas_price(w3)
+        nonce = w3.eth.get_transaction_count(owner)
+    return bal_eoa, bal_exec, gas_px, nonce
 
 def _maybe_fund_executor(w3: Web3, account, token_addr: str, executor: str, need: int, *, dry_run: bool):
-    """Fund executor with tokens if needed."""
-    token = w3.eth.contract(address=w3.to_checksum_address(token_addr), abi=ERC20_ABI)
-    bal_eoa = token.functions.balanceOf(account.address).call()
-    bal_exec = token.functions.balanceOf(executor).call()
+    """Fund executor with tokens if needed.
+
+    Returns ``(funding tx hash or None, nonce, gas price)``; the nonce is the
+    next one free for *account* once the funding transfer (if any) is mined.
+    """
+    token = _erc20(w3, token_addr)
+    bal_eoa, bal_exec, gas_px, nonce = _prep_reads(w3, token, account.address, executor)
     deficit = max(0, need - bal_exec)
     if deficit == 0:
-        return None
+        return None, nonce, gas_px
     if bal_eoa < deficit:
         raise SystemExit(f"Insufficient token balance. Need {w3.from_wei(deficit,'ether')} more.")
 
@@ -55,20 +130,20 @@ def _maybe_fund_executor(w3: Web3, account, token_addr: str, executor: str, need
     
     tx = token.functions.transfer(executor, deficit).build_transaction({
         "from": account.address,
-        "nonce": w3.eth.get_transaction_count(account.address),
-        "gasPrice": max(w3.eth.gas_price, w3.to_wei(1, "gwei")),  # gnosis min
+        "nonce": nonce,
+        "gasPrice": gas_px,
         "gas": 100_000,
     })
     if dry_run:
         print(f"[dry-run] Would fund executor with {w3.from_wei(deficit,'ether')} tokens")
-        return None
+        return None, nonce, gas_px
     signed = account.sign_transaction(tx)
     h = w3.eth.send_raw_transaction(signed.raw_transaction)
     rcpt = w3.eth.wait_for_transaction_receipt(h)
     if rcpt.status != 1:
         raise SystemExit("Funding transfer failed")
     print(f"  ✅ Funded: {h.hex()}")
-    return h.hex()
+    return h.hex(), nonce + 1, gas_px
 
 def run_balancer_buy(
     *,
@@ -87,12 +162,11 @@ def run_balancer_buy(
     
     print("\n=== Balancer Buy Company (via runTrade) ===\n")
     
-    w3 = Web3(Web3.HTTPProvider(rpc_url))
+    w3 = _w3(rpc_url)
     acct = Account.from_key(private_key)
 
-    # Load ABI
-    abi = _load_executor_abi(executor_addr)
-    executor = w3.eth.contract(address=w3.to_checksum_address(executor_addr), abi=abi)
+    # Load ABI (contract object cached per connection/address)
+    executor = _executor_contract(w3, executor_addr)
 
     cfg = VaultConfig(
         vault=w3.to_checksum_address(balancer_vault),
@@ -102,7 +176,7 @@ def run_balancer_buy(
         # Router defaults are set in VaultConfig
     )
 
-    amount_in_wei = w3.to_wei(amount_cur_in, "ether")
+    amount_in_wei = int((amount_cur_in * WEI_PER_TOKEN).to_integral_value(rounding=ROUND_DOWN))
     
     print(f"📊 Configuration:")
     print(f"  Amount in: {amount_cur_in} sDAI ({amount_in_wei} wei)")
@@ -123,7 +197,9 @@ def run_balancer_buy(
         min_out_wei = 1
 
     # Optional: pre-fund the executor with sDAI
-    fund_hash = _maybe_fund_executor(w3, acct, token_cur, executor.address, amount_in_wei, dry_run=dry_run)
+    fund_hash, nonce, gas_px = _maybe_fund_executor(
+        w3, acct, token_cur, executor.address, amount_in_wei, dry_run=dry_run
+    )
 
     # Build the Execute10Batch
     print(f"\n🔧 Building Execute10Batch...")
@@ -135,8 +211,8 @@ def run_balancer_buy(
     print(f"\n🚀 Preparing runTrade transaction...")
     tx = executor.functions.runTrade(batch).build_transaction({
         "from": acct.address,
-        "nonce": w3.eth.get_transaction_count(acct.address),
-        "gasPrice": max(w3.eth.gas_price, w3.to_wei(1, "gwei")),
+        "nonce": nonce,
+        "gasPrice": gas_px,
         "gas": 900_000,  # generous; tighten after observing
     })
 
@@ -22,7 +22,7 @@ from src.helpers.balancer_swap import (
     parse_simulated_swap_results as parse_simulated_balancer_results,
     parse_broadcasted_swap_results as parse_broadcasted_balancer_results,
 )
-from src.helpers.blockchain_sender import send_tenderly_tx_onchain
+from src.helpers.blockchain_sender import send_tenderly_txs_batch_onchain
 from src.helpers.conditional_sdai_liquidation import (
     build_conditional_sdai_liquidation_steps,
     build_liquidate_remaining_conditional_sdai_tx,
@@ -46,13 +46,11 @@ company_collateral_addr = w3.to_checksum_address(os.environ["COMPANY_TOKEN_ADDRE
 # --------------------------------------------------------------------------- #
 
 def _send_bundle_onchain(bundle):
-    """Broadcast every tx in *bundle* with sequential nonces and return their hashes."""
-    starting_nonce = w3.eth.get_transaction_count(acct.address)
-    tx_hashes = []
-    for i, tx in enumerate(bundle):
-        tx_hash = send_tenderly_tx_onchain(tx, nonce=starting_nonce + i)
-        tx_hashes.append(tx_hash)
-    return tx_hashes
+    """Broadcast every tx in *bundle* with sequential nonces in one JSON-RPC batch.
+
+    Returns their hashes in bundle order (``None`` for txs the node rejected).
+    """
+    return send_tenderly_txs_batch_onchain(bundle)
 
 
 def build_step_1_swap_steps(split_amount_in_wei, gno_amount_in_wei, price=1000):
@@ -278,6 +276,8 @@ def buy_gno_yes_and_no_amounts_with_sdai_single(
 
         # Walk over tx hashes and matching handlers to enrich state
         for (tx_hash, (_, handler)) in zip(tx_hashes, steps):
+            if tx_hash is None:
+                continue
             # SwapR swaps expose metadata via attributes
             if hasattr(handler, "label_kind"):
                 swap_res = parse_broadcasted_swapr_results(tx_hash, fixed=handler.fixed_kind)
@@ -333,8 +333,13 @@ def buy_gno_yes_and_no_amounts_with_sdai_single(
         print("Simulation failed or returned no results.")
     return state
 
-def buy_gno_yes_and_no_amounts_with_sdai(amount, *, broadcast=False):
-    """Calculates the best split based on multiple simulations"""
+def buy_gno_yes_and_no_amounts_with_sdai(amount, *, broadcast=False, calibrate=False):
+    """Calculates the best split based on multiple simulations
+
+    The exact-out input amounts are estimated linearly from the first
+    simulation's exchange rates, so only two Tenderly round-trips are made.
+    ``calibrate=True`` runs the old exact-out calibration simulation instead.
+    """
     # First simulation: No GNO swap limit
     result = buy_gno_yes_and_no_amounts_with_sdai_single(
         amount, None, None
@@ -343,6 +348,11 @@ def buy_gno_yes_and_no_amounts_with_sdai(amount, *, broadcast=False):
     # Extract amounts from the first simulation result
     amount_out_yes_wei = result['amount_out_yes_wei']
     amount_out_no_wei = result['amount_out_no_wei']
+    if not amount_out_yes_wei or not amount_out_no_wei:
+        # No usable rate from the first simulation: calibrate by simulation instead
+        calibrate = True
+        amount_out_yes_wei = amount_out_yes_wei or 0
+        amount_out_no_wei = amount_out_no_wei or 0
 
     # Step 2: Determine the limiting amount between YES and NO tokens
     if amount_out_yes_wei > amount_out_no_wei:
@@ -352,22 +362,20 @@ def buy_gno_yes_and_no_amounts_with_sdai(amount, *, broadcast=False):
 
     amount_out_limited = w3.from_wei(amount_out_limited_wei, "ether")  # gno_amount in ETH
 
-    # Run second simulation with GNO amount limit
-    result = buy_gno_yes_and_no_amounts_with_sdai_single(
-        amount, amount_out_limited, None
-    )
-
-    # Extract amounts from the second simulation result
-    amount_out_yes_wei = result['amount_out_yes_wei']
-    amount_out_no_wei = result['amount_out_no_wei']
-    if amount_out_yes_wei > amount_out_no_wei:
-        amount_out_cond_limited_wei = amount_out_no_wei
+    if calibrate:
+        # Run second simulation with GNO amount limit
+        result = buy_gno_yes_and_no_amounts_with_sdai_single(
+            amount, amount_out_limited, None
+        )
+        amount_in_yes_wei = result['amount_in_yes_wei']
+        amount_in_no_wei = result['amount_in_no_wei']
     else:
-        amount_out_cond_limited_wei = amount_out_yes_wei
-    # amount_out_cond_limited = w3.from_wei(amount_out_cond_limited_wei, "ether")
+        # sDAI needed per side to get amount_out_limited_wei at the first sim's rate
+        split_amount_in_wei = w3.to_wei(Decimal(amount), "ether")
+        amount_in_yes_wei = split_amount_in_wei * amount_out_limited_wei // amount_out_yes_wei
+        amount_in_no_wei = split_amount_in_wei * amount_out_limited_wei // amount_out_no_wei
+
     # Step 3: Calculate conditional sDAI liquidation amount
-    amount_in_yes_wei = result['amount_in_yes_wei']
-    amount_in_no_wei = result['amount_in_no_wei']
     liquidate_conditional_sdai_amount_wei = amount_in_yes_wei - amount_in_no_wei
     if liquidate_conditional_sdai_amount_wei > 0:
         liquidate_conditional_sdai_amount = w3.from_wei(liquidate_conditional_sdai_amount_wei, "ether")
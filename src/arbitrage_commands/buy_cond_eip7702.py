@@ -12,63 +12,76 @@ FUTARCHY_ROUTER = "0x..."
 SWAPR_ROUTER = "0x..."
 BALANCER_VAULT = "0x..."
 
+# Function selectors, hashed once at import
+_SEL_APPROVE = keccak(text="approve(address,uint256)")[:4]  # 0x095ea7b3
+_SEL_SPLIT_POSITION = keccak(text="splitPosition(address,address,uint256)")[:4]
+_SEL_MERGE_POSITIONS = keccak(text="mergePositions(address,address,uint256)")[:4]
+# exactInputSingle((address,address,address,uint256,uint256,uint256,uint160))
+_SEL_EXACT_IN_SINGLE = keccak(
+    text="exactInputSingle((address,address,address,uint256,uint256,uint256,uint160))"
+)[:4]
+
+_MAX_U256_INT = 2**256 - 1  # "no deadline"
+_MAX_U256_BYTES = _MAX_U256_INT.to_bytes(32, "big")
+_ZERO_U256 = bytes(32)
+
+# Every argument below is a static ABI word (address or uint), so calldata is
+# just the selector followed by 32-byte big-endian words
+def _enc_addr(addr: str) -> bytes:
+    return bytes(12) + bytes.fromhex(addr[2:].zfill(40))
+
+def _enc_u256(x: int) -> bytes:
+    return x.to_bytes(32, "big")
+
 def encode_approval(token: str, spender: str, amount: int) -> Dict[str, Any]:
     """Encode ERC20 approve call."""
-    # approve(address,uint256) selector: 0x095ea7b3
-    data = keccak(text="approve(address,uint256)")[:4] + \
-           Web3.solidity_encode(["address", "uint256"], [spender, amount])
     return {
         "to": token,
-        "data": data,
+        "data": _SEL_APPROVE + _enc_addr(spender) + _enc_u256(amount),
         "value": 0
     }
 
 def encode_split(router: str, proposal: str, collateral: str, amount: int) -> Dict[str, Any]:
     """Encode FutarchyRouter splitPosition call."""
-    # splitPosition(address,address,uint256)
-    selector = keccak(text="splitPosition(address,address,uint256)")[:4]
-    data = selector + Web3.solidity_encode(["address", "address", "uint256"], [proposal, collateral, amount])
     return {
         "to": router,
-        "data": data,
+        "data": _SEL_SPLIT_POSITION + _enc_addr(proposal) + _enc_addr(collateral) + _enc_u256(amount),
         "value": 0
     }
 
 def encode_merge(router: str, proposal: str, collateral: str, amount: int) -> Dict[str, Any]:
     """Encode FutarchyRouter mergePositions call."""
-    # mergePositions(address,address,uint256)
-    selector = keccak(text="mergePositions(address,address,uint256)")[:4]
-    data = selector + Web3.solidity_encode(["address", "address", "uint256"], [proposal, collateral, amount])
     return {
         "to": router,
-        "data": data,
+        "data": _SEL_MERGE_POSITIONS + _enc_addr(proposal) + _enc_addr(collateral) + _enc_u256(amount),
         "value": 0
     }
 
-def encode_swapr_exact_in(router: str, token_in: str, token_out: str, amount_in: int, min_out: int, recipient: str) -> Dict[str, Any]:
+def encode_swapr_exact_in(
+    router: str,
+    token_in: str,
+    token_out: str,
+    amount_in: int,
+    min_out: int,
+    recipient: str,
+    deadline: int = _MAX_U256_INT,
+) -> Dict[str, Any]:
     """Encode Swapr/UniswapV3 exactInputSingle call."""
-    # exactInputSingle((address,address,address,uint256,uint256,uint256,uint160))
     # Struct: tokenIn, tokenOut, recipient, deadline, amountIn, amountOutMinimum, sqrtPriceLimitX96
-    selector = keccak(text="exactInputSingle((address,address,address,uint256,uint256,uint256,uint160))")[:4]
-    
-    params = [
-        token_in,
-        token_out,
-        recipient,
-        2**256 - 1, # deadline
-        amount_in,
-        min_out,
-        0 # sqrtPriceLimitX96
-    ]
-    
-    encoded_params = Web3.solidity_encode(
-        ["address", "address", "address", "uint256", "uint256", "uint256", "uint160"],
-        params
-    )
-    
+    # (all static, so the tuple is encoded inline)
+    data = b"".join((
+        _SEL_EXACT_IN_SINGLE,
+        _enc_addr(token_in),
+        _enc_addr(token_out),
+        _enc_addr(recipient),
+        _MAX_U256_BYTES if deadline == _MAX_U256_INT else _enc_u256(deadline),
+        _enc_u256(amount_in),
+        _enc_u256(min_out),
+        _ZERO_U256,  # sqrtPriceLimitX96
+    ))
     return {
         "to": router,
-        "data": selector + encoded_params,
+        "data": data,
         "value": 0
     }
 
@@ -85,8 +98,15 @@ def build_buy_conditional_bundle(
     Build the sequence of calls for Buy Conditional Arb.
     Flow: Split sDAI -> Swap YES/NO sDAI to Company -> Merge Company -> Sell Company for sDAI
     """
+    # Validate addresses once; the encoders above take them as-is
+    proposal = w3.to_checksum_address(proposal)
+    collateral_token = w3.to_checksum_address(collateral_token)
+    conditional_tokens = {k: w3.to_checksum_address(v) for k, v in conditional_tokens.items()}
+    company_token = w3.to_checksum_address(company_token)
+    recipient = w3.to_checksum_address(recipient)
+
     calls = []
-    
+
     # 1. Approve sDAI to FutarchyRouter
     calls.append(encode_approval(collateral_token, FUTARCHY_ROUTER, amount_in))
     
@@ -17,7 +17,7 @@ from src.helpers.balancer_swap import (
     parse_simulated_swap_results as parse_simulated_balancer_results,
     parse_broadcasted_swap_results as parse_broadcasted_balancer_results,
 )
-from src.helpers.blockchain_sender import send_tenderly_tx_onchain
+from src.helpers.blockchain_sender import send_tenderly_txs_batch_onchain
 from src.helpers.conditional_sdai_liquidation import (
     build_conditional_sdai_liquidation_steps,
     build_liquidate_remaining_conditional_sdai_tx,
@@ -41,13 +41,11 @@ company_collateral_addr = w3.to_checksum_address(os.environ["COMPANY_TOKEN_ADDRE
 # --------------------------------------------------------------------------- #
 
 def _send_bundle_onchain(bundle):
-    """Broadcast every tx in *bundle* with sequential nonces and return their hashes."""
-    starting_nonce = w3.eth.get_transaction_count(acct.address)
-    tx_hashes = []
-    for i, tx in enumerate(bundle):
-        tx_hash = send_tenderly_tx_onchain(tx, nonce=starting_nonce + i)
-        tx_hashes.append(tx_hash)
-    return tx_hashes
+    """Broadcast every tx in *bundle* with sequential nonces in one JSON-RPC batch.
+
+    Returns their hashes in bundle order (``None`` for txs the node rejected).
+    """
+    return send_tenderly_txs_batch_onchain(bundle)
 
 
 def build_step_2_swap_steps(split_amount_in_wei, sdai_amount_in_wei, price=100):
@@ -305,6 +303,8 @@ def sell_gno_yes_and_no_amounts_to_sdai_single(
 
         # Walk over tx hashes and matching handlers to enrich state
         for (tx_hash, (_tx_dict, handler)) in zip(tx_hashes, steps):
+            if tx_hash is None:
+                continue
             # SwapR swaps expose metadata via attributes
             if hasattr(handler, "label_kind"):
                 swap_res = parse_broadcasted_swapr_results(tx_hash, fixed=handler.fixed_kind)
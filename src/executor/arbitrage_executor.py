@@ -33,6 +33,17 @@ Address resolution order:
 Requires:
   - PRIVATE_KEY and RPC_URL in the sourced env file
   - python-dotenv and web3 installed (see requirements.txt)
+
+In-process use (no interpreter start-up or RPC reconnect):
+  from src.executor.arbitrage_executor import execute
+  result = execute("sell", "yes", 0.01, -0.01, execute=True, w3=w3, account=acct)
+  # result.success, result.tx_hash, result.error
+
+Long-lived worker (one interpreter and RPC connection for many trades):
+  python -m src.executor.arbitrage_executor --env .env.0x... --serve
+  # stdin:  {"flow": "sell", "cheaper": "yes", "amount": 0.01, "min_profit": -0.01,
+  #          "execute": true, "prefund": false}   (one JSON request per line)
+  # stdout: {"ok": bool, "tx": str|null, "err": str|null}   (one line per request)
 """
 
 from __future__ import annotations
@@ -41,8 +52,11 @@ import argparse
 import glob
 import json
 import os
+import sys
+from contextlib import redirect_stdout
 from pathlib import Path
 from decimal import Decimal
+from typing import NamedTuple
 
 from dotenv import load_dotenv
 from web3 import Web3
@@ -127,15 +141,16 @@ def _eip1559_fees(w3: Web3) -> dict:
         return {"gasPrice": gas_price + bump}
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Execute futarchy arbitrage via FutarchyArbExecutorV5")
     p.add_argument("--env", dest="env_file", default=None, help="Path to .env file to load")
     p.add_argument("--address", dest="address", default=None, help="Futarchy V5 contract address (optional)")
-    p.add_argument("--flow", choices=["sell", "buy"], required=True,
+    # --flow/--amount/--cheaper are required unless --serve (checked below)
+    p.add_argument("--flow", choices=["sell", "buy"],
                    help="Trade flow: 'sell' = buy on Balancer then sell conditionals; 'buy' = buy conditionals then sell on Balancer")
-    p.add_argument("--amount", dest="amount", required=True,
+    p.add_argument("--amount", dest="amount",
                    help="sDAI amount to use (in ether units, e.g. 0.01)")
-    p.add_argument("--cheaper", dest="cheaper", choices=["yes", "no"], required=True,
+    p.add_argument("--cheaper", dest="cheaper", choices=["yes", "no"],
                    help="Which conditional token is cheaper: 'yes' or 'no'")
     p.add_argument("--min-profit", dest="min_profit", default="0",
                    help="Minimum profit required in ether units (can be negative for testing)")
@@ -146,7 +161,14 @@ def parse_args() -> argparse.Namespace:
                    help="Actually broadcast the transaction (default is preview-only)")
     p.add_argument("--force-send", action="store_true", help=argparse.SUPPRESS)  # Advanced: force gas + send
     p.add_argument("--gas", dest="gas", type=int, default=10_000_000, help=argparse.SUPPRESS)  # Advanced
-    return p.parse_args()
+    p.add_argument("--serve", action="store_true",
+                   help="Stay running: read JSON trade requests from stdin, answer one JSON line each")
+    args = p.parse_args(argv)
+    if not args.serve:
+        missing = [opt for opt in ("flow", "amount", "cheaper") if getattr(args, opt) is None]
+        if missing:
+            p.error("the following arguments are required: " + ", ".join(f"--{opt}" for opt in missing))
+    return args
 
 
 
@@ -614,21 +636,15 @@ def _exec_buy12(
 
 
 
-def main():
-    args = parse_args()
-    load_env(args.env_file)
-    
-    # Map simplified flags to internal variables
-    amount_in = args.amount
-    yes_cheaper = (args.cheaper == "yes")
-    min_profit_wei = _ether_str_to_signed_wei(args.min_profit)
-    # No CLI overrides for addresses; all read from env
+class ExecutionResult(NamedTuple):
+    """Outcome of :func:`execute`. ``tx_hash`` is None for previews and failures."""
+    success: bool
+    tx_hash: str | None
+    error: str | None = None
 
-    rpc_url = require_env("RPC_URL")
-    private_key = require_env("PRIVATE_KEY")
 
-    if args.address:
-        address = args.address
+def _resolve_v5_address(address: str | None) -> str:
+    if address:
         source_label = "cli --address"
     else:
         address, source_label = discover_v5_address()
@@ -637,7 +653,105 @@ def main():
             "Could not determine V5 address. Pass --address, set FUTARCHY_ARB_EXECUTOR_V5/EXECUTOR_V5_ADDRESS, or keep a deployments file."
         )
     print(f"Resolved V5 address: {address} (source: {source_label})")
+    return address
+
+
+def _clamp_gas(requested_gas: int) -> int:
+    # Enforce a minimum gas limit even if the harness passes a lower --gas (when force-sending)
+    try:
+        min_gas = int(os.getenv("MIN_GAS_LIMIT", "10000000"))
+    except Exception:
+        min_gas = 10_000_000
+    requested_gas = int(requested_gas)
+    effective_gas = requested_gas if requested_gas >= min_gas else min_gas
+    if requested_gas < min_gas:
+        print(f"Gas clamp: requested {requested_gas} < min {min_gas}; using {effective_gas}")
+    else:
+        print(f"Gas clamp: using requested gas {effective_gas}")
+    return effective_gas
+
+
+def _run_flow(
+    w3: Web3,
+    account,
+    address: str,
+    flow: str,
+    cheaper: str,
+    amount_in: str,
+    min_profit_wei: int,
+    *,
+    do_send: bool,
+    force_send: bool,
+    prefund: bool,
+    gas: int,
+) -> str:
+    """Dispatch to the SELL/BUY builder; returns the tx hash ("" for previews)."""
+    yes_cheaper = (cheaper == "yes")
+
+    # Execute SELL flow (Balancer buy + unwind)
+    if flow == "sell":
+        _exec_step12_sell.force_send_flag = bool(force_send)
+        _exec_step12_sell.do_send_flag = do_send
+        _exec_step12_sell.force_gas_limit = gas
+        _exec_step12_sell.prefund_flag = bool(prefund)
+        return _exec_step12_sell(w3, account, address, amount_in, yes_cheaper, min_profit_wei)
+    
+    # Execute BUY flow (split + dual swaps + merge)
+    elif flow == "buy":
+        _exec_buy12.force_send_flag = bool(force_send)
+        _exec_buy12.do_send_flag = do_send
+        _exec_buy12.force_gas_limit = gas
+        _exec_buy12.prefund_flag = bool(prefund)
+        _exec_buy12.min_out_final_wei = min_profit_wei
+        return _exec_buy12(w3, account, address, amount_in, yes_cheaper)
+    
+    else:
+        raise SystemExit("Invalid flow. Use --flow sell or --flow buy")
+
+
+def execute(
+    flow: str,
+    cheaper: str,
+    amount,
+    min_profit,
+    execute: bool = False,
+    prefund: bool = False,
+    *,
+    w3: Web3,
+    account,
+    address: str | None = None,
+    force_send: bool = False,
+    gas: int = 10_000_000,
+) -> ExecutionResult:
+    """Run one arbitrage flow on an existing connection; the CLI minus env/RPC setup.
+
+    Errors (including the ``SystemExit`` the helpers raise) are returned in
+    ``ExecutionResult.error`` instead of propagating.
+    """
+    try:
+        address = _resolve_v5_address(address)
+        tx_hash = _run_flow(
+            w3, account, address, flow, cheaper,
+            str(amount), _ether_str_to_signed_wei(str(min_profit)),
+            do_send=bool(execute or force_send),
+            force_send=force_send,
+            prefund=prefund,
+            gas=_clamp_gas(gas),
+        )
+    except (Exception, SystemExit) as e:
+        return ExecutionResult(False, None, str(e))
+    return ExecutionResult(True, tx_hash or None)
+
 
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    if args.serve:
+        return _serve(args)
+    _run_cli(args)
+    return 0
+
+
+def _connect(rpc_url: str) -> Web3:
     w3 = Web3(Web3.HTTPProvider(rpc_url))
     # POA chains (e.g., Gnosis) may require this middleware; harmless elsewhere.
     try:
@@ -651,6 +765,54 @@ def main():
             pass
     if not w3.is_connected():
         raise SystemExit("Failed to connect to RPC_URL")
+    return w3
+
+
+def _serve(args: argparse.Namespace) -> int:
+    """Worker loop for ``--serve``: connect once, then run one trade per stdin line.
+
+    stdout carries only the JSON replies; everything the flows print goes to
+    stderr. Exits when stdin closes.
+    """
+    out = sys.stdout
+    with redirect_stdout(sys.stderr):
+        load_env(args.env_file)
+        w3 = _connect(require_env("RPC_URL"))
+        acct = Account.from_key(require_env("PRIVATE_KEY"))
+        address = _resolve_v5_address(args.address)
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            try:
+                req = json.loads(line)
+                result = execute(
+                    req["flow"], req["cheaper"], req["amount"], req.get("min_profit", 0),
+                    execute=bool(req.get("execute")),
+                    prefund=bool(req.get("prefund")),
+                    w3=w3, account=acct, address=address,
+                    force_send=bool(req.get("force_send", args.force_send)),
+                    gas=int(req.get("gas", args.gas)),
+                )
+            except (ValueError, KeyError, TypeError) as e:
+                result = ExecutionResult(False, None, f"bad request: {e}")
+            out.write(json.dumps({"ok": result.success, "tx": result.tx_hash, "err": result.error}) + "\n")
+            out.flush()
+    return 0
+
+
+def _run_cli(args: argparse.Namespace) -> str:
+    load_env(args.env_file)
+    
+    # Map simplified flags to internal variables
+    min_profit_wei = _ether_str_to_signed_wei(args.min_profit)
+    # No CLI overrides for addresses; all read from env
+
+    rpc_url = require_env("RPC_URL")
+    private_key = require_env("PRIVATE_KEY")
+
+    address = _resolve_v5_address(args.address)
+
+    w3 = _connect(rpc_url)
 
     acct = Account.from_key(private_key)
     # Helpful visibility: show the sender and contract owner (if callable)
@@ -663,41 +825,19 @@ def main():
         # Non-fatal if ABI/owner() not available
         print(f"Using sender: {acct.address}")
 
-    # Enforce a minimum gas limit even if the harness passes a lower --gas (when force-sending)
-    try:
-        min_gas = int(os.getenv("MIN_GAS_LIMIT", "10000000"))
-    except Exception:
-        min_gas = 10_000_000
-    requested_gas = int(args.gas)
-    effective_gas = requested_gas if requested_gas >= min_gas else min_gas
-    if requested_gas < min_gas:
-        print(f"Gas clamp: requested {requested_gas} < min {min_gas}; using {effective_gas}")
-    else:
-        print(f"Gas clamp: using requested gas {effective_gas}")
+    effective_gas = _clamp_gas(args.gas)
 
     # Decide whether to actually send. --force-send implies --execute.
     do_send = bool(args.execute or args.force_send)
 
-    # Execute SELL flow (Balancer buy + unwind)
-    if args.flow == "sell":
-        _exec_step12_sell.force_send_flag = bool(args.force_send)
-        _exec_step12_sell.do_send_flag = do_send
-        _exec_step12_sell.force_gas_limit = effective_gas
-        _exec_step12_sell.prefund_flag = bool(args.prefund)
-        _exec_step12_sell(w3, acct, address, amount_in, yes_cheaper, min_profit_wei)
-    
-    # Execute BUY flow (split + dual swaps + merge)
-    elif args.flow == "buy":
-        _exec_buy12.force_send_flag = bool(args.force_send)
-        _exec_buy12.do_send_flag = do_send
-        _exec_buy12.force_gas_limit = effective_gas
-        _exec_buy12.prefund_flag = bool(args.prefund)
-        _exec_buy12.min_out_final_wei = min_profit_wei
-        _exec_buy12(w3, acct, address, amount_in, yes_cheaper)
-    
-    else:
-        raise SystemExit("Invalid flow. Use --flow sell or --flow buy")
+    return _run_flow(
+        w3, acct, address, args.flow, args.cheaper, args.amount, min_profit_wei,
+        do_send=do_send,
+        force_send=args.force_send,
+        prefund=args.prefund,
+        gas=effective_gas,
+    )
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -112,7 +112,7 @@ def _eip1559_fees(w3: Web3) -> dict:
         return {"gasPrice": gas_price + bump}
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Execute futarchy arbitrage (PNK variant) via FutarchyArbExecutorV5")
     p.add_argument("--env", dest="env_file", default=None, help="Path to .env file to load")
     p.add_argument("--address", dest="address", default=None, help="Futarchy V5 contract address (optional)")
@@ -128,7 +128,7 @@ def parse_args() -> argparse.Namespace:
                    help="Transfer sDAI from your wallet to the executor contract before execution")
     p.add_argument("--force-send", action="store_true", help=argparse.SUPPRESS)  # Hidden for advanced use
     p.add_argument("--gas", dest="gas", type=int, default=3_000_000, help=argparse.SUPPRESS)  # Hidden
-    return p.parse_args()
+    return p.parse_args(argv)
 
 
 def _ether_str_to_signed_wei(value_str: str) -> int:
@@ -545,8 +545,8 @@ def _exec_buy12(
     return txh0x
 
 
-def main():
-    args = parse_args()
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
     load_env(args.env_file)
 
     # Map simplified flags to internal variables
@@ -601,7 +601,8 @@ def main():
 
     else:
         raise SystemExit("Invalid flow. Use --flow sell or --flow buy")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
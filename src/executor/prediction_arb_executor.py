@@ -136,7 +136,7 @@ def _oriented_price(w3: Web3, pool_addr: str, want_base: str, want_quote: str) -
     )
 
 
-def main():
+def main(argv: list[str] | None = None) -> int:
     p = argparse.ArgumentParser(description="Prediction arbitrage (off-chain logic → on-chain V1 executor)")
     p.add_argument("--env", dest="env_file", default=None, help="Path to .env file")
     p.add_argument("--amount", required=True, help="Amount of {currency} (ether units) for the arb logic")
@@ -153,7 +153,7 @@ def main():
     # Advanced controls (hidden): allow bypassing gas estimation and force a gas limit
     p.add_argument("--force-send", action="store_true", help=argparse.SUPPRESS)
     p.add_argument("--gas", dest="gas", type=int, default=1_500_000, help=argparse.SUPPRESS)
-    args = p.parse_args()
+    args = p.parse_args(argv)
 
     load_env(args.env_file)
     rpc_url = require_env("RPC_URL")
@@ -330,7 +330,7 @@ def main():
         ).build_transaction(params)
     else:
         print("No-op: yes_price + no_price == 1 (within precision) or no decision available")
-        return
+        return 0
 
     # Gas limit
     if "gas" not in tx:
@@ -350,7 +350,8 @@ def main():
     print(f"Blockscout:  https://gnosis.blockscout.com/tx/{txh}")
     rcpt = w3.eth.wait_for_transaction_receipt(txh)
     print(f"Success: {rcpt.status == 1}; Gas used: {rcpt.gasUsed}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
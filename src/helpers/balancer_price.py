@@ -7,6 +7,13 @@ get_pool_price(w3, pool_address, *, base_token_index=0, vault_addr=None)
     Return (price, base_token_addr, quote_token_addr) where *price* is a
     Decimal giving the amount of *quote* per 1 *base*.
 
+build_calls(w3, pool_address, *, vault_addr=None)
+    Multicall3 call triple (see ``helpers.multicall``) for the pool's
+    ``(tokens, balancesRaw)``.
+
+price_from_state(tokens, balances_raw, decimals, *, base_token_index=0)
+    The price computation of ``get_pool_price`` on already-fetched values.
+
 The layout mirrors `balancer_swap.py`: a tiny ENV-aware helper and no
 explicit error handling.
 """
@@ -17,8 +24,9 @@ from decimal import Decimal
 from web3 import Web3
 
 from config.abis import BALANCER_VAULT_V3_ABI, ERC20_ABI
+from helpers.multicall import Call, fn_call
 
-__all__ = ["get_pool_price"]
+__all__ = ["get_pool_price", "build_calls", "price_from_state"]
 
 # --------------------------------------------------------------------------- #
 # helpers                                                                     #
@@ -63,8 +71,37 @@ def get_pool_price(
     i = base_token_index
     j = 1 if i == 0 else 0
 
-    bal_i = Decimal(balances_raw[i]) / (10 ** _decimals(w3, tokens[i]))
-    bal_j = Decimal(balances_raw[j]) / (10 ** _decimals(w3, tokens[j]))
+    decimals = {tokens[i]: _decimals(w3, tokens[i]), tokens[j]: _decimals(w3, tokens[j])}
+    return price_from_state(tokens, balances_raw, decimals, base_token_index=i)
+
+
+def build_calls(w3: Web3, pool_address: str, *, vault_addr: str | None = None) -> list[Call]:
+    """Multicall3 call for ``(tokens, balancesRaw)`` of a Balancer V3 pool."""
+    vault = _get_vault(w3, vault_addr)
+    target, data, decode_info = fn_call(
+        vault.address, BALANCER_VAULT_V3_ABI, "getPoolTokenInfo", w3.to_checksum_address(pool_address)
+    )
+
+    def _decode(raw: bytes):
+        tokens, _, balances_raw, _ = decode_info(raw)
+        return tokens, balances_raw
+
+    return [(target, data, _decode)]
+
+
+def price_from_state(
+    tokens: list[str],
+    balances_raw: list[int],
+    decimals: dict[str, int],
+    *,
+    base_token_index: int = 0,
+) -> tuple[Decimal, str, str]:
+    """``get_pool_price`` on already-fetched balances; *decimals* maps token -> decimals."""
+    i = base_token_index
+    j = 1 if i == 0 else 0
+
+    bal_i = Decimal(balances_raw[i]) / (10 ** decimals[tokens[i]])
+    bal_j = Decimal(balances_raw[j]) / (10 ** decimals[tokens[j]])
 
     return bal_j / bal_i, tokens[i], tokens[j]
 
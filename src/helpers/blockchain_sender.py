@@ -10,7 +10,7 @@ PRIVATE_KEY = os.getenv("PRIVATE_KEY")
 w3 = Web3(Web3.HTTPProvider(RPC_URL))
 acct = Account.from_key(PRIVATE_KEY)
 
-__all__ = ["w3", "acct", "send_tenderly_tx_onchain"]
+__all__ = ["w3", "acct", "send_tenderly_tx_onchain", "send_tenderly_txs_batch_onchain"]
 
 
 def send_tenderly_tx_onchain(tenderly_tx: dict, value: int = 0, nonce: int | None = None) -> str:
@@ -68,6 +68,108 @@ def send_tenderly_tx_onchain(tenderly_tx: dict, value: int = 0, nonce: int | Non
     return hash
 
 
+# Headroom on batched gas estimates: state can move between estimate and inclusion
+GAS_ESTIMATE_MARGIN = 1.2
+
+
+def _estimate_bundle_gas(bundle: list[dict], fallback: int) -> list[int]:
+    """Gas limit per tx of *bundle*, estimated in one JSON-RPC batch.
+
+    A tx that only works after an earlier bundle tx (e.g. a swap of freshly
+    split tokens) fails to estimate against the current state and gets
+    *fallback*, like ``send_tenderly_tx_onchain`` does.
+    """
+    calls = [
+        {"from": acct.address, "to": tx["to"], "data": tx["input"], "value": "0x0"}
+        for tx in bundle
+    ]
+    responses = w3.provider.make_batch_request([("eth_estimateGas", [c]) for c in calls])
+    if not isinstance(responses, list):
+        # No batch support: estimate one by one
+        responses = []
+        for c in calls:
+            try:
+                responses.append({"result": hex(w3.eth.estimate_gas({**c, "value": 0}))})
+            except Exception as err:
+                responses.append({"error": str(err)})
+    limits = []
+    for i, resp in enumerate(responses):
+        if "error" in resp:
+            print(f"estimate_gas failed for tx {i}, using {fallback:_} fallback ->", resp["error"])
+            limits.append(fallback)
+        else:
+            limits.append(int(int(resp["result"], 16) * GAS_ESTIMATE_MARGIN))
+    return limits
+
+
+def send_tenderly_txs_batch_onchain(
+    bundle: list[dict], starting_nonce: int | None = None, gas: int = 1_500_000
+) -> list[str | None]:
+    """
+    Sign every tx in *bundle* with ascending nonces and broadcast them in one
+    JSON-RPC batch (an array of ``eth_sendRawTransaction`` requests).
+
+    Gas limits come from one batched ``eth_estimateGas`` (plus
+    GAS_ESTIMATE_MARGIN); txs that can't be estimated before the earlier ones
+    land get *gas*.
+
+    Returns
+    -------
+    list[str | None]
+        One hash per tx, in bundle order; ``None`` where the node rejected the
+        tx (the error is printed).  Waits for the receipt of every tx accepted
+        before the first rejection and reports any that reverted.
+    """
+    latest_block = w3.eth.get_block("latest")
+    base_fee = latest_block.get("baseFeePerGas", w3.eth.gas_price)
+    priority_fee = Web3.to_wei(2, "gwei")
+    max_fee = base_fee + priority_fee * 2
+    chain_id = w3.eth.chain_id
+    if starting_nonce is None:
+        starting_nonce = w3.eth.get_transaction_count(acct.address)
+
+    raw_txs = [
+        acct.sign_transaction(
+            {
+                "to": tenderly_tx["to"],
+                "data": tenderly_tx["input"],
+                "value": 0,
+                "nonce": starting_nonce + i,
+                "maxPriorityFeePerGas": priority_fee,
+                "maxFeePerGas": max_fee,
+                "chainId": chain_id,
+                "gas": gas_limit,
+            }
+        ).raw_transaction
+        for i, (tenderly_tx, gas_limit) in enumerate(zip(bundle, _estimate_bundle_gas(bundle, gas)))
+    ]
+
+    responses = w3.provider.make_batch_request(
+        [("eth_sendRawTransaction", [Web3.to_hex(raw)]) for raw in raw_txs]
+    )
+    tx_hashes: list[str | None] = []
+    if not isinstance(responses, list):
+        # Node rejected the batch as a whole (e.g. no batch support): send one by one
+        print("batch send failed, broadcasting sequentially ->", responses.get("error"))
+        for raw in raw_txs:
+            tx_hashes.append(Web3.to_hex(w3.eth.send_raw_transaction(raw)))
+    else:
+        for i, resp in enumerate(responses):
+            if "error" in resp:
+                print(f"tx {i} (nonce {starting_nonce + i}) rejected ->", resp["error"])
+                tx_hashes.append(None)
+            else:
+                tx_hashes.append(resp["result"])
+
+    # Nonces after a rejected tx can't be mined, so only wait for the prefix
+    mined = tx_hashes[: tx_hashes.index(None)] if None in tx_hashes else tx_hashes
+    for i, tx_hash in enumerate(mined):
+        receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
+        if receipt.status != 1:
+            print(f"tx {i} (nonce {starting_nonce + i}) reverted on-chain -> {tx_hash}")
+    return tx_hashes
+
+
 # --------------------------------------------------------------------------- #
 # Minimal CLI helper                                                           #
 # --------------------------------------------------------------------------- #
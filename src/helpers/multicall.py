@@ -0,0 +1,102 @@
+"""
+Helper for batching read-only contract calls through Multicall3.
+
+Public API
+----------
+fn_call(target, abi, fn_name, *args)
+    Build a ``(target, calldata, decoder)`` triple for a view function of
+    *abi*.  ``decoder(return_data)`` mirrors ``ContractFunction.call()``:
+    a single output is returned bare, several outputs as a tuple.
+
+aggregate3(w3, calls, *, allow_failure=False, block_identifier="latest")
+    Run every triple in *calls* in one ``eth_call`` to Multicall3 and return
+    the decoded results in order.  With *allow_failure*, reverted calls come
+    back as ``None`` instead of reverting the whole batch.
+
+Multicall3 is deployed at the same address on Gnosis Chain and every other
+chain this repo targets.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from eth_abi import decode, encode
+from web3 import Web3
+
+__all__ = ["MULTICALL3_ADDRESS", "Call", "fn_call", "aggregate3"]
+
+MULTICALL3_ADDRESS = Web3.to_checksum_address("0xcA11bde05977b3631167028862bE2a173976CA11")
+
+# (target, calldata, decoder)
+Call = tuple[str, bytes, Callable[[bytes], Any]]
+
+_AGGREGATE3_SELECTOR = Web3.keccak(text="aggregate3((address,bool,bytes)[])")[:4]
+
+# --------------------------------------------------------------------------- #
+# helpers                                                                     #
+# --------------------------------------------------------------------------- #
+
+
+def _abi_type(param: dict) -> str:
+    """Canonical type string for an ABI input/output entry (expands tuples)."""
+    typ = param["type"]
+    if typ.startswith("tuple"):
+        inner = ",".join(_abi_type(c) for c in param["components"])
+        return f"({inner}){typ[len('tuple'):]}"
+    return typ
+
+
+def _checksum(typ: str, value):
+    # eth_abi returns lowercase addresses; ContractFunction.call() checksums them
+    if typ == "address":
+        return Web3.to_checksum_address(value)
+    if typ == "address[]":
+        return [Web3.to_checksum_address(v) for v in value]
+    return value
+
+
+def _find_fn(abi: list, fn_name: str) -> dict:
+    for entry in abi:
+        if entry.get("type") == "function" and entry.get("name") == fn_name:
+            return entry
+    raise ValueError(f"function {fn_name!r} not in ABI")
+
+
+# --------------------------------------------------------------------------- #
+# public                                                                      #
+# --------------------------------------------------------------------------- #
+
+
+def fn_call(target: str, abi: list, fn_name: str, *args) -> Call:
+    """``(target, calldata, decoder)`` for ``fn_name(*args)`` on *target*."""
+    fn = _find_fn(abi, fn_name)
+    in_types = [_abi_type(p) for p in fn.get("inputs", [])]
+    out_types = [_abi_type(p) for p in fn.get("outputs", [])]
+    selector = Web3.keccak(text=f"{fn_name}({','.join(in_types)})")[:4]
+    calldata = bytes(selector) + encode(in_types, list(args))
+
+    def _decode(data: bytes):
+        values = [_checksum(t, v) for t, v in zip(out_types, decode(out_types, data))]
+        return values[0] if len(values) == 1 else tuple(values)
+
+    return Web3.to_checksum_address(target), calldata, _decode
+
+
+def aggregate3(
+    w3: Web3,
+    calls: list[Call],
+    *,
+    allow_failure: bool = False,
+    block_identifier: Any = "latest",
+) -> list:
+    """Execute *calls* in a single Multicall3 ``aggregate3`` eth_call."""
+    if not calls:
+        return []
+    payload = [(target, allow_failure, calldata) for target, calldata, _ in calls]
+    data = bytes(_AGGREGATE3_SELECTOR) + encode(["(address,bool,bytes)[]"], [payload])
+    raw = w3.eth.call({"to": MULTICALL3_ADDRESS, "data": data}, block_identifier=block_identifier)
+    (results,) = decode(["(bool,bytes)[]"], bytes(raw))
+    return [
+        decoder(bytes(ret)) if ok else None
+        for (ok, ret), (_, _, decoder) in zip(results, calls)
+    ]
@@ -0,0 +1,106 @@
+"""
+Block-header subscription for driving polling loops off new blocks.
+
+Public API
+----------
+NewHeadsListener(ws_url)
+    ``start()`` opens an ``eth_subscribe("newHeads")`` WebSocket on a daemon
+    thread (reconnecting with exponential backoff).  ``wait(timeout)`` blocks
+    until a new head arrives and returns its block number, or ``None`` once
+    *timeout* seconds pass without one.
+
+Requires the optional ``websockets`` package (already used by
+``scripts/subscribe.py``); ``available()`` reports whether it is installed.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import queue
+import threading
+import time
+
+try:
+    import websockets
+except ImportError:  # optional dependency
+    websockets = None
+
+__all__ = ["NewHeadsListener", "available"]
+
+SUBSCRIBE_NEW_HEADS = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "eth_subscribe",
+    "params": ["newHeads"],
+}
+
+
+def available() -> bool:
+    return websockets is not None
+
+
+class NewHeadsListener:
+    """Feeds block numbers from a ``newHeads`` subscription into a queue."""
+
+    def __init__(self, ws_url: str, *, max_backoff: float = 60.0):
+        if websockets is None:
+            raise RuntimeError("NewHeadsListener requires the 'websockets' package")
+        self.ws_url = ws_url
+        self.max_backoff = max_backoff
+        self._heads: queue.Queue[int] = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="new-heads", daemon=True)
+
+    def start(self) -> "NewHeadsListener":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        asyncio.run(self._listen())
+
+    async def _listen(self) -> None:
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                async with websockets.connect(
+                    self.ws_url, open_timeout=20, close_timeout=10, max_queue=None
+                ) as ws:
+                    await ws.send(json.dumps(SUBSCRIBE_NEW_HEADS))
+                    backoff = 1.0
+                    async for msg in ws:
+                        if self._stop.is_set():
+                            return
+                        head = json.loads(msg).get("params", {}).get("result") or {}
+                        if "number" in head:
+                            self._heads.put(int(head["number"], 16))
+                print(f"Warning: newHeads subscription closed; reconnecting in {backoff:.0f}s")
+            except Exception as e:
+                print(f"Warning: newHeads subscription failed ({e}); reconnecting in {backoff:.0f}s")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def wait(self, timeout: float, stride: int = 1) -> int | None:
+        """Newest block number once a head with ``number % stride == 0`` lands.
+
+        Heads that queued up while the caller was busy are collapsed into the
+        newest one.  Returns ``None`` if *timeout* seconds pass first.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                numbers = [self._heads.get(timeout=remaining)]
+            except queue.Empty:
+                return None
+            while True:
+                try:
+                    numbers.append(self._heads.get_nowait())
+                except queue.Empty:
+                    break
+            if any(n % stride == 0 for n in numbers):
+                return max(numbers)
@@ -11,6 +11,13 @@ get_pool_price(w3, pool_address, *, base_token_index=None)
     - If a token name contains "sdai" (case insensitive), the OTHER token is base
     - This ensures prices are denominated in sDAI (sDAI as quote token)
     - If neither token contains "sdai", defaults to token0 as base
+
+build_calls(w3, pool_address) / token_calls(token0, token1)
+    Multicall3 call triples (see ``helpers.multicall``) for the pool state
+    (globalState, token0, token1) and the token metadata (decimals, name).
+
+price_from_state(pool_address, sqrt_price_x96, token0, token1, dec0, dec1, ...)
+    The price computation of ``get_pool_price`` on already-fetched values.
 """
 from __future__ import annotations
 
@@ -39,8 +46,9 @@ if __name__ == "__main__":
 from web3 import Web3
 from src.config.abis.swapr import ALGEBRA_POOL_ABI
 from src.config.abis import ERC20_ABI
+from src.helpers.multicall import Call, fn_call
 
-__all__ = ["get_pool_price"]
+__all__ = ["get_pool_price", "build_calls", "token_calls", "price_from_state"]
 
 # --------------------------------------------------------------------------- #
 # helpers                                                                     #
@@ -62,6 +70,22 @@ def _get_token_name(w3: Web3, token_addr: str) -> str:
         return ""
 
 
+def _detect_base_index(name0: str, name1: str) -> int:
+    # sDAI should be the quote token, so the OTHER token is base
+    # Check for exact match first
+    if name0 == "savings xdai":
+        return 1  # token1 is base (GNO)
+    if name1 == "savings xdai":
+        return 0  # token0 is base (GNO)
+    # Then check for partial match
+    if "sdai" in name0:
+        return 1  # token1 is base (GNO)
+    if "sdai" in name1:
+        return 0  # token0 is base (GNO)
+    # Default to token0 as base
+    return 0
+
+
 # --------------------------------------------------------------------------- #
 # public                                                                      #
 # --------------------------------------------------------------------------- #
@@ -89,36 +113,81 @@ def get_pool_price(
 
     sqrt_price_x96, *_ = pool.functions.globalState().call()
 
-    # raw price = token1 / token0 with token amounts (not human units)
-    ratio = (Decimal(sqrt_price_x96) / (1 << 96)) ** 2
-
     token0 = pool.functions.token0().call()
     token1 = pool.functions.token1().call()
 
+    # Token names are only needed to auto-detect the base token
+    name0 = name1 = ""
+    if base_token_index is None:
+        name0 = _get_token_name(w3, token0)
+        name1 = _get_token_name(w3, token1)
+
+    return price_from_state(
+        pool_address,
+        sqrt_price_x96,
+        token0,
+        token1,
+        _decimals(w3, token0),
+        _decimals(w3, token1),
+        base_token_index=base_token_index,
+        name0=name0,
+        name1=name1,
+    )
+
+
+def state_call(w3: Web3, pool_address: str) -> Call:
+    """Multicall3 call for the pool's current ``sqrtPriceX96`` (the only mutable input)."""
+    pool = w3.to_checksum_address(pool_address)
+    _, data, decode_state = fn_call(pool, ALGEBRA_POOL_ABI, "globalState")
+    return pool, data, lambda raw: decode_state(raw)[0]
+
+
+def build_calls(w3: Web3, pool_address: str) -> list[Call]:
+    """Multicall3 calls for ``(sqrtPriceX96, token0, token1)`` of an Algebra pool."""
+    pool = w3.to_checksum_address(pool_address)
+    return [
+        state_call(w3, pool),
+        fn_call(pool, ALGEBRA_POOL_ABI, "token0"),
+        fn_call(pool, ALGEBRA_POOL_ABI, "token1"),
+    ]
+
+
+def token_calls(token0: str, token1: str) -> list[Call]:
+    """Multicall3 calls for ``(decimals0, decimals1, name0, name1)``.
+
+    Run them with ``allow_failure=True``: ``name()`` is optional in ERC20.
+    """
+    return [
+        fn_call(token0, ERC20_ABI, "decimals"),
+        fn_call(token1, ERC20_ABI, "decimals"),
+        fn_call(token0, ERC20_ABI, "name"),
+        fn_call(token1, ERC20_ABI, "name"),
+    ]
+
+
+def price_from_state(
+    pool_address: str,
+    sqrt_price_x96: int,
+    token0: str,
+    token1: str,
+    dec0: int,
+    dec1: int,
+    *,
+    base_token_index: int | None = None,
+    name0: str | None = "",
+    name1: str | None = "",
+) -> tuple[Decimal, str, str]:
+    """``get_pool_price`` on already-fetched pool and token values."""
+    # raw price = token1 / token0 with token amounts (not human units)
+    ratio = (Decimal(sqrt_price_x96) / (1 << 96)) ** 2
+
     # Auto-detect base token if not specified
     if base_token_index is None:
-        name0 = _get_token_name(w3, token0).lower()
-        name1 = _get_token_name(w3, token1).lower()
-        
-        # sDAI should be the quote token, so the OTHER token is base
-        # Check for exact match first
-        if name0 == "savings xdai":
-            base_token_index = 1  # token1 is base (GNO)
-        elif name1 == "savings xdai":
-            base_token_index = 0  # token0 is base (GNO)
-        # Then check for partial match
-        elif "sdai" in name0:
-            base_token_index = 1  # token1 is base (GNO)
-        elif "sdai" in name1:
-            base_token_index = 0  # token0 is base (GNO)
-        else:
-            # Default to token0 as base
-            base_token_index = 0
+        name0 = (name0 or "").lower()
+        name1 = (name1 or "").lower()
+        base_token_index = _detect_base_index(name0, name1)
         print(f"Auto-detected base token index: {base_token_index} (pool: {pool_address}, token0: {name0}, token1: {name1})", file=sys.stderr)
 
-    dec0 = _decimals(w3, token0)
-    dec1 = _decimals(w3, token1)
-
     price_0_in_1 = ratio * Decimal(10 ** (dec0 - dec1))
 
     if base_token_index == 0:
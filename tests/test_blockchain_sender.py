@@ -0,0 +1,143 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from web3 import Web3
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# blockchain_sender builds its account at import time
+os.environ.setdefault("PRIVATE_KEY", "0x" + "1" * 64)
+
+from helpers import blockchain_sender
+
+BUNDLE = [
+    {"to": Web3.to_checksum_address("0x" + byte * 20), "input": "0x0" + str(i)}
+    for i, byte in enumerate(("aa", "bb", "cc"), 1)
+]
+
+
+class RecordingAccount:
+    """Signs with the real account and keeps every tx dict it was given."""
+
+    def __init__(self, acct):
+        self.acct = acct
+        self.address = acct.address
+        self.signed = []
+
+    def sign_transaction(self, tx):
+        self.signed.append(tx)
+        return self.acct.sign_transaction(tx)
+
+
+class FakeWeb3:
+    """Answers batches through per-method handlers: handler(index, params) -> response dict."""
+
+    def __init__(self, handlers, batch=True, statuses=None):
+        self.handlers = handlers
+        self.batch = batch
+        self.batches = []
+        self.sequential_estimates = []
+        self.waited = []
+        self.statuses = statuses or {}
+        self.provider = SimpleNamespace(make_batch_request=self.make_batch_request)
+        self.eth = SimpleNamespace(
+            get_block=lambda _: {"baseFeePerGas": 10**9},
+            gas_price=10**9,
+            chain_id=100,
+            get_transaction_count=lambda _: 7,
+            estimate_gas=self.estimate_gas,
+            wait_for_transaction_receipt=self.wait_for_transaction_receipt,
+        )
+
+    def make_batch_request(self, requests):
+        self.batches.append(requests)
+        if not self.batch:
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "no batches"}}
+        return [self.handlers[method](i, params) for i, (method, params) in enumerate(requests)]
+
+    def estimate_gas(self, tx):
+        self.sequential_estimates.append(tx)
+        if tx["to"] == BUNDLE[1]["to"]:
+            raise ValueError("execution reverted")
+        return 50_000
+
+    def wait_for_transaction_receipt(self, tx_hash):
+        self.waited.append(tx_hash)
+        return SimpleNamespace(status=self.statuses.get(tx_hash, 1))
+
+
+def estimate(i, _params):
+    if i == 1:
+        return {"jsonrpc": "2.0", "id": i, "error": {"code": 3, "message": "execution reverted"}}
+    return {"jsonrpc": "2.0", "id": i, "result": hex(100_000 * (i + 1))}
+
+
+def send_ok(i, _params):
+    return {"jsonrpc": "2.0", "id": i, "result": f"0x{i:064x}"}
+
+
+class BatchSenderTests(unittest.TestCase):
+    def run_quietly(self, fn, *args, **kwargs):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            result = fn(*args, **kwargs)
+        return result, out.getvalue()
+
+    def test_estimates_in_one_batch(self):
+        w3 = FakeWeb3({"eth_estimateGas": estimate})
+        with mock.patch.object(blockchain_sender, "w3", w3):
+            limits, out = self.run_quietly(blockchain_sender._estimate_bundle_gas, BUNDLE, 1_500_000)
+
+        margin = blockchain_sender.GAS_ESTIMATE_MARGIN
+        self.assertEqual(limits, [int(100_000 * margin), 1_500_000, int(300_000 * margin)])
+        self.assertEqual(len(w3.batches), 1)
+        self.assertIn("estimate_gas failed for tx 1", out)
+
+    def test_estimates_one_by_one_without_batch_support(self):
+        w3 = FakeWeb3({}, batch=False)
+        with mock.patch.object(blockchain_sender, "w3", w3):
+            limits, _ = self.run_quietly(blockchain_sender._estimate_bundle_gas, BUNDLE, 1_500_000)
+
+        margin = blockchain_sender.GAS_ESTIMATE_MARGIN
+        self.assertEqual(limits, [int(50_000 * margin), 1_500_000, int(50_000 * margin)])
+        self.assertEqual(len(w3.sequential_estimates), 3)
+
+    def test_signs_with_estimated_gas_and_ascending_nonces(self):
+        w3 = FakeWeb3({"eth_estimateGas": estimate, "eth_sendRawTransaction": send_ok})
+        acct = RecordingAccount(blockchain_sender.acct)
+        with mock.patch.object(blockchain_sender, "w3", w3), mock.patch.object(blockchain_sender, "acct", acct):
+            hashes, _ = self.run_quietly(blockchain_sender.send_tenderly_txs_batch_onchain, BUNDLE, gas=900_000)
+
+        margin = blockchain_sender.GAS_ESTIMATE_MARGIN
+        self.assertEqual([tx["gas"] for tx in acct.signed], [int(100_000 * margin), 900_000, int(300_000 * margin)])
+        self.assertEqual([tx["nonce"] for tx in acct.signed], [7, 8, 9])
+        self.assertEqual(hashes, [f"0x{i:064x}" for i in range(3)])
+        self.assertEqual(w3.waited, hashes)
+
+    def test_rejected_tx_stops_the_wait_and_reverts_are_reported(self):
+        def send(i, params):
+            if i == 1:
+                return {"jsonrpc": "2.0", "id": i, "error": {"code": -32000, "message": "nonce too low"}}
+            return send_ok(i, params)
+
+        w3 = FakeWeb3(
+            {"eth_estimateGas": estimate, "eth_sendRawTransaction": send},
+            statuses={f"0x{0:064x}": 0},
+        )
+        with mock.patch.object(blockchain_sender, "w3", w3):
+            hashes, out = self.run_quietly(blockchain_sender.send_tenderly_txs_batch_onchain, BUNDLE, starting_nonce=3)
+
+        self.assertEqual(hashes, [f"0x{0:064x}", None, f"0x{2:064x}"])
+        # Nonce 5 can't be mined behind the rejected nonce 4
+        self.assertEqual(w3.waited, [f"0x{0:064x}"])
+        self.assertIn("tx 1 (nonce 4) rejected", out)
+        self.assertIn("tx 0 (nonce 3) reverted on-chain", out)
+
+
+if __name__ == "__main__":
+    unittest.main()
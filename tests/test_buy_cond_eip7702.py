@@ -0,0 +1,116 @@
+import os
+import sys
+import unittest
+
+from web3 import Web3
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from arbitrage_commands import buy_cond_eip7702 as bundle
+
+ERC20_ABI = [
+    {
+        "type": "function",
+        "name": "approve",
+        "stateMutability": "nonpayable",
+        "inputs": [{"name": "spender", "type": "address"}, {"name": "amount", "type": "uint256"}],
+        "outputs": [{"name": "", "type": "bool"}],
+    }
+]
+
+ROUTER_ABI = [
+    {
+        "type": "function",
+        "name": name,
+        "stateMutability": "nonpayable",
+        "inputs": [
+            {"name": "proposal", "type": "address"},
+            {"name": "collateralToken", "type": "address"},
+            {"name": "amount", "type": "uint256"},
+        ],
+        "outputs": [],
+    }
+    for name in ("splitPosition", "mergePositions")
+]
+
+SWAPR_ROUTER_ABI = [
+    {
+        "type": "function",
+        "name": "exactInputSingle",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "params",
+                "type": "tuple",
+                "components": [
+                    {"name": "tokenIn", "type": "address"},
+                    {"name": "tokenOut", "type": "address"},
+                    {"name": "recipient", "type": "address"},
+                    {"name": "deadline", "type": "uint256"},
+                    {"name": "amountIn", "type": "uint256"},
+                    {"name": "amountOutMinimum", "type": "uint256"},
+                    {"name": "limitSqrtPrice", "type": "uint160"},
+                ],
+            }
+        ],
+        "outputs": [{"name": "amountOut", "type": "uint256"}],
+    }
+]
+
+TOKEN = Web3.to_checksum_address("0x" + "11" * 20)
+SPENDER = Web3.to_checksum_address("0x" + "22" * 20)
+PROPOSAL = Web3.to_checksum_address("0x" + "33" * 20)
+COLLATERAL = Web3.to_checksum_address("0x" + "44" * 20)
+RECIPIENT = Web3.to_checksum_address("0x" + "55" * 20)
+AMOUNTS = (0, 1, 10**18, 2**255 + 12345, 2**256 - 1)
+
+
+def contract(abi):
+    return Web3().eth.contract(abi=abi)
+
+
+def hexdata(call):
+    return "0x" + call["data"].hex()
+
+
+class CalldataTests(unittest.TestCase):
+    def test_encode_approval(self):
+        erc20 = contract(ERC20_ABI)
+        for amount in AMOUNTS:
+            with self.subTest(amount=amount):
+                call = bundle.encode_approval(TOKEN, SPENDER, amount)
+                self.assertEqual(call["to"], TOKEN)
+                self.assertEqual(hexdata(call), erc20.encode_abi("approve", args=[SPENDER, amount]))
+
+    def test_encode_split_and_merge(self):
+        router = contract(ROUTER_ABI)
+        for amount in AMOUNTS:
+            with self.subTest(amount=amount):
+                self.assertEqual(
+                    hexdata(bundle.encode_split(SPENDER, PROPOSAL, COLLATERAL, amount)),
+                    router.encode_abi("splitPosition", args=[PROPOSAL, COLLATERAL, amount]),
+                )
+                self.assertEqual(
+                    hexdata(bundle.encode_merge(SPENDER, PROPOSAL, COLLATERAL, amount)),
+                    router.encode_abi("mergePositions", args=[PROPOSAL, COLLATERAL, amount]),
+                )
+
+    def test_encode_swapr_exact_in(self):
+        swapr = contract(SWAPR_ROUTER_ABI)
+        for deadline in (bundle._MAX_U256_INT, 1_700_000_000):
+            for amount in AMOUNTS:
+                with self.subTest(deadline=deadline, amount=amount):
+                    call = bundle.encode_swapr_exact_in(
+                        SPENDER, TOKEN, COLLATERAL, amount, amount // 2, RECIPIENT, deadline
+                    )
+                    params = (TOKEN, COLLATERAL, RECIPIENT, deadline, amount, amount // 2, 0)
+                    self.assertEqual(hexdata(call), swapr.encode_abi("exactInputSingle", args=[params]))
+
+    def test_default_deadline_is_max_uint(self):
+        call = bundle.encode_swapr_exact_in(SPENDER, TOKEN, COLLATERAL, 1, 0, RECIPIENT)
+        params = (TOKEN, COLLATERAL, RECIPIENT, 2**256 - 1, 1, 0, 0)
+        self.assertEqual(hexdata(call), contract(SWAPR_ROUTER_ABI).encode_abi("exactInputSingle", args=[params]))
+
+
+if __name__ == "__main__":
+    unittest.main()
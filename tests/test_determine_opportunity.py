@@ -0,0 +1,81 @@
+import contextlib
+import io
+import os
+import random
+import sys
+import unittest
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from arbitrage_commands.arbitrage_bot import ArbitrageBot, _to_q64
+
+
+def float_opportunity(prices, tolerance):
+    """The float-based determine_opportunity() the Q64 version replaced."""
+    ideal = prices["pred_yes_price"] * prices["yes_price"] + (1.0 - prices["pred_yes_price"]) * prices["no_price"]
+    if abs(prices["bal_price"] - ideal) < tolerance:
+        return None, None
+    flow = "buy" if prices["bal_price"] > ideal else "sell"
+    cheaper = "yes" if prices["yes_price"] < prices["no_price"] else "no"
+    return flow, cheaper
+
+
+def make_prices(yes, pred_yes, no, bal):
+    """Price dict shaped like ArbitrageBot.fetch_prices() output."""
+    yes, pred_yes, no, bal = (Decimal(v) for v in (yes, pred_yes, no, bal))
+    return {
+        "yes_price": float(yes),
+        "pred_yes_price": float(pred_yes),
+        "no_price": float(no),
+        "bal_price": float(bal),
+        "yes_q64": _to_q64(yes),
+        "pred_yes_q64": _to_q64(pred_yes),
+        "no_q64": _to_q64(no),
+        "bal_q64": _to_q64(bal),
+    }
+
+
+class DetermineOpportunityTests(unittest.TestCase):
+    def setUp(self):
+        # Only the pure price logic is under test: skip __init__ (env, RPC, account)
+        self.bot = ArbitrageBot.__new__(ArbitrageBot)
+        self.bot.verbose = True
+
+    def determine(self, prices, tolerance):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.bot.determine_opportunity(prices, tolerance)
+
+    def test_matches_float_result(self):
+        rng = random.Random(64)
+        checked = 0
+        for _ in range(5000):
+            yes = f"{rng.uniform(50, 200):.12f}"
+            no = f"{rng.uniform(50, 200):.12f}"
+            pred_yes = f"{rng.uniform(0, 1):.12f}"
+            bal = f"{rng.uniform(50, 200):.12f}"
+            tolerance = rng.choice([0.01, 0.04, 0.5, 5.0])
+            prices = make_prices(yes, pred_yes, no, bal)
+
+            ideal = prices["pred_yes_price"] * prices["yes_price"] + \
+                (1.0 - prices["pred_yes_price"]) * prices["no_price"]
+            if abs(abs(prices["bal_price"] - ideal) - tolerance) < 1e-9:
+                continue  # float rounding decides these; Q64 is the more exact one
+            checked += 1
+            with self.subTest(prices=prices, tolerance=tolerance):
+                self.assertEqual(self.determine(prices, tolerance), float_opportunity(prices, tolerance))
+        self.assertGreater(checked, 4900)
+
+    def test_ideal_price_matches_float(self):
+        prices = make_prices("120.5", "0.37", "95.25", "100")
+        self.assertAlmostEqual(self.bot.calculate_ideal_price(prices), 0.37 * 120.5 + 0.63 * 95.25, places=9)
+
+    def test_quiet_mode_returns_no_opportunity_below_tolerance(self):
+        self.bot.verbose = False
+        prices = make_prices("100", "0.5", "100", "100.01")
+        self.assertEqual(self.determine(prices, 0.04), (None, None))
+        self.assertEqual(self.determine(prices, 0.001), ("buy", "no"))
+
+
+if __name__ == "__main__":
+    unittest.main()
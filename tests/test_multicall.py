@@ -0,0 +1,153 @@
+import os
+import sys
+import unittest
+
+from eth_abi import decode, encode
+from web3 import Web3
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from helpers.multicall import MULTICALL3_ADDRESS, aggregate3, fn_call
+
+MULTICALL3_ABI = [
+    {
+        "type": "function",
+        "name": "aggregate3",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            }
+        ],
+    }
+]
+
+POOL_ABI = [
+    {
+        "type": "function",
+        "name": "token0",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "address"}],
+    },
+    {
+        "type": "function",
+        "name": "balanceOf",
+        "stateMutability": "view",
+        "inputs": [{"name": "owner", "type": "address"}],
+        "outputs": [{"name": "", "type": "uint256"}],
+    },
+    {
+        "type": "function",
+        "name": "getPoolTokenInfo",
+        "stateMutability": "view",
+        "inputs": [{"name": "pool", "type": "address"}],
+        "outputs": [
+            {"name": "tokens", "type": "address[]"},
+            {"name": "balancesRaw", "type": "uint256[]"},
+        ],
+    },
+]
+
+POOL = "0x" + "ab" * 20
+HOLDER = "0x" + "cd" * 20
+TOKEN = "0x" + "ef" * 20
+
+
+class FakeEth:
+    """eth.call stub that answers aggregate3 from a {calldata: return_data} table.
+
+    Calldata missing from the table reverts (success=False).
+    """
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.requests = []
+
+    def call(self, tx, block_identifier="latest"):
+        self.requests.append((tx, block_identifier))
+        (calls,) = decode(["(address,bool,bytes)[]"], tx["data"][4:])
+        results = []
+        for _target, _allow_failure, data in calls:
+            ret = self.answers.get(bytes(data))
+            results.append((ret is not None, ret or b""))
+        return encode(["(bool,bytes)[]"], [results])
+
+
+class FakeWeb3:
+    def __init__(self, answers):
+        self.eth = FakeEth(answers)
+
+
+class MulticallTests(unittest.TestCase):
+    def test_fn_call_matches_web3_encoding(self):
+        contract = Web3().eth.contract(address=Web3.to_checksum_address(POOL), abi=POOL_ABI)
+        target, data, _ = fn_call(POOL, POOL_ABI, "balanceOf", Web3.to_checksum_address(HOLDER))
+        self.assertEqual(target, Web3.to_checksum_address(POOL))
+        self.assertEqual(
+            "0x" + data.hex(),
+            contract.encode_abi("balanceOf", args=[Web3.to_checksum_address(HOLDER)]),
+        )
+
+    def test_fn_call_decoder_mirrors_call(self):
+        _, _, decode_token = fn_call(POOL, POOL_ABI, "token0")
+        self.assertEqual(decode_token(encode(["address"], [TOKEN])), Web3.to_checksum_address(TOKEN))
+
+        _, _, decode_info = fn_call(POOL, POOL_ABI, "getPoolTokenInfo", Web3.to_checksum_address(POOL))
+        tokens, balances = decode_info(encode(["address[]", "uint256[]"], [[TOKEN, HOLDER], [1, 2]]))
+        self.assertEqual(tokens, [Web3.to_checksum_address(TOKEN), Web3.to_checksum_address(HOLDER)])
+        self.assertEqual(list(balances), [1, 2])
+
+    def test_aggregate3_calldata_matches_web3_encoding(self):
+        calls = [
+            fn_call(POOL, POOL_ABI, "token0"),
+            fn_call(TOKEN, POOL_ABI, "balanceOf", Web3.to_checksum_address(HOLDER)),
+        ]
+        w3 = FakeWeb3({data: encode(["uint256"], [0]) for _, data, _ in calls})
+        aggregate3(w3, calls, allow_failure=True, block_identifier=123)
+
+        (tx, block), = w3.eth.requests
+        self.assertEqual(tx["to"], MULTICALL3_ADDRESS)
+        self.assertEqual(block, 123)
+        multicall = Web3().eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+        expected = multicall.encode_abi(
+            "aggregate3", args=[[(target, True, data) for target, data, _ in calls]]
+        )
+        self.assertEqual("0x" + tx["data"].hex(), expected)
+
+    def test_aggregate3_decodes_results_in_order(self):
+        token0 = fn_call(POOL, POOL_ABI, "token0")
+        balance = fn_call(TOKEN, POOL_ABI, "balanceOf", Web3.to_checksum_address(HOLDER))
+        reverts = fn_call(TOKEN, POOL_ABI, "balanceOf", Web3.to_checksum_address(POOL))
+        w3 = FakeWeb3({
+            token0[1]: encode(["address"], [TOKEN]),
+            balance[1]: encode(["uint256"], [10**18]),
+        })
+
+        results = aggregate3(w3, [token0, balance, reverts], allow_failure=True)
+        self.assertEqual(results, [Web3.to_checksum_address(TOKEN), 10**18, None])
+
+    def test_aggregate3_empty_makes_no_call(self):
+        w3 = FakeWeb3({})
+        self.assertEqual(aggregate3(w3, []), [])
+        self.assertEqual(w3.eth.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
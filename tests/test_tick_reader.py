@@ -0,0 +1,259 @@
+import importlib.util
+import json
+import os
+import random
+import sys
+import unittest
+from unittest import mock
+
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3 import Web3
+
+_SPEC = importlib.util.spec_from_file_location(
+    "tick_reader", os.path.join(os.path.dirname(__file__), "..", "scripts", "tick_reader.py")
+)
+tick_reader = importlib.util.module_from_spec(_SPEC)
+# Registered before executing so numba's on-disk cache (cache=True) can import it back
+sys.modules["tick_reader"] = tick_reader
+_SPEC.loader.exec_module(tick_reader)
+
+TICK_SPACINGS = (1, 10, 60, 200)
+
+
+def reference_ticks(word_pos, word, tick_spacing, low=0, high=255):
+    """Bit-by-bit expansion of one tickTable word, the spec the fast paths must match."""
+    base = word_pos * 256
+    return [
+        base + b
+        for b in range(low, high + 1)
+        if (word >> b) & 1
+        and (base + b) % tick_spacing == 0
+        and tick_reader.MIN_TICK <= base + b <= tick_reader.MAX_TICK
+    ]
+
+
+def sample_words(rng, n):
+    edge = [0, (1 << 256) - 1, 1, 1 << 63, 1 << 64, 1 << 255, (1 << 64) - 1]
+    return edge + [rng.getrandbits(256) for _ in range(n - len(edge))]
+
+
+class BitmapExpansionTests(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(7702)
+
+    def backends(self):
+        """(name, patches) for every expansion path available in this environment."""
+        out = []
+        if tick_reader._expand_rows is not None:
+            out.append(("numba", {"np": tick_reader.np}))
+        if tick_reader.np is not None:
+            out.append(("numpy", {"_expand_bits": None, "_expand_rows": None}))
+        out.append(("python", {"np": None, "_expand_bits": None, "_expand_rows": None}))
+        return out
+
+    def test_word_ticks_matches_reference(self):
+        words = sample_words(self.rng, 40)
+        for name, patches in self.backends():
+            with mock.patch.multiple(tick_reader, **patches):
+                for tick_spacing in TICK_SPACINGS:
+                    for word in words:
+                        word_pos = self.rng.randint(-32768, 32767)
+                        low, high = sorted(self.rng.randint(0, 255) for _ in range(2))
+                        with self.subTest(backend=name, tick_spacing=tick_spacing, word_pos=word_pos):
+                            self.assertEqual(
+                                tick_reader._word_ticks(word_pos, word, tick_spacing),
+                                reference_ticks(word_pos, word, tick_spacing),
+                            )
+                            self.assertEqual(
+                                tick_reader._word_ticks(word_pos, word, tick_spacing, low, high),
+                                reference_ticks(word_pos, word, tick_spacing, low, high),
+                            )
+
+    def test_words_ticks_both_directions(self):
+        for name, patches in self.backends():
+            with mock.patch.multiple(tick_reader, **patches):
+                for tick_spacing in TICK_SPACINGS:
+                    for start in (-32768, -3, 0, 32737):
+                        words = sample_words(self.rng, 31)
+                        positions = list(range(start, start + len(words)))
+                        low, high = sorted(self.rng.randint(0, 255) for _ in range(2))
+                        expected = [reference_ticks(positions[0], words[0], tick_spacing, low, high)]
+                        expected += [
+                            reference_ticks(wp, word, tick_spacing)
+                            for wp, word in zip(positions[1:], words[1:])
+                        ]
+                        with self.subTest(backend=name, tick_spacing=tick_spacing, start=start):
+                            self.assertEqual(
+                                tick_reader._words_ticks(positions, words, tick_spacing, low, high),
+                                expected,
+                            )
+                            self.assertEqual(
+                                tick_reader._words_ticks(
+                                    positions, words, tick_spacing, low, high, descending=True
+                                ),
+                                [ticks[::-1] for ticks in expected],
+                            )
+
+    def test_word_bits_matches_reference(self):
+        for name, patches in self.backends():
+            with mock.patch.multiple(tick_reader, **patches):
+                for word in sample_words(self.rng, 20):
+                    low, high = sorted(self.rng.randint(0, 255) for _ in range(2))
+                    with self.subTest(backend=name, word=hex(word)):
+                        self.assertEqual(
+                            tick_reader._word_bits(word, low, high),
+                            [b for b in range(low, high + 1) if (word >> b) & 1],
+                        )
+
+
+class TickCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.conn = tick_reader.open_tick_cache(":memory:")
+        self.addCleanup(self.conn.close)
+
+    def test_round_trip(self):
+        words = {wp: (wp * 0x9E3779B97F4A7C15) % (1 << 256) for wp in range(-600, 600)}
+        words[0] = (1 << 256) - 1
+        tick_reader.store_cached_words(self.conn, "pool", 10, words)
+
+        # More positions than one IN (...) chunk, some never stored
+        positions = list(range(-700, 700))
+        self.assertEqual(tick_reader.load_cached_words(self.conn, "pool", 10, positions), words)
+
+    def test_keyed_by_pool_and_bucket(self):
+        tick_reader.store_cached_words(self.conn, "pool", 10, {1: 5})
+        tick_reader.store_cached_words(self.conn, "pool", 11, {1: 6})
+        tick_reader.store_cached_words(self.conn, "other", 10, {1: 7})
+        tick_reader.store_cached_words(self.conn, "pool", 10, {1: 8})
+
+        self.assertEqual(tick_reader.load_cached_words(self.conn, "pool", 10, [1]), {1: 8})
+        self.assertEqual(tick_reader.load_cached_words(self.conn, "pool", 11, [1]), {1: 6})
+        self.assertEqual(tick_reader.load_cached_words(self.conn, "other", 10, [1]), {1: 7})
+        self.assertEqual(tick_reader.load_cached_words(self.conn, "pool", 12, [1]), {})
+
+
+class DumpsJsonTests(unittest.TestCase):
+    def test_wide_ints_are_strings_with_and_without_orjson(self):
+        obj = {
+            "results": [
+                {"tick": -600, "liquidityTotal": 1 << 100, "liquidityDelta": -(1 << 90), "initialized": True},
+                {"tick": 600, "liquidityTotal": (1 << 64) - 1, "liquidityDelta": -(1 << 63), "initialized": False},
+            ],
+            "bitmap_stats": None,
+        }
+        expected = {
+            "results": [
+                {"tick": -600, "liquidityTotal": str(1 << 100), "liquidityDelta": str(-(1 << 90)), "initialized": True},
+                {"tick": 600, "liquidityTotal": (1 << 64) - 1, "liquidityDelta": -(1 << 63), "initialized": False},
+            ],
+            "bitmap_stats": None,
+        }
+        outputs = [tick_reader.dumps_json(obj)]
+        with mock.patch.object(tick_reader, "orjson", None):
+            outputs.append(tick_reader.dumps_json(obj))
+        for out in outputs:
+            self.assertEqual(json.loads(out), expected)
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.body
+
+
+class FakeSession:
+    def __init__(self, body):
+        self.body = body
+        self.posted = None
+
+    def post(self, url, json=None, timeout=None):
+        self.posted = (url, json)
+        return FakeResponse(self.body)
+
+
+class RpcBatchCallTests(unittest.TestCase):
+    def test_results_follow_request_ids(self):
+        session = FakeSession([
+            {"jsonrpc": "2.0", "id": 2, "result": "0x03"},
+            {"jsonrpc": "2.0", "id": 0, "result": "0x01"},
+            {"jsonrpc": "2.0", "id": 1, "error": {"code": 3, "message": "execution reverted"}},
+        ])
+        out = tick_reader.rpc_batch_call(session, "http://rpc", "0xpool", [b"\xaa", b"\xbb", b"\xcc"], block="0x10")
+
+        self.assertEqual(out, [b"\x01", None, b"\x03"])
+        url, payload = session.posted
+        self.assertEqual(url, "http://rpc")
+        self.assertEqual([req["id"] for req in payload], [0, 1, 2])
+        self.assertEqual(payload[1]["method"], "eth_call")
+        self.assertEqual(payload[1]["params"], [{"to": "0xpool", "data": "0xbb"}, "0x10"])
+
+    def test_batch_rejected_as_a_whole(self):
+        session = FakeSession({"jsonrpc": "2.0", "id": None, "error": {"code": -32600, "message": "batch"}})
+        with self.assertRaises(ValueError):
+            tick_reader.rpc_batch_call(session, "http://rpc", "0xpool", [b"\xaa"])
+
+
+class LogTopicFilterTests(unittest.TestCase):
+    """The single topic0 OR-filter: one topic per event, and logs dispatch back to their event."""
+
+    POOL = Web3.to_checksum_address("0x" + "ab" * 20)
+    SIGNATURES = {
+        "Mint": "Mint(address,address,int24,int24,uint128,uint256,uint256)",
+        "Burn": "Burn(address,int24,int24,uint128,uint256,uint256)",
+        "Initialize": "Initialize(uint160,int24)",
+    }
+
+    def by_topic(self, abi):
+        contract = Web3().eth.contract(address=self.POOL, abi=abi)
+        return {
+            tick_reader._event_topic(getattr(contract.events, name)()): (name, getattr(contract.events, name)())
+            for name in self.SIGNATURES
+        }
+
+    def test_event_topics_are_signature_hashes(self):
+        for abi in (tick_reader.ABI_MIN, tick_reader.full_abi()):
+            by_topic = self.by_topic(abi)
+            self.assertEqual(
+                {name: topic for topic, (name, _) in by_topic.items()},
+                {name: "0x" + bytes(Web3.keccak(text=sig)).hex() for name, sig in self.SIGNATURES.items()},
+            )
+
+    def test_topic_key_normalizes_every_form(self):
+        topic = Web3.keccak(text=self.SIGNATURES["Burn"])
+        key = "0x" + bytes(topic).hex()
+        for form in (HexBytes(topic), bytes(topic), bytearray(topic), key.upper().replace("0X", "0x"), key[2:]):
+            with self.subTest(form=form):
+                self.assertEqual(tick_reader._topic_key(form), key)
+
+    def test_log_dispatches_to_its_event(self):
+        by_topic = self.by_topic(tick_reader.ABI_MIN)
+        log = {
+            "address": self.POOL,
+            "topics": [
+                HexBytes(Web3.keccak(text=self.SIGNATURES["Burn"])),
+                HexBytes(encode(["address"], ["0x" + "cd" * 20])),
+                HexBytes(encode(["int24"], [-600])),
+                HexBytes(encode(["int24"], [600])),
+            ],
+            "data": HexBytes(encode(["uint128", "uint256", "uint256"], [5, 6, 7])),
+            "blockNumber": 1,
+            "blockHash": HexBytes(b"\x01" * 32),
+            "transactionHash": HexBytes(b"\x02" * 32),
+            "transactionIndex": 0,
+            "logIndex": 0,
+            "removed": False,
+        }
+        name, evt = by_topic[tick_reader._topic_key(log["topics"][0])]
+        self.assertEqual(name, "Burn")
+        args = evt.process_log(log)["args"]
+        self.assertEqual((args["bottomTick"], args["topTick"], args["liquidityAmount"]), (-600, 600, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()